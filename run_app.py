@@ -7,6 +7,8 @@ Processes FactSet Excel reports to generate AI-written commentary
 for portfolio contributors and detractors.
 """
 
+import logging
+import multiprocessing
 import sys
 from pathlib import Path
 
@@ -16,4 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 from src.gui import main
 
 if __name__ == "__main__":
+    # Required for the spawned parser workers in frozen (PyInstaller) builds.
+    multiprocessing.freeze_support()
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
     main()
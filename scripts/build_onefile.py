@@ -1,21 +1,90 @@
 #!/usr/bin/env python3
-"""Build unsigned onefile ContribNote artifacts for macOS and Windows."""
+"""Build unsigned ContribNote artifacts (onedir or onefile) for macOS and Windows."""
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import re
 import shutil
 import subprocess
 import sys
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 DEFAULT_APP_NAME = "ContribNote"
 DEFAULT_ENTRYPOINT = "run_app.py"
 DEFAULT_VERSION = "0.0.0"
+VERSION_RE = re.compile(r'__version__\s*=\s*["\']([^"\']+)["\']')
 SUPPORTED_TARGETS = ("auto", "macos", "windows")
+MIN_PYTHON = (3, 11)
+SUPPORTED_BUNDLE_MODES = ("onedir", "onefile")
+DEFAULT_BUNDLE_MODE = "onedir"
+# Zip presets map to (compression method, compresslevel).
+ZIP_COMPRESSION_PRESETS = {
+    "store": (zipfile.ZIP_STORED, None),
+    "fast": (zipfile.ZIP_DEFLATED, 1),
+    "default": (zipfile.ZIP_DEFLATED, 6),
+    "max": (zipfile.ZIP_DEFLATED, 9),
+}
+DEFAULT_ZIP_COMPRESSION = "fast"
+ZIP_READ_WORKERS = 8
+ZIP_READ_BATCH_SIZE = 64
+DEPS_FINGERPRINT_FILE = ".contribnote-deps.sha256"
+PIP_CACHE_DIR = ".pip-cache"
+
+# Generated PyInstaller spec. Binaries and bundled data are stored uncompressed
+# in the onefile archive (cdict) and UPX is disabled everywhere, trading a
+# larger artifact for launches that skip the decompression step.
+SPEC_TEMPLATE = """\
+# -*- mode: python ; coding: utf-8 -*-
+# Generated by scripts/build_onefile.py; edits are overwritten on each build.
+import sys
+
+UNCOMPRESSED = {{
+    "EXTENSION": False,
+    "DATA": False,
+    "BINARY": False,
+    "EXECUTABLE": False,
+    "PYSOURCE": False,
+    "PYMODULE": False,
+    "SPLASH": False,
+    "PYZ": False,
+}}
+
+a = Analysis([{entrypoint!r}], pathex=[{repo_root!r}], noarchive=False)
+pyz = PYZ(a.pure)
+
+if {onefile!r}:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name={app_name!r},
+        upx=False,
+        console=False,
+        cdict=UNCOMPRESSED,
+    )
+    bundle_input = exe
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name={app_name!r},
+        upx=False,
+        console=False,
+    )
+    bundle_input = COLLECT(exe, a.binaries, a.datas, upx=False, name={app_name!r})
+
+if sys.platform == "darwin":
+    app = BUNDLE(bundle_input, name={bundle_name!r})
+"""
 
 
 def phase(message: str) -> None:
@@ -42,6 +111,17 @@ def run_command(command: list[str], cwd: Path | None = None) -> None:
         ) from exc
 
 
+def ensure_supported_python() -> None:
+    """Require the minimum Python used for the bootstrap venv and the app."""
+    if sys.version_info < MIN_PYTHON:
+        required = ".".join(str(part) for part in MIN_PYTHON)
+        raise RuntimeError(
+            f"Python {required}+ is required (running {sys.version.split()[0]}). "
+            "The bootstrap venv is created from this interpreter, and newer "
+            "interpreters parse and build noticeably faster."
+        )
+
+
 def detect_host_target() -> str:
     """Map the host platform to a supported build target."""
     if sys.platform == "darwin":
@@ -86,12 +166,46 @@ def ensure_venv_exists(repo_root: Path, venv_path: Path) -> None:
     run_command([sys.executable, "-m", "venv", str(venv_path)], cwd=repo_root)
 
 
+def read_venv_python_version(venv_python: Path) -> str:
+    """Return the full version string of the venv interpreter."""
+    try:
+        completed = subprocess.run(
+            [str(venv_python), "-c", "import sys; print(sys.version)"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (OSError, subprocess.CalledProcessError) as exc:
+        raise RuntimeError(f"Unable to query venv Python version: {venv_python}") from exc
+    return completed.stdout.strip()
+
+
+def compute_deps_fingerprint(
+    requirement_files: list[Path],
+    python_version: str,
+    build_only: bool,
+) -> str:
+    """Hash requirement files, interpreter version, and install mode."""
+    digest = hashlib.sha256()
+    for path in requirement_files:
+        digest.update(path.name.encode("utf-8"))
+        digest.update(path.read_bytes())
+    digest.update(python_version.encode("utf-8"))
+    digest.update(b"build-only" if build_only else b"full")
+    return digest.hexdigest()
+
+
 def install_dependencies(
     repo_root: Path,
+    venv_path: Path,
     venv_python: Path,
     build_only: bool,
 ) -> None:
-    """Install runtime and build dependencies into the venv."""
+    """Install runtime and build dependencies into the venv.
+
+    Skips pip entirely when the requirement files, venv interpreter, and
+    install mode match the fingerprint recorded by the last successful install.
+    """
     requirements_txt = repo_root / "requirements.txt"
     requirements_build_txt = repo_root / "requirements-build.txt"
 
@@ -99,20 +213,41 @@ def install_dependencies(
     if not build_only:
         assert_file_exists(requirements_txt, "runtime requirements file")
 
+    requirement_files = [requirements_build_txt] if build_only else [requirements_txt, requirements_build_txt]
+    fingerprint = compute_deps_fingerprint(
+        requirement_files,
+        read_venv_python_version(venv_python),
+        build_only,
+    )
+    fingerprint_file = venv_path / DEPS_FINGERPRINT_FILE
+    if fingerprint_file.exists() and fingerprint_file.read_text(encoding="utf-8").strip() == fingerprint:
+        phase("Dependencies unchanged; skipping install")
+        return
+
+    pip_install = [
+        str(venv_python),
+        "-m",
+        "pip",
+        "install",
+        "--cache-dir",
+        str(repo_root / PIP_CACHE_DIR),
+    ]
+
     phase("Installing dependencies into virtual environment")
     run_command(
-        [str(venv_python), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"],
+        [*pip_install, "--upgrade", "pip", "setuptools", "wheel"],
         cwd=repo_root,
     )
     if not build_only:
         run_command(
-            [str(venv_python), "-m", "pip", "install", "-r", str(requirements_txt)],
+            [*pip_install, "-r", str(requirements_txt)],
             cwd=repo_root,
         )
     run_command(
-        [str(venv_python), "-m", "pip", "install", "-r", str(requirements_build_txt)],
+        [*pip_install, "-r", str(requirements_build_txt)],
         cwd=repo_root,
     )
+    fingerprint_file.write_text(fingerprint + "\n", encoding="utf-8")
 
 
 def verify_pyinstaller_available(venv_python: Path, repo_root: Path) -> None:
@@ -143,8 +278,14 @@ def clean_outputs(repo_root: Path, app_name: str) -> None:
         dist_dir / f"{app_name}.exe",
         dist_dir / f"{app_name}.app",
     ]
-    candidates.extend(dist_dir.glob(f"{app_name}-windows-*.zip"))
-    candidates.extend(dist_dir.glob(f"{app_name}-macos-*.zip"))
+    if dist_dir.exists():
+        # One directory listing covers both platform zip prefixes.
+        zip_prefixes = (f"{app_name}-windows-", f"{app_name}-macos-")
+        candidates.extend(
+            path
+            for path in dist_dir.iterdir()
+            if path.suffix == ".zip" and path.name.startswith(zip_prefixes)
+        )
 
     for path in candidates:
         if not path.exists():
@@ -156,14 +297,37 @@ def clean_outputs(repo_root: Path, app_name: str) -> None:
             path.unlink()
 
 
+def write_spec_file(
+    spec_dir: Path,
+    repo_root: Path,
+    app_name: str,
+    entrypoint: Path,
+    bundle_mode: str,
+) -> Path:
+    """Write the generated PyInstaller spec and return its path."""
+    spec_path = spec_dir / f"{app_name}.spec"
+    spec_path.write_text(
+        SPEC_TEMPLATE.format(
+            entrypoint=str(entrypoint),
+            repo_root=str(repo_root),
+            onefile=bundle_mode == "onefile",
+            app_name=app_name,
+            bundle_name=f"{app_name}.app",
+        ),
+        encoding="utf-8",
+    )
+    return spec_path
+
+
 def build_artifact(
     repo_root: Path,
     venv_python: Path,
     app_name: str,
     entrypoint: Path,
     clean: bool,
+    bundle_mode: str = DEFAULT_BUNDLE_MODE,
 ) -> None:
-    """Run PyInstaller onefile build."""
+    """Run PyInstaller build in onedir or onefile mode."""
     dist_dir = repo_root / "dist"
     work_dir = repo_root / "build" / "pyinstaller"
     spec_dir = repo_root / "build" / "spec"
@@ -171,33 +335,45 @@ def build_artifact(
     dist_dir.mkdir(parents=True, exist_ok=True)
     work_dir.mkdir(parents=True, exist_ok=True)
 
-    phase("Building onefile artifact with PyInstaller")
+    spec_path = write_spec_file(
+        spec_dir=spec_dir,
+        repo_root=repo_root,
+        app_name=app_name,
+        entrypoint=entrypoint,
+        bundle_mode=bundle_mode,
+    )
+
+    phase(f"Building {bundle_mode} artifact with PyInstaller")
     command = [
         str(venv_python),
         "-m",
         "PyInstaller",
         "--noconfirm",
-        "--onefile",
-        "--windowed",
-        "--name",
-        app_name,
         "--distpath",
         str(dist_dir),
         "--workpath",
         str(work_dir),
-        "--specpath",
-        str(spec_dir),
     ]
     if clean:
         command.append("--clean")
-    command.append(str(entrypoint))
+    command.append(str(spec_path))
     run_command(command, cwd=repo_root)
 
 
-def detect_artifact(repo_root: Path, app_name: str, target: str) -> Path:
-    """Return expected raw artifact for the target platform."""
+def detect_artifact(
+    repo_root: Path,
+    app_name: str,
+    target: str,
+    bundle_mode: str = DEFAULT_BUNDLE_MODE,
+) -> Path:
+    """Return expected raw artifact for the target platform and bundle mode."""
     dist_dir = repo_root / "dist"
-    expected = dist_dir / (f"{app_name}.exe" if target == "windows" else f"{app_name}.app")
+    if target != "windows":
+        expected = dist_dir / f"{app_name}.app"
+    elif bundle_mode == "onedir":
+        expected = dist_dir / app_name / f"{app_name}.exe"
+    else:
+        expected = dist_dir / f"{app_name}.exe"
     if expected.exists():
         return expected
 
@@ -215,44 +391,77 @@ def read_version(repo_root: Path) -> str:
         return DEFAULT_VERSION
 
     try:
-        content = init_file.read_text(encoding="utf-8")
+        with init_file.open(encoding="utf-8") as handle:
+            for line in handle:
+                match = VERSION_RE.search(line)
+                if match:
+                    return match.group(1).strip()
     except OSError:
         return DEFAULT_VERSION
+    return DEFAULT_VERSION
 
-    match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-    return match.group(1).strip() if match else DEFAULT_VERSION
 
+def write_zip(
+    artifact_path: Path,
+    zip_path: Path,
+    compression: str = DEFAULT_ZIP_COMPRESSION,
+) -> None:
+    """Create a zip archive containing the built artifact.
 
-def write_zip(artifact_path: Path, zip_path: Path) -> None:
-    """Create a zip archive containing the built artifact."""
+    Directory artifacts (onedir folders and .app bundles) keep their top-level
+    folder name inside the archive. ``compression`` selects one of
+    ``ZIP_COMPRESSION_PRESETS``.
+    """
     if zip_path.exists():
         zip_path.unlink()
 
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+    method, level = ZIP_COMPRESSION_PRESETS[compression]
+    with zipfile.ZipFile(zip_path, "w", compression=method, compresslevel=level) as archive:
         if artifact_path.is_file():
             archive.write(artifact_path, arcname=artifact_path.name)
             return
-        for child in sorted(artifact_path.rglob("*")):
-            if child.is_dir():
-                continue
-            archive.write(child, arcname=str(child.relative_to(artifact_path.parent)))
+        children = sorted(child for child in artifact_path.rglob("*") if not child.is_dir())
+        # Read files on a thread pool in bounded batches; writes stay in sorted
+        # order so archives are deterministic. ZipInfo.from_file keeps each
+        # file's mode (executable bits in .app bundles) and timestamp.
+        with ThreadPoolExecutor(max_workers=ZIP_READ_WORKERS) as executor:
+            for start in range(0, len(children), ZIP_READ_BATCH_SIZE):
+                batch = children[start:start + ZIP_READ_BATCH_SIZE]
+                for child, data in zip(batch, executor.map(Path.read_bytes, batch)):
+                    info = zipfile.ZipInfo.from_file(
+                        child, arcname=str(child.relative_to(artifact_path.parent))
+                    )
+                    archive.writestr(info, data, compress_type=method, compresslevel=level)
 
 
 def parse_args() -> argparse.Namespace:
     """Parse CLI arguments for build automation."""
     parser = argparse.ArgumentParser(
         description=(
-            "Build unsigned onefile ContribNote artifacts for macOS and Windows "
-            "using a repo-local virtual environment."
+            "Build unsigned ContribNote artifacts for macOS and Windows "
+            "using a repo-local virtual environment. Requires Python 3.11+; "
+            "the venv is created from the interpreter running this script."
         )
     )
     parser.add_argument("--target", default="auto", choices=SUPPORTED_TARGETS)
     parser.add_argument("--app-name", default=DEFAULT_APP_NAME)
     parser.add_argument("--entrypoint", default=DEFAULT_ENTRYPOINT)
+    parser.add_argument(
+        "--bundle-mode",
+        default=DEFAULT_BUNDLE_MODE,
+        choices=SUPPORTED_BUNDLE_MODES,
+        help="onedir avoids per-launch self-extraction; onefile yields a single executable",
+    )
     parser.add_argument("--venv-path", default=".venv")
     parser.add_argument("--clean", action="store_true")
     parser.add_argument("--build-only", action="store_true")
     parser.add_argument("--no-zip", action="store_true")
+    parser.add_argument(
+        "--zip-compression",
+        default=DEFAULT_ZIP_COMPRESSION,
+        choices=tuple(ZIP_COMPRESSION_PRESETS),
+        help="store (no compression), fast (deflate 1), default (deflate 6), max (deflate 9)",
+    )
     parser.add_argument("--no-bootstrap", action="store_true")
     return parser.parse_args()
 
@@ -260,6 +469,7 @@ def parse_args() -> argparse.Namespace:
 def main() -> int:
     """Program entrypoint."""
     args = parse_args()
+    ensure_supported_python()
     repo_root = resolve_repo_root()
     host_target = detect_host_target()
     target = resolve_target(args.target, host_target)
@@ -271,6 +481,7 @@ def main() -> int:
     print(f"Repository root: {repo_root}")
     print(f"Host target: {host_target}")
     print(f"Build target: {target}")
+    print(f"Bundle mode: {args.bundle_mode}")
     print(f"Virtual environment: {venv_path}")
 
     assert_file_exists(entrypoint, "entrypoint file")
@@ -295,7 +506,12 @@ def main() -> int:
         )
 
     if not args.no_bootstrap:
-        install_dependencies(repo_root=repo_root, venv_python=venv_python, build_only=args.build_only)
+        install_dependencies(
+            repo_root=repo_root,
+            venv_path=venv_path,
+            venv_python=venv_python,
+            build_only=args.build_only,
+        )
 
     phase("Verifying PyInstaller availability")
     verify_pyinstaller_available(venv_python=venv_python, repo_root=repo_root)
@@ -306,16 +522,28 @@ def main() -> int:
         app_name=args.app_name,
         entrypoint=entrypoint,
         clean=args.clean,
+        bundle_mode=args.bundle_mode,
     )
 
-    raw_artifact = detect_artifact(repo_root=repo_root, app_name=args.app_name, target=target)
+    raw_artifact = detect_artifact(
+        repo_root=repo_root,
+        app_name=args.app_name,
+        target=target,
+        bundle_mode=args.bundle_mode,
+    )
     version = read_version(repo_root)
     zip_artifact: Path | None = None
 
     if not args.no_zip:
         phase("Packaging artifact into zip")
         zip_artifact = repo_root / "dist" / f"{args.app_name}-{target}-{version}.zip"
-        write_zip(raw_artifact, zip_artifact)
+        # Windows onedir builds ship the whole folder next to the executable.
+        package_root = (
+            raw_artifact.parent
+            if target == "windows" and args.bundle_mode == "onedir"
+            else raw_artifact
+        )
+        write_zip(package_root, zip_artifact, compression=args.zip_compression)
 
     phase("Build complete")
     print(f"Raw artifact: {raw_artifact.resolve()}")
@@ -7,16 +7,59 @@ Reads FactSet Excel files and extracts portfolio data.
 - Data starts: row 10
 - Period string: row 6
 - End marker: first blank Ticker cell
+
+Workbooks are read with python-calamine when it is installed, otherwise with
+openpyxl in read-only mode; either way rows are streamed as value sequences.
+Attribution outline levels are exposed by neither reader, so they are read
+directly from the sheet XML.
 """
 
+import multiprocessing
+import os
+import sys
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional, Sequence
+from xml.etree import ElementTree
 
-import openpyxl
+try:
+    from python_calamine import CalamineWorkbook  # type: ignore
 
+    _CALAMINE_AVAILABLE = True
+except Exception:  # pragma: no cover - environment dependent
+    CalamineWorkbook = None
+    _CALAMINE_AVAILABLE = False
 
-@dataclass
+# Reads a sheet's rows as value sequences starting at a 1-based row number
+RowReader = Callable[[str, int], Iterator[Sequence[object]]]
+
+
+# GICS markers FactSet uses for cash and fee rows
+CASH_OR_FEE_GICS = frozenset({"NA", "—", "--"})
+
+
+def is_cash_or_fee_gics(gics: Optional[str]) -> bool:
+    """Check if a GICS value marks a cash or fee row (missing, 'NA', or dashes)."""
+    return gics is None or gics in CASH_OR_FEE_GICS
+
+
+# Lower-cased row 7 header text -> canonical column key
+_HEADER_MAP = {
+    "ticker": "Ticker",
+    "security name": "Security Name",
+    "port. ending weight": "Port. Ending Weight",
+    "contribution to return": "Contribution To Return",
+    "gics": "GICS",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class SecurityRow:
     """Represents a single security row from the Excel file."""
     ticker: str
@@ -27,12 +70,10 @@ class SecurityRow:
     
     def is_cash_or_fee(self) -> bool:
         """Check if this row is cash or fees (GICS == 'NA' or dash markers)."""
-        if self.gics is None:
-            return True
-        return self.gics in {"NA", "—", "--"}
+        return is_cash_or_fee_gics(self.gics)
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioData:
     """Parsed data from a single portfolio Excel file."""
     portcode: str
@@ -45,7 +86,7 @@ class PortfolioData:
     
     def get_filtered_securities(self) -> list[SecurityRow]:
         """Return securities excluding cash/fees rows."""
-        return [s for s in self.securities if not s.is_cash_or_fee()]
+        return [s for s in self.securities if not is_cash_or_fee_gics(s.gics)]
 
     def __post_init__(self) -> None:
         """Initialize mutable defaults safely."""
@@ -55,9 +96,9 @@ class PortfolioData:
 
 @dataclass
 class AttributionRow:
-    """A single top-level attribution row."""
+    """A single top-level attribution row; metrics align with the table's metric_headers."""
     category: str
-    metrics: dict[str, float | str]
+    metrics: tuple[float | str, ...]
 
 
 @dataclass
@@ -80,17 +121,97 @@ ATTRIBUTION_CATEGORY_HEADERS = {
 }
 
 
+@lru_cache(maxsize=4096)
 def extract_portcode_from_filename(filename: str) -> str:
     """
     Extract PORTCODE from filename.
     Pattern: PORTCODE_*_MMDDYYYY.xlsx
     PORTCODE = everything before the first underscore
     """
-    base_name = Path(filename).stem  # Remove .xlsx
-    parts = base_name.split('_')
-    if parts:
-        return parts[0]
-    return base_name
+    stem = os.path.splitext(os.path.basename(filename))[0]
+    # partition stops at the first underscore; with none, the whole stem is returned
+    return stem.partition('_')[0]
+
+
+_SHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_DOC_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _resolve_sheet_xml_path(archive: zipfile.ZipFile, sheet_name: str) -> Optional[str]:
+    """Return the archive member that holds a worksheet's XML, if any."""
+    workbook = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    rel_id = None
+    for sheet in workbook.iter(f"{_SHEET_NS}sheet"):
+        if sheet.get("name") == sheet_name:
+            rel_id = sheet.get(f"{_DOC_REL_NS}id")
+            break
+    if rel_id is None:
+        return None
+
+    rels = ElementTree.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels.iter(f"{_PKG_REL_NS}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target", "")
+            return target[1:] if target.startswith("/") else f"xl/{target}"
+    return None
+
+
+def _read_outline_levels(
+    file_path: Path,
+    sheet_name: str,
+    max_row: Optional[int] = None
+) -> dict[int, int]:
+    """
+    Read grouped-row outline levels for a worksheet.
+
+    Read-only worksheets have no row_dimensions, so the levels are streamed
+    from the sheet XML, stopping after ``max_row`` when given. Rows without an
+    outline level are omitted.
+    """
+    levels: dict[int, int] = {}
+    row_tag = f"{_SHEET_NS}row"
+    with zipfile.ZipFile(file_path) as archive:
+        sheet_path = _resolve_sheet_xml_path(archive, sheet_name)
+        if sheet_path is None:
+            return levels
+        with archive.open(sheet_path) as source:
+            row_num = 0
+            for _, element in ElementTree.iterparse(source):
+                if element.tag != row_tag:
+                    continue
+                row_num = int(element.get("r", row_num + 1))
+                if max_row is not None and row_num > max_row:
+                    break
+                level = element.get("outlineLevel")
+                if level:
+                    levels[row_num] = int(level)
+                element.clear()
+    return levels
+
+
+def _to_float_fast(value: object) -> float:
+    """Coerce a cell value to float, defaulting to 0.0 when it is not numeric."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if value is None or value == "":
+        return 0.0
+    text = value if isinstance(value, str) else str(value)
+    # float() already tolerates surrounding whitespace; only thousands
+    # separators need removing, so skip the copy when there are none.
+    if "," in text:
+        text = text.replace(",", "")
+    try:
+        return float(text)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _cell_text(value: object) -> str:
+    """Return stripped cell text, rendering whole-number floats without ".0"."""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
 
 
 def _parse_numeric_or_text(value: object) -> float | str:
@@ -108,41 +229,42 @@ def _parse_numeric_or_text(value: object) -> float | str:
         return text
 
 
-def _parse_metric_headers(ws: openpyxl.worksheet.worksheet.Worksheet) -> list[str]:
+def _parse_metric_headers(header_row: Sequence[object]) -> list[str]:
     """Parse attribution metric headers from row 7, columns B+."""
-    headers: list[str] = []
-    for col in range(2, ws.max_column + 1):
-        value = ws.cell(row=7, column=col).value
-        if value is None:
-            continue
-        header = str(value).strip()
-        if header:
-            headers.append(header)
-    return headers
+    return [
+        str(value).strip()
+        for value in header_row[1:]
+        if value is not None and str(value).strip()
+    ]
 
 
 def _build_attribution_row(
-    ws: openpyxl.worksheet.worksheet.Worksheet,
-    row_num: int,
+    row_values: Sequence[object],
     category: str,
     metric_headers: list[str]
 ) -> AttributionRow:
-    """Build an AttributionRow from a worksheet row."""
-    metrics: dict[str, float | str] = {}
-    for offset, header in enumerate(metric_headers, start=2):
-        value = ws.cell(row=row_num, column=offset).value
-        metrics[header] = _parse_numeric_or_text(value)
+    """Build an AttributionRow from a worksheet row's values (column A first)."""
+    metric_values = row_values[1:len(metric_headers) + 1]
+    metrics = tuple(_parse_numeric_or_text(value) for value in metric_values)
+    if len(metrics) < len(metric_headers):
+        metrics += ("",) * (len(metric_headers) - len(metrics))
     return AttributionRow(category=category, metrics=metrics)
 
 
 def _parse_attribution_sheet(
-    ws: openpyxl.worksheet.worksheet.Worksheet,
+    rows: Iterator[Sequence[object]],
     sheet_name: str,
     file_path: Path,
     warnings: list[str]
 ) -> Optional[AttributionTable]:
-    """Parse an attribution sheet, keeping only highest-level grouped rows."""
-    metric_headers = _parse_metric_headers(ws)
+    """
+    Parse an attribution sheet, keeping only highest-level grouped rows.
+
+    ``rows`` starts at the row 7 header. Rows are streamed until three
+    consecutive blank categories; outline levels are then read only up to the
+    last data row, so trailing empty rows in the sheet are never scanned.
+    """
+    metric_headers = _parse_metric_headers(next(rows, ()))
     if not metric_headers:
         warnings.append(
             f"{file_path.name} [{sheet_name}]: Missing metric headers in row 7; "
@@ -156,17 +278,9 @@ def _parse_attribution_sheet(
 
     seen_data = False
     consecutive_blank_categories = 0
-    for row_num in range(8, ws.max_row + 1):
-        category_raw = ws.cell(row=row_num, column=1).value
-        if category_raw is None:
-            if seen_data:
-                consecutive_blank_categories += 1
-                # Allow occasional blank category rows after data starts (e.g., before "Total")
-                if consecutive_blank_categories >= 3:
-                    break
-            continue
-
-        category = str(category_raw).strip()
+    for row_num, row_values in enumerate(rows, start=8):
+        category_raw = row_values[0] if row_values else None
+        category = _cell_text(category_raw) if category_raw is not None else ""
         if not category:
             if seen_data:
                 consecutive_blank_categories += 1
@@ -178,23 +292,23 @@ def _parse_attribution_sheet(
         seen_data = True
         consecutive_blank_categories = 0
 
-        row_dim = ws.row_dimensions.get(row_num)
-        outline_level = row_dim.outlineLevel if row_dim is not None else 0
-        if outline_level is None:
-            outline_level = 0
-        row = _build_attribution_row(ws, row_num, category, metric_headers)
+        row = _build_attribution_row(row_values, category, metric_headers)
 
         if category.lower() == "total":
             total_row = row
             continue
 
-        candidate_rows.append((outline_level, row))
+        candidate_rows.append((row_num, row))
 
     if candidate_rows:
-        top_level_outline = min(outline for outline, _ in candidate_rows)
-        top_level_rows = [
-            row for outline, row in candidate_rows if outline == top_level_outline
-        ]
+        outline_levels = _read_outline_levels(
+            file_path, sheet_name, max_row=candidate_rows[-1][0]
+        )
+        # Single pass: bucket rows by level, then take the shallowest bucket
+        rows_by_level: defaultdict[int, list[AttributionRow]] = defaultdict(list)
+        for row_num, row in candidate_rows:
+            rows_by_level[outline_levels.get(row_num, 0)].append(row)
+        top_level_rows = rows_by_level[min(rows_by_level)]
     else:
         top_level_rows = []
 
@@ -244,36 +358,36 @@ def format_attribution_table_markdown(
     if table is None or not table.has_data():
         return empty_message
 
-    headers = [table.category_header] + table.metric_headers
-    lines: list[str] = []
-    lines.append(f"### {table.sheet_name}")
-    lines.append("")
-    lines.append("| " + " | ".join(headers) + " |")
-    lines.append("| " + " | ".join(["---"] * len(headers)) + " |")
+    metric_headers = table.metric_headers
+    column_count = len(metric_headers) + 1
+    divider = "| " + " | ".join(["---"] * column_count) + " |"
 
-    for row in table.top_level_rows:
-        values = [row.category] + [
-            _format_markdown_metric(row.metrics.get(header, ""))
-            for header in table.metric_headers
-        ]
-        lines.append("| " + " | ".join(values) + " |")
+    lines: list[str] = [
+        f"### {table.sheet_name}",
+        "",
+        "| " + " | ".join(chain((table.category_header,), metric_headers)) + " |",
+        divider,
+    ]
 
+    rows = table.top_level_rows
     if table.total_row is not None:
-        total_values = [table.total_row.category] + [
-            _format_markdown_metric(table.total_row.metrics.get(header, ""))
-            for header in table.metric_headers
-        ]
-        lines.append("| " + " | ".join(total_values) + " |")
+        rows = chain(rows, (table.total_row,))
+
+    for row in rows:
+        cells = chain((row.category,), map(_format_markdown_metric, row.metrics))
+        lines.append("| " + " | ".join(cells) + " |")
 
     return "\n".join(lines)
 
 
-def parse_excel_file(file_path: Path) -> PortfolioData:
+def parse_excel_file(file_path: Path, skip_cash_fees: bool = False) -> PortfolioData:
     """
     Parse a FactSet Excel file and extract portfolio data.
     
     Args:
         file_path: Path to the Excel file
+        skip_cash_fees: Drop cash/fee rows while parsing instead of keeping
+            them for get_filtered_securities to remove later
         
     Returns:
         PortfolioData object with extracted information
@@ -281,18 +395,56 @@ def parse_excel_file(file_path: Path) -> PortfolioData:
     Raises:
         ValueError: If the file format is invalid or required data is missing
     """
-    wb = openpyxl.load_workbook(file_path, data_only=True)
+    if _CALAMINE_AVAILABLE:
+        with closing(CalamineWorkbook.from_path(str(file_path))) as calamine_wb:
+            sheet_cache: dict[str, list[list[object]]] = {}
+
+            def read_calamine_rows(name: str, min_row: int) -> Iterator[Sequence[object]]:
+                if name not in sheet_cache:
+                    sheet = calamine_wb.get_sheet_by_name(name)
+                    # Keep leading blank rows so row numbers match the layout
+                    sheet_cache[name] = sheet.to_python(skip_empty_area=False)
+                return iter(sheet_cache[name][min_row - 1:])
+
+            return _parse_workbook(
+                calamine_wb.sheet_names, read_calamine_rows, file_path, skip_cash_fees
+            )
+
+    # Imported here so calamine runs (and spawned parse workers) never pay
+    # openpyxl's import cost.
+    import openpyxl
+
+    # closing() releases the read-only archive handle on every exit path
+    workbook = openpyxl.load_workbook(
+        file_path, data_only=True, read_only=True, keep_links=False
+    )
+    with closing(workbook) as wb:
+        def read_openpyxl_rows(name: str, min_row: int) -> Iterator[Sequence[object]]:
+            return wb[name].iter_rows(min_row=min_row, values_only=True)
+
+        return _parse_workbook(wb.sheetnames, read_openpyxl_rows, file_path, skip_cash_fees)
+
+
+def _parse_workbook(
+    sheet_names: list[str],
+    read_rows: RowReader,
+    file_path: Path,
+    skip_cash_fees: bool = False
+) -> PortfolioData:
+    """Extract portfolio data from an open workbook (see parse_excel_file)."""
     attribution_warnings: list[str] = []
     
     # Check for required sheet
     sheet_name = "ContributionMasterRisk"
-    if sheet_name not in wb.sheetnames:
+    if sheet_name not in sheet_names:
         raise ValueError(f"Required sheet '{sheet_name}' not found in {file_path}")
     
-    ws = wb[sheet_name]
+    # One streaming pass: row 6 (period), row 7 (headers), then data from row 10
+    rows = read_rows(sheet_name, 6)
     
     # Extract period from row 6
-    period_value = ws.cell(row=6, column=1).value
+    period_row = next(rows, ())
+    period_value = period_row[0] if period_row else None
     if not period_value:
         raise ValueError(f"Period not found in row 6 of {file_path}")
     period = str(period_value).strip()
@@ -302,25 +454,21 @@ def parse_excel_file(file_path: Path) -> PortfolioData:
     col_map = {}
     ticker_col = None
     
-    for col in range(1, ws.max_column + 1):
-        header = ws.cell(row=7, column=col).value
+    header_row = next(rows, ())
+    for col, header in enumerate(header_row, start=1):
         if header is None:
             continue
         header_str = str(header).strip()
         if not header_str:
             continue
-        header_key = header_str.lower()
-        if header_key == "ticker":
-            col_map["Ticker"] = col
+        key = _HEADER_MAP.get(header_str.lower())
+        if key is None:
+            continue
+        col_map[key] = col
+        if key == "Ticker":
             ticker_col = col
-        elif header_key == "security name":
-            col_map["Security Name"] = col
-        elif header_key == "port. ending weight":
-            col_map["Port. Ending Weight"] = col
-        elif header_key == "contribution to return":
-            col_map["Contribution To Return"] = col
-        elif header_key == "gics":
-            col_map["GICS"] = col
+        if len(col_map) == len(_HEADER_MAP):
+            break  # every known header located; ignore trailing columns
     
     # Validate required columns found
     required_cols = ["Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
@@ -336,48 +484,63 @@ def parse_excel_file(file_path: Path) -> PortfolioData:
     
     # Parse data rows starting at row 10
     securities = []
-    row_num = 10
     
-    while True:
-        ticker = ws.cell(row=row_num, column=col_map["Ticker"]).value
+    # Bind 0-based tuple indices once so the row loop is pure tuple indexing
+    ticker_idx = col_map["Ticker"] - 1
+    name_idx = col_map["Security Name"] - 1 if col_map["Security Name"] else None
+    weight_idx = col_map["Port. Ending Weight"] - 1
+    contribution_idx = col_map["Contribution To Return"] - 1
+    gics_idx = col_map["GICS"] - 1
+    
+    for row in islice(rows, 2, None):  # skip rows 8-9
+        ticker = row[ticker_idx]
+        ticker_text = "" if ticker is None else _cell_text(ticker)
         
         # Stop at first blank ticker (end of table)
-        if ticker is None or str(ticker).strip() == "":
+        if not ticker_text:
             break
         
-        security_name = ws.cell(row=row_num, column=col_map["Security Name"]).value if col_map["Security Name"] else ""
-        port_ending_weight = ws.cell(row=row_num, column=col_map["Port. Ending Weight"]).value
-        contribution_to_return = ws.cell(row=row_num, column=col_map["Contribution To Return"]).value
-        gics = ws.cell(row=row_num, column=col_map["GICS"]).value
+        gics = row[gics_idx]
+        gics_text = _cell_text(gics) if gics else "NA"
+        if skip_cash_fees and is_cash_or_fee_gics(gics_text):
+            continue
         
-        # Parse numeric values (handle potential None or string values)
-        try:
-            weight = float(port_ending_weight) if port_ending_weight is not None else 0.0
-        except (ValueError, TypeError):
-            weight = 0.0
-            
-        try:
-            contribution = float(contribution_to_return) if contribution_to_return is not None else 0.0
-        except (ValueError, TypeError):
-            contribution = 0.0
+        security_name = row[name_idx] if name_idx is not None else ""
+        port_ending_weight = row[weight_idx]
+        contribution_to_return = row[contribution_idx]
         
+        # Float cells (the norm) are used as-is without a call; anything else is
+        # coerced, with unparseable text falling back to 0.0
+        weight = (
+            port_ending_weight if type(port_ending_weight) is float
+            else _to_float_fast(port_ending_weight)
+        )
+        contribution = (
+            contribution_to_return if type(contribution_to_return) is float
+            else _to_float_fast(contribution_to_return)
+        )
+        
+        # Interning shares repeated names and sectors across rows and files,
+        # and lets pickle memoize them when results come back from workers
         securities.append(SecurityRow(
-            ticker=str(ticker).strip(),
-            security_name=str(security_name).strip() if security_name else "",
+            ticker=sys.intern(ticker_text),
+            security_name=sys.intern(_cell_text(security_name)) if security_name else "",
             port_ending_weight=weight,
             contribution_to_return=contribution,
-            gics=str(gics).strip() if gics else "NA"
+            gics=sys.intern(gics_text)
         ))
-        
-        row_num += 1
+    del rows
     
     # Parse optional attribution tabs (exact names only)
     sector_sheet_name = "AttributionbySector"
     country_sheet_name = "AttributionbyCountryMasterRisk"
 
-    if sector_sheet_name in wb.sheetnames:
+    if sector_sheet_name in sheet_names:
         sector_attribution = _parse_attribution_sheet(
-            wb[sector_sheet_name], sector_sheet_name, file_path, attribution_warnings
+            read_rows(sector_sheet_name, 7),
+            sector_sheet_name,
+            file_path,
+            attribution_warnings,
         )
     else:
         sector_attribution = None
@@ -385,17 +548,18 @@ def parse_excel_file(file_path: Path) -> PortfolioData:
             f"{file_path.name}: Missing expected attribution tab '{sector_sheet_name}'."
         )
 
-    if country_sheet_name in wb.sheetnames:
+    if country_sheet_name in sheet_names:
         country_attribution = _parse_attribution_sheet(
-            wb[country_sheet_name], country_sheet_name, file_path, attribution_warnings
+            read_rows(country_sheet_name, 7),
+            country_sheet_name,
+            file_path,
+            attribution_warnings,
         )
     else:
         country_attribution = None
         attribution_warnings.append(
             f"{file_path.name}: Missing optional attribution tab '{country_sheet_name}'."
         )
-
-    wb.close()
     
     # Extract portcode from filename
     portcode = extract_portcode_from_filename(file_path.name)
@@ -411,22 +575,104 @@ def parse_excel_file(file_path: Path) -> PortfolioData:
     )
 
 
-def parse_multiple_files(file_paths: list[Path]) -> list[PortfolioData]:
+# Parsed portfolios keyed by (path, mtime_ns, size); edited files get a new key
+_PARSE_CACHE_MAX_ENTRIES = 64
+_ParseCacheKey = tuple[str, int, int]
+_parse_cache: dict[_ParseCacheKey, PortfolioData] = {}
+
+# Spawned parse workers re-import the app (tkinter, httpx) before parsing,
+# roughly 0.15s each, while calamine parses a few MB per second in-process.
+# Below this many pending bytes the sequential loop is faster.
+_PARALLEL_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+
+def _parse_cache_key(file_path: Path) -> Optional[_ParseCacheKey]:
+    """Return the cache key for a file, or None when it cannot be stat'ed."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+def _store_parsed(key: Optional[_ParseCacheKey], data: PortfolioData) -> None:
+    """Remember a parse result, evicting the oldest entry when full."""
+    if key is None:
+        return
+    if len(_parse_cache) >= _PARSE_CACHE_MAX_ENTRIES:
+        _parse_cache.pop(next(iter(_parse_cache)))
+    _parse_cache[key] = data
+
+
+def _should_parse_in_parallel(pending_keys: list[Optional[_ParseCacheKey]]) -> bool:
+    """Return True when the pending files are big enough to pay for worker startup."""
+    if len(pending_keys) < 2:
+        return False
+    total_bytes = sum(key[2] for key in pending_keys if key is not None)
+    return total_bytes >= _PARALLEL_PARSE_MIN_BYTES
+
+
+def parse_multiple_files(
+    file_paths: list[Path],
+    parallel: Optional[bool] = None
+) -> list[PortfolioData]:
     """
     Parse multiple Excel files.
     
+    Files unchanged since a previous call (same path, mtime, and size) are
+    served from an in-memory cache. The rest are parsed sequentially unless
+    they are large enough that worker processes pay for their startup; results
+    keep the input order either way.
+    
     Args:
         file_paths: List of paths to Excel files
+        parallel: Force (True) or disable (False) process-parallel parsing;
+            None decides from the total size of the files to parse
         
     Returns:
         List of PortfolioData objects
     """
-    results = []
-    for file_path in file_paths:
-        try:
-            data = parse_excel_file(file_path)
-            results.append(data)
-        except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
-            raise
-    return results
+    keys = [_parse_cache_key(file_path) for file_path in file_paths]
+    results: list[Optional[PortfolioData]] = [
+        _parse_cache.get(key) if key is not None else None for key in keys
+    ]
+    pending = [index for index, data in enumerate(results) if data is None]
+    if parallel is None:
+        parallel = _should_parse_in_parallel([keys[index] for index in pending])
+
+    if not parallel or len(pending) < 2:
+        for index in pending:
+            file_path = file_paths[index]
+            try:
+                data = parse_excel_file(file_path)
+            except Exception as e:
+                print(f"Error parsing {file_path}: {e}")
+                raise
+            _store_parsed(keys[index], data)
+            results[index] = data
+        return results
+
+    # Spawned workers avoid forking the GUI's threads and behave the same on
+    # macOS, Windows, and frozen builds (see freeze_support in run_app.py).
+    max_workers = min(len(pending), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        futures = {
+            executor.submit(parse_excel_file, file_paths[index]): index
+            for index in pending
+        }
+        # Collect in completion order so a failing file surfaces (and cancels
+        # queued work) without waiting on slower files ahead of it.
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                print(f"Error parsing {file_paths[index]}: {e}")
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            _store_parsed(keys[index], data)
+            results[index] = data
+        return results
@@ -5,22 +5,29 @@ Simple tkinter-based GUI for non-technical users.
 """
 
 import asyncio
+import concurrent.futures
+import itertools
 import json
+import logging
 import os
-import queue
 import re
 import sys
 import threading
+import time
 import tkinter as tk
+from collections import defaultdict, deque
+from dataclasses import dataclass
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Optional, Callable
+from typing import TYPE_CHECKING, Optional, Callable
 
 # Add parent to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.excel_parser import (
+    PortfolioData,
     parse_multiple_files,
     format_attribution_table_markdown,
 )
@@ -40,28 +47,94 @@ from src.prompt_manager import (
 from src.openai_client import (
     OpenAIClient,
     CommentaryResult,
+    RateLimitConfig,
     AttributionOverviewResult,
     DEFAULT_DEVELOPER_PROMPT,
+    MAX_COMMENTARY_BATCH_SIZE,
 )
 from src.output_generator import create_output_workbook, create_log_file
 from src.ui_styles import Spacing, Typography, Dimensions
 from src import keystore
 
+if TYPE_CHECKING:
+    from src.response_cache import ResponseCache
+
+logger = logging.getLogger(__name__)
+
 AVAILABLE_MODELS = [
     "gpt-5-nano-2025-08-07",
     "gpt-5.2-pro-2025-12-11",
     "gpt-5.2-2025-12-11",
 ]
 DEFAULT_MODEL = "gpt-5.2-2025-12-11"
+# The Tk thread polls for worker updates at this interval while a run is
+# active; workers never call into Tcl themselves
+_DRAIN_INTERVAL_MS = 100
+# UI callbacks run per drain; the rest wait behind pending input and repaints
+_MAX_UI_CALLBACKS_PER_DRAIN = 16
+# Membership checks for model IDs read back from config.json
+_AVAILABLE_MODEL_SET = frozenset(AVAILABLE_MODELS)
+
+# Web search domain cleanup: URL prefixes (each at most once, in this order)
+# and trailing slashes are stripped by one substitution, then the allowed
+# character set is checked
+_STRIP_URL_AFFIXES_RE = re.compile(r"^(?:https://)?(?:http://)?(?:www\.)?|/+$")
+_DOMAIN_RE = re.compile(r"^[a-z0-9\-\.]+$")
+# All of the checks below in one pass: allowed characters, at least one dot,
+# and no leading/trailing hyphen or dot
+_VALID_DOMAIN_RE = re.compile(r"[a-z0-9][a-z0-9\-]*\.[a-z0-9\-\.]*[a-z0-9]")
+
+
+# config.json keys loaded verbatim onto CommentaryGeneratorApp attributes
+_CONFIG_FIELDS = (
+    ("prompt_template", "prompt_text_content"),
+    ("developer_prompt", "developer_prompt_content"),
+    ("thinking_level", "thinking_level"),
+    ("text_verbosity", "text_verbosity"),
+    ("attribution_prompt_template", "attribution_prompt_text_content"),
+    ("attribution_developer_prompt", "attribution_developer_prompt_content"),
+    ("attribution_thinking_level", "attribution_thinking_level"),
+    ("attribution_text_verbosity", "attribution_text_verbosity"),
+    ("require_citations", "require_citations"),
+    ("prioritize_sources", "prioritize_sources"),
+    ("use_response_cache", "use_response_cache"),
+)
+# config.json model keys, validated against AVAILABLE_MODELS on load
+_CONFIG_MODEL_FIELDS = (
+    ("model", "model_id"),
+    ("attribution_model", "attribution_model_id"),
+)
 
 
-def get_reasoning_levels_for_model(model_id: str) -> list[str]:
+@lru_cache(maxsize=32)
+def get_reasoning_levels_for_model(model_id: str) -> tuple[str, ...]:
     """Return supported reasoning effort levels for a model."""
     if model_id.startswith("gpt-5.2-pro"):
-        return ["medium", "high", "xhigh"]
+        return ("medium", "high", "xhigh")
     if model_id.startswith("gpt-5.2"):
-        return ["none", "low", "medium", "high", "xhigh"]
-    return ["low", "medium", "high"]
+        return ("none", "low", "medium", "high", "xhigh")
+    return ("low", "medium", "high")
+
+
+# Reasoning levels in display order with their tooltip descriptions
+_REASONING_DESCRIPTIONS = (
+    ("none", "No reasoning"),
+    ("low", "Fastest"),
+    ("medium", "Balanced"),
+    ("high", "Thorough"),
+    ("xhigh", "Most thorough"),
+)
+
+
+@lru_cache(maxsize=8)
+def _build_reasoning_help_text(levels: tuple[str, ...]) -> str:
+    """Return the reasoning tooltip text describing the given levels."""
+    parts = " | ".join(
+        f"{level}: {description}"
+        for level, description in _REASONING_DESCRIPTIONS
+        if level in levels
+    )
+    return f"Supported levels: {parts}"
 
 
 def validate_and_clean_domains(domains_str: str) -> tuple[list[str], list[str]]:
@@ -76,25 +149,32 @@ def validate_and_clean_domains(domains_str: str) -> tuple[list[str], list[str]]:
     Returns:
         tuple: (list of valid cleaned domains, list of validation error messages)
     """
+    valid_domains, errors = _validate_and_clean_domains_cached(domains_str)
+    return list(valid_domains), list(errors)
+
+
+@lru_cache(maxsize=128)
+def _validate_and_clean_domains_cached(domains_str: str) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Memoized body of validate_and_clean_domains; tuples keep cached results immutable."""
     errors = []
     valid_domains = []
     
     if not domains_str.strip():
-        return [], []
+        return (), ()
     
     for domain in domains_str.split(","):
         domain = domain.strip()
         if not domain:
             continue
         
-        # Remove common URL prefixes
-        cleaned = domain.lower()
-        for prefix in ["https://", "http://", "www."]:
-            if cleaned.startswith(prefix):
-                cleaned = cleaned[len(prefix):]
+        # Remove common URL prefixes and trailing slashes
+        cleaned = _STRIP_URL_AFFIXES_RE.sub("", domain.lower())
         
-        # Remove trailing slashes
-        cleaned = cleaned.rstrip("/")
+        # Well-formed domains (the common case) are accepted by a single match;
+        # only rejected ones go through the checks that pick an error message
+        if _VALID_DOMAIN_RE.fullmatch(cleaned):
+            valid_domains.append(cleaned)
+            continue
         
         # Basic domain validation: should contain at least one dot and alphanumeric chars
         if not cleaned:
@@ -106,7 +186,7 @@ def validate_and_clean_domains(domains_str: str) -> tuple[list[str], list[str]]:
             continue
         
         # Check for invalid characters (allow alphanumeric, dots, hyphens)
-        if not re.match(r"^[a-z0-9\-\.]+$", cleaned):
+        if not _DOMAIN_RE.match(cleaned):
             errors.append(f"'{domain}' contains invalid characters")
             continue
         
@@ -117,7 +197,45 @@ def validate_and_clean_domains(domains_str: str) -> tuple[list[str], list[str]]:
         
         valid_domains.append(cleaned)
     
-    return valid_domains, errors
+    return tuple(valid_domains), tuple(errors)
+
+
+def _build_attribution_requests(
+    portfolios: list[PortfolioData],
+    prompt_manager: AttributionPromptManager,
+) -> list[dict[str, str]]:
+    """
+    Format attribution tables and build one overview request per portfolio.
+
+    Args:
+        portfolios: Portfolios that have sector and/or country attribution data.
+        prompt_manager: Attribution prompt builder for this run.
+
+    Returns:
+        Attribution overview requests in portfolio order.
+    """
+    requests = []
+    for portfolio in portfolios:
+        sector_attrib_markdown = format_attribution_table_markdown(
+            portfolio.sector_attribution,
+            empty_message="No sector attribution data available.",
+        )
+        country_attrib_markdown = format_attribution_table_markdown(
+            portfolio.country_attribution,
+            empty_message="No country attribution data available.",
+        )
+        requests.append(
+            {
+                "portcode": portfolio.portcode,
+                "prompt": prompt_manager.build_prompt(
+                    portcode=portfolio.portcode,
+                    period=portfolio.period,
+                    sector_attrib=sector_attrib_markdown,
+                    country_attrib=country_attrib_markdown,
+                ),
+            }
+        )
+    return requests
 
 
 def _organize_commentary_results_by_request(
@@ -135,92 +253,116 @@ def _organize_commentary_results_by_request(
         Tuple containing:
             - Nested commentary dict keyed by portcode then ticker
             - Error dict keyed as "PORTCODE|TICKER"
+
+    Raises:
+        ValueError: If requests and results differ in length, which would
+            otherwise silently attach results to the wrong securities.
     """
-    commentary_results: dict[str, dict[str, CommentaryResult]] = {}
-    errors: dict[str, list[str]] = {}
+    commentary_results: defaultdict[str, dict[str, CommentaryResult]] = defaultdict(dict)
+    errors: defaultdict[str, list[str]] = defaultdict(list)
 
-    for request, result in zip(requests, results):
+    for request, result in zip(requests, results, strict=True):
         portcode = request.get("portcode", "unknown")
         ticker = request.get("ticker", result.ticker)
 
-        if portcode not in commentary_results:
-            commentary_results[portcode] = {}
         commentary_results[portcode][ticker] = result
 
         if not result.success:
-            key = f"{portcode}|{ticker}"
-            errors.setdefault(key, []).append(result.error_message)
-
-    return commentary_results, errors
-
-
-def _compute_overall_progress(
-    completed: int,
-    offset: int,
-    overall_total: int
-) -> tuple[int, int]:
-    """
-    Translate phase-local progress into run-level progress.
-
-    Args:
-        completed: Completed count in the current phase.
-        offset: Number of items completed before this phase.
-        overall_total: Total requests across all phases in this run.
-
-    Returns:
-        Tuple of (overall_completed, overall_total).
-    """
-    if overall_total <= 0:
-        return 0, 0
-
-    normalized_completed = max(0, completed)
-    overall_completed = min(overall_total, offset + normalized_completed)
-    return overall_completed, overall_total
+            errors[f"{portcode}|{ticker}"].append(result.error_message)
+
+    # Plain dicts so lookups of unknown portfolios raise instead of inserting
+    return dict(commentary_results), dict(errors)
+
+
+@dataclass(frozen=True)
+class _RunSettings:
+    """Settings for one generation run, read on the Tk thread before it starts."""
+    api_key: str
+    input_files: tuple[Path, ...]
+    output_folder: Path
+    selection_mode: SelectionMode
+    count: int
+    preferred_sources: tuple[str, ...]
+    require_citations: bool
+    prioritize_sources: bool
+    use_response_cache: bool
+    prompt_template: str
+    developer_prompt: str
+    model_id: str
+    thinking_level: str
+    text_verbosity: str
+    commentary_batch_size: int
+    run_attribution_overview: bool
+    attribution_prompt_template: str
+    attribution_developer_prompt: str
+    attribution_model_id: str
+    attribution_thinking_level: str
+    attribution_text_verbosity: str
 
 
 def _make_overall_progress_callback(
     update_progress_fn: Callable[[str, int, int], None],
-    offset: int,
     overall_total: int
 ) -> Callable[[str, int, int], None]:
     """
-    Create a phase progress callback that reports run-level totals.
+    Create a progress callback shared by every batch in a run.
+
+    Batches run concurrently, so phase-local counts cannot be offset into a
+    run total; each call instead marks one more completed request. Batches
+    report from the event loop thread, and next() on itertools.count is a
+    single C call, so the shared counter needs no lock.
 
     Args:
         update_progress_fn: App progress callback target.
-        offset: Number of already-completed requests before this phase.
         overall_total: Total requests in the run.
 
     Returns:
         Callback compatible with OpenAIClient progress callback signature.
     """
-    def _callback(item_id: str, completed: int, _phase_total: int) -> None:
-        overall_completed, total = _compute_overall_progress(
-            completed=completed,
-            offset=offset,
-            overall_total=overall_total
-        )
-        if total > 0:
-            update_progress_fn(item_id, overall_completed, total)
+    if overall_total <= 0:
+        # Nothing to report against; decided once instead of per event
+        return lambda _item_id, _completed, _phase_total: None
+
+    completions = itertools.count(1)
+
+    def _callback(item_id: str, _completed: int, _phase_total: int) -> None:
+        update_progress_fn(item_id, min(overall_total, next(completions)), overall_total)
 
     return _callback
 
 
 class ToolTip:
-    """Simple hover tooltip for tkinter widgets."""
+    """
+    Simple hover tooltip for tkinter widgets.
+
+    Tooltips in the same top-level window share one popup that is withdrawn
+    between hovers and re-labelled on show, instead of building and destroying
+    a Toplevel and Label every time.
+    """
+
+    # Top-level window path -> (popup, label) shared by its tooltips
+    _shared_tips: dict[str, tuple[tk.Toplevel, tk.Label]] = {}
 
     def __init__(self, widget: tk.Widget, text: str):
         self.widget = widget
         self.text = text
         self.tip_window: Optional[tk.Toplevel] = None
         self._after_id: Optional[str] = None
+        self._hover_bound = False
 
+        # Only <Enter> is bound up front; most tooltips are never hovered, so the
+        # remaining handlers are installed on first hover.
         self.widget.bind("<Enter>", self._on_enter, add="+")
+
+    def _bind_hover_handlers(self):
+        self._hover_bound = True
         self.widget.bind("<Leave>", self._on_leave, add="+")
         self.widget.bind("<ButtonPress>", self._on_leave, add="+")
         self.widget.bind("<Destroy>", self._on_destroy, add="+")
 
     def _on_enter(self, _event=None):
+        if not self._hover_bound:
+            self._bind_hover_handlers()
         if self._after_id is None:
             self._after_id = self.widget.after(500, self._show)
 
@@ -244,25 +386,19 @@ class ToolTip:
         finally:
             self._after_id = None
 
-    def _show(self):
-        if self.tip_window is not None:
-            return
-        try:
-            if not self.widget.winfo_exists():
-                self._after_id = None
-                return
-            x = self.widget.winfo_rootx() + 12
-            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 6
-        except tk.TclError:
-            self._after_id = None
-            return
-        self._after_id = None
-        self.tip_window = tw = tk.Toplevel(self.widget)
+    def _get_shared_tip(self) -> tuple[tk.Toplevel, tk.Label]:
+        """Return this window's tooltip popup, creating it (withdrawn) on first use."""
+        top = self.widget.winfo_toplevel()
+        key = str(top)
+        shared = ToolTip._shared_tips.get(key)
+        if shared is not None and shared[0].winfo_exists():
+            return shared
+
+        tw = tk.Toplevel(top)
+        tw.withdraw()
         tw.wm_overrideredirect(True)
-        tw.wm_geometry(f"+{x}+{y}")
         label = tk.Label(
             tw,
-            text=self.text,
             justify="left",
             relief="solid",
             borderwidth=1,
@@ -274,11 +410,35 @@ class ToolTip:
             wraplength=360,
         )
         label.pack()
+        # Closing the owning window destroys the popup with it
+        tw.bind("<Destroy>", lambda _event: ToolTip._shared_tips.pop(key, None))
+        ToolTip._shared_tips[key] = (tw, label)
+        return tw, label
+
+    def _show(self):
+        if self.tip_window is not None:
+            return
+        try:
+            if not self.widget.winfo_exists():
+                self._after_id = None
+                return
+            x = self.widget.winfo_rootx() + 12
+            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 6
+        except tk.TclError:
+            self._after_id = None
+            return
+        self._after_id = None
+        tw, label = self._get_shared_tip()
+        label.configure(text=self.text)
+        tw.wm_geometry(f"+{x}+{y}")
+        tw.deiconify()
+        tw.lift()
+        self.tip_window = tw
 
     def _hide(self):
         if self.tip_window is not None:
             try:
-                self.tip_window.destroy()
+                self.tip_window.withdraw()
             except tk.TclError:
                 # The tooltip window may already have been destroyed or the Tcl interpreter
                 # may be shutting down; ignore errors during best-effort cleanup.
@@ -286,9 +446,84 @@ class ToolTip:
             self.tip_window = None
 
 
+# cursor is a widget option, not a ttk style option, so it cannot move into a
+# named style; every icon shares this one options dict instead.
+_INFO_ICON_KWARGS = {"text": "(i)", "cursor": "hand2"}
+
+# Tooltip text shared by a control and its info icon.
+_TT_VERBOSITY = "Controls response length and detail."
+_TT_CONTRIBUTION_MODEL = "Select the model used for contribution commentary."
+_TT_CONTRIBUTION_TEMPLATE = "Template variables: {ticker}, {security_name}, {period}, {source_instructions}"
+_TT_BATCH_SIZE = (
+    "Securities from the same portfolio sent to the model in one request. "
+    "Higher values mean fewer API calls; 1 sends each security on its own."
+)
+_TT_CONTRIBUTION_SYSTEM = "System prompt controls the model behavior and tone for all contribution requests."
+_TT_ATTRIBUTION_MODEL = "Select the model used for attribution overview output."
+_TT_ATTRIBUTION_TEMPLATE = "Template variables: {portcode}, {period}, {sector_attrib}, {country_attrib}, {source_instructions}"
+_TT_ATTRIBUTION_SYSTEM = "System prompt controls behavior and tone for attribution overview requests."
+_TT_REQUIRE_CITATIONS = "Mark responses without citations as failed."
+_TT_PRIORITIZE_SOURCES = "When enabled, prompts ask the model to prioritize your preferred domains."
+_TT_CONTRIBUTION_SETTINGS = "Edit contribution prompts plus model reasoning and verbosity."
+_TT_ATTRIBUTION_SETTINGS = "Edit attribution overview prompts plus model reasoning and verbosity."
+_TT_API_SETTINGS = "Configure your OpenAI API key."
+_TT_USE_RESPONSE_CACHE = (
+    "Reuse commentary saved in the last 7 days when the model, settings, prompt, "
+    "and sources are identical. Turn off to always request fresh commentary."
+)
+_TT_CLEAR_CACHE = "Delete saved commentary responses so the next run asks the API again."
+_TT_PREFERRED_SOURCES = (
+    "Comma-separated domains, e.g. reuters.com, bloomberg.com, cnbc.com. "
+    "URLs are cleaned automatically."
+)
+
+
 def _make_info_icon(parent: tk.Widget) -> ttk.Label:
     """Create a small info indicator label for tooltip affordance."""
-    return ttk.Label(parent, text="(i)", cursor="hand2")
+    return ttk.Label(parent, **_INFO_ICON_KWARGS)
+
+
+def _center_window_on_parent(window: tk.Toplevel, parent: tk.Tk, width: int, height: int) -> None:
+    """Center a modal window on its parent, keeping it on screen."""
+    parent.update_idletasks()
+    parent_x = parent.winfo_x()
+    parent_y = parent.winfo_y()
+    parent_width = parent.winfo_width()
+    parent_height = parent.winfo_height()
+
+    x = parent_x + (parent_width - width) // 2
+    y = parent_y + (parent_height - height) // 2
+
+    # Ensure window stays on screen
+    x = max(0, x)
+    y = max(0, y)
+
+    window.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def _grid_with_info_icon(
+    widget: tk.Widget,
+    row: int,
+    pady: int | tuple[int, int] = 0,
+) -> ttk.Label:
+    """Grid a control in column 0 with an info icon beside it; return the icon."""
+    widget.grid(row=row, column=0, sticky="w", pady=pady)
+    icon = _make_info_icon(widget.master)
+    icon.grid(row=row, column=1, sticky="w", padx=(Spacing.CONTROL_GAP_SMALL, 0), pady=pady)
+    return icon
+
+
+def _read_edited_text(widget: tk.Text, initial: str) -> str:
+    """
+    Return a text widget's stripped contents, skipping the Tcl fetch when the
+    user never modified it (the caller clears the modified flag after loading
+    ``initial``).
+    """
+    if not widget.edit_modified():
+        return initial.strip()
+    # "end-1c" excludes Tk's trailing newline, so strip() usually has nothing
+    # to remove and returns the fetched string without copying
+    return widget.get("1.0", "end-1c").strip()
 
 
 class SettingsModal:
@@ -335,12 +570,15 @@ class SettingsModal:
         self.api_key_var = tk.StringVar(value=api_key)
         self.api_key_entry = ttk.Entry(entry_frame, textvariable=self.api_key_var, show="*")
         self.api_key_entry.grid(row=0, column=0, sticky="ew")
+        self._key_shown = False
 
         self.show_button = ttk.Button(entry_frame, text="Hold to show")
         self.show_button.grid(row=0, column=1, padx=(Spacing.CONTROL_GAP, 0))
         self.show_button.bind("<ButtonPress-1>", self._show_key)
         self.show_button.bind("<ButtonRelease-1>", self._hide_key)
         self.show_button.bind("<Leave>", self._hide_key)
+        # Window-wide so the key is re-masked even if focus leaves from
+        # another widget while the button is held; _hide_key ignores no-ops.
         self.window.bind("<FocusOut>", self._hide_key)
         api_help_icon = _make_info_icon(entry_frame)
         api_help_icon.grid(row=0, column=2, padx=(Spacing.CONTROL_GAP_SMALL, 0))
@@ -385,33 +623,25 @@ class SettingsModal:
 
     def _center_on_parent(self, parent: tk.Tk, width: int, height: int):
         """Center the modal window on its parent."""
-        parent.update_idletasks()
-        parent_x = parent.winfo_x()
-        parent_y = parent.winfo_y()
-        parent_width = parent.winfo_width()
-        parent_height = parent.winfo_height()
-
-        x = parent_x + (parent_width - width) // 2
-        y = parent_y + (parent_height - height) // 2
-
-        # Ensure window stays on screen
-        x = max(0, x)
-        y = max(0, y)
-
-        self.window.geometry(f"{width}x{height}+{x}+{y}")
+        _center_window_on_parent(self.window, parent, width, height)
 
     def _show_key(self, _event=None):
         """Show the API key while the button is held."""
-        self.api_key_entry.configure(show="")
+        if not self._key_shown:
+            self.api_key_entry.configure(show="")
+            self._key_shown = True
 
     def _hide_key(self, _event=None):
         """Hide the API key when the hold is released or focus changes."""
-        self.api_key_entry.configure(show="*")
+        if self._key_shown:
+            self.api_key_entry.configure(show="*")
+            self._key_shown = False
     
     def on_cancel(self):
         """Cancel button clicked - discard changes."""
         self.result = None
         self.window.destroy()
+
     
     def on_save(self):
         """Save button clicked - apply changes."""
@@ -433,6 +663,7 @@ class PromptEditorModal:
         current_model: str,
         available_models: list[str],
         current_text_verbosity: str,
+        current_batch_size: int = 1,
     ):
         """
         Initialize the modal window.
@@ -445,6 +676,7 @@ class PromptEditorModal:
             current_model: Current model ID
             available_models: List of available model IDs
             current_text_verbosity: Current text verbosity ("low", "medium", "high")
+            current_batch_size: Current number of securities per commentary request
         """
         self.result = None  # Will be set to dict if user saves
         self._tooltips: list[ToolTip] = []
@@ -513,6 +745,20 @@ class PromptEditorModal:
         verbosity_icon = _make_info_icon(level_frame)
         verbosity_icon.grid(row=2, column=2, padx=(Spacing.CONTROL_GAP_SMALL, 0), pady=(Spacing.CONTROL_GAP_SMALL, 0), sticky="w")
 
+        ttk.Label(level_frame, text="Securities per request:").grid(row=3, column=0, sticky="w", padx=(0, Spacing.LABEL_GAP), pady=(Spacing.CONTROL_GAP_SMALL, 0))
+        self.batch_size_var = tk.IntVar(value=current_batch_size)
+        batch_size_spin = ttk.Spinbox(
+            level_frame,
+            textvariable=self.batch_size_var,
+            from_=1,
+            to=MAX_COMMENTARY_BATCH_SIZE,
+            state="readonly",
+            width=5
+        )
+        batch_size_spin.grid(row=3, column=1, sticky="w", pady=(Spacing.CONTROL_GAP_SMALL, 0))
+        batch_size_icon = _make_info_icon(level_frame)
+        batch_size_icon.grid(row=3, column=2, padx=(Spacing.CONTROL_GAP_SMALL, 0), pady=(Spacing.CONTROL_GAP_SMALL, 0), sticky="w")
+
         # Prompts tabs section
         prompt_frame = ttk.LabelFrame(main_frame, text="Prompts", padding=Spacing.FRAME_PADDING)
         prompt_frame.grid(row=1, column=0, sticky="nsew", pady=(0, Spacing.SECTION_MARGIN))
@@ -532,6 +778,8 @@ class PromptEditorModal:
         self.prompt_text = scrolledtext.ScrolledText(user_prompt_tab, height=Dimensions.PROMPT_TEXT_HEIGHT, wrap=tk.WORD)
         self.prompt_text.grid(row=0, column=0, sticky="nsew", padx=Spacing.CONTROL_GAP, pady=Spacing.CONTROL_GAP)
         self.prompt_text.insert("1.0", current_prompt)
+        self.prompt_text.edit_modified(False)
+        self._initial_prompt = current_prompt
         prompt_icon = _make_info_icon(user_prompt_tab)
         prompt_icon.grid(row=1, column=0, sticky="w", padx=Spacing.CONTROL_GAP, pady=(0, Spacing.CONTROL_GAP))
 
@@ -544,6 +792,8 @@ class PromptEditorModal:
         self.dev_prompt_text = scrolledtext.ScrolledText(dev_prompt_tab, height=Dimensions.PROMPT_TEXT_HEIGHT, wrap=tk.WORD)
         self.dev_prompt_text.grid(row=0, column=0, sticky="nsew", padx=Spacing.CONTROL_GAP, pady=Spacing.CONTROL_GAP)
         self.dev_prompt_text.insert("1.0", current_developer_prompt)
+        self.dev_prompt_text.edit_modified(False)
+        self._initial_developer_prompt = current_developer_prompt
         dev_prompt_icon = _make_info_icon(dev_prompt_tab)
         dev_prompt_icon.grid(row=1, column=0, sticky="w", padx=Spacing.CONTROL_GAP, pady=(0, Spacing.CONTROL_GAP))
 
@@ -569,26 +819,16 @@ class PromptEditorModal:
         self._tooltips.extend([
             self.reasoning_tooltip,
             self.reasoning_icon_tooltip,
-            ToolTip(model_combo, "Select the model used for contribution commentary."),
-            ToolTip(model_icon, "Select the model used for contribution commentary."),
-            ToolTip(verbosity_combo, "Controls response length and detail."),
-            ToolTip(verbosity_icon, "Controls response length and detail."),
-            ToolTip(
-                self.prompt_text,
-                "Template variables: {ticker}, {security_name}, {period}, {source_instructions}",
-            ),
-            ToolTip(
-                prompt_icon,
-                "Template variables: {ticker}, {security_name}, {period}, {source_instructions}",
-            ),
-            ToolTip(
-                self.dev_prompt_text,
-                "System prompt controls the model behavior and tone for all contribution requests.",
-            ),
-            ToolTip(
-                dev_prompt_icon,
-                "System prompt controls the model behavior and tone for all contribution requests.",
-            ),
+            ToolTip(model_combo, _TT_CONTRIBUTION_MODEL),
+            ToolTip(model_icon, _TT_CONTRIBUTION_MODEL),
+            ToolTip(verbosity_combo, _TT_VERBOSITY),
+            ToolTip(verbosity_icon, _TT_VERBOSITY),
+            ToolTip(batch_size_spin, _TT_BATCH_SIZE),
+            ToolTip(batch_size_icon, _TT_BATCH_SIZE),
+            ToolTip(self.prompt_text, _TT_CONTRIBUTION_TEMPLATE),
+            ToolTip(prompt_icon, _TT_CONTRIBUTION_TEMPLATE),
+            ToolTip(self.dev_prompt_text, _TT_CONTRIBUTION_SYSTEM),
+            ToolTip(dev_prompt_icon, _TT_CONTRIBUTION_SYSTEM),
         ])
         self._update_reasoning_levels()
 
@@ -596,49 +836,20 @@ class PromptEditorModal:
 
     def _center_on_parent(self, parent: tk.Tk, width: int, height: int):
         """Center the modal window on its parent."""
-        parent.update_idletasks()
-        parent_x = parent.winfo_x()
-        parent_y = parent.winfo_y()
-        parent_width = parent.winfo_width()
-        parent_height = parent.winfo_height()
-
-        x = parent_x + (parent_width - width) // 2
-        y = parent_y + (parent_height - height) // 2
-
-        # Ensure window stays on screen
-        x = max(0, x)
-        y = max(0, y)
-
-        self.window.geometry(f"{width}x{height}+{x}+{y}")
-
-    def _build_reasoning_help_text(self, levels: list[str]) -> str:
-        parts = []
-        if "none" in levels:
-            parts.append("none: No reasoning")
-        if "low" in levels:
-            parts.append("low: Fastest")
-        if "medium" in levels:
-            parts.append("medium: Balanced")
-        if "high" in levels:
-            parts.append("high: Thorough")
-        if "xhigh" in levels:
-            parts.append("xhigh: Most thorough")
-        return " | ".join(parts)
+        _center_window_on_parent(self.window, parent, width, height)
 
     def _update_reasoning_levels(self) -> None:
         model_id = self.model_var.get()
         levels = get_reasoning_levels_for_model(model_id)
-        self.thinking_combo["values"] = levels
+        self.thinking_combo.configure(values=levels)
 
         if self.thinking_var.get() not in levels:
             default_level = "none" if "none" in levels else "medium"
             self.thinking_var.set(default_level)
 
-        if hasattr(self, "reasoning_tooltip"):
-            help_text = f"Supported levels: {self._build_reasoning_help_text(levels)}"
-            self.reasoning_tooltip.text = help_text
-            if hasattr(self, "reasoning_icon_tooltip"):
-                self.reasoning_icon_tooltip.text = help_text
+        help_text = _build_reasoning_help_text(levels)
+        self.reasoning_tooltip.text = help_text
+        self.reasoning_icon_tooltip.text = help_text
     
     def reset_user_prompt(self):
         """Reset user prompt to default template."""
@@ -658,11 +869,12 @@ class PromptEditorModal:
     def on_save(self):
         """Save button clicked - apply changes."""
         self.result = {
-            "prompt_template": self.prompt_text.get("1.0", tk.END).strip(),
-            "developer_prompt": self.dev_prompt_text.get("1.0", tk.END).strip(),
+            "prompt_template": _read_edited_text(self.prompt_text, self._initial_prompt),
+            "developer_prompt": _read_edited_text(self.dev_prompt_text, self._initial_developer_prompt),
             "thinking_level": self.thinking_var.get(),
             "model": self.model_var.get(),
             "text_verbosity": self.text_verbosity_var.get(),
+            "batch_size": self.batch_size_var.get(),
         }
         self.window.destroy()
 
@@ -762,6 +974,8 @@ class AttributionWorkflowModal:
         self.prompt_text = scrolledtext.ScrolledText(user_tab, height=Dimensions.PROMPT_TEXT_HEIGHT, wrap=tk.WORD)
         self.prompt_text.grid(row=0, column=0, sticky="nsew", padx=Spacing.CONTROL_GAP, pady=Spacing.CONTROL_GAP)
         self.prompt_text.insert("1.0", current_prompt)
+        self.prompt_text.edit_modified(False)
+        self._initial_prompt = current_prompt
         prompt_icon = _make_info_icon(user_tab)
         prompt_icon.grid(row=1, column=0, sticky="w", padx=Spacing.CONTROL_GAP, pady=(0, Spacing.CONTROL_GAP))
 
@@ -773,6 +987,8 @@ class AttributionWorkflowModal:
         self.dev_prompt_text = scrolledtext.ScrolledText(dev_tab, height=Dimensions.PROMPT_TEXT_HEIGHT, wrap=tk.WORD)
         self.dev_prompt_text.grid(row=0, column=0, sticky="nsew", padx=Spacing.CONTROL_GAP, pady=Spacing.CONTROL_GAP)
         self.dev_prompt_text.insert("1.0", current_developer_prompt)
+        self.dev_prompt_text.edit_modified(False)
+        self._initial_developer_prompt = current_developer_prompt
         dev_prompt_icon = _make_info_icon(dev_tab)
         dev_prompt_icon.grid(row=1, column=0, sticky="w", padx=Spacing.CONTROL_GAP, pady=(0, Spacing.CONTROL_GAP))
 
@@ -797,26 +1013,14 @@ class AttributionWorkflowModal:
         self._tooltips.extend([
             self.reasoning_tooltip,
             self.reasoning_icon_tooltip,
-            ToolTip(model_combo, "Select the model used for attribution overview output."),
-            ToolTip(model_icon, "Select the model used for attribution overview output."),
-            ToolTip(verbosity_combo, "Controls response length and detail."),
-            ToolTip(verbosity_icon, "Controls response length and detail."),
-            ToolTip(
-                self.prompt_text,
-                "Template variables: {portcode}, {period}, {sector_attrib}, {country_attrib}, {source_instructions}",
-            ),
-            ToolTip(
-                prompt_icon,
-                "Template variables: {portcode}, {period}, {sector_attrib}, {country_attrib}, {source_instructions}",
-            ),
-            ToolTip(
-                self.dev_prompt_text,
-                "System prompt controls behavior and tone for attribution overview requests.",
-            ),
-            ToolTip(
-                dev_prompt_icon,
-                "System prompt controls behavior and tone for attribution overview requests.",
-            ),
+            ToolTip(model_combo, _TT_ATTRIBUTION_MODEL),
+            ToolTip(model_icon, _TT_ATTRIBUTION_MODEL),
+            ToolTip(verbosity_combo, _TT_VERBOSITY),
+            ToolTip(verbosity_icon, _TT_VERBOSITY),
+            ToolTip(self.prompt_text, _TT_ATTRIBUTION_TEMPLATE),
+            ToolTip(prompt_icon, _TT_ATTRIBUTION_TEMPLATE),
+            ToolTip(self.dev_prompt_text, _TT_ATTRIBUTION_SYSTEM),
+            ToolTip(dev_prompt_icon, _TT_ATTRIBUTION_SYSTEM),
         ])
         self._update_reasoning_levels()
 
@@ -824,46 +1028,20 @@ class AttributionWorkflowModal:
 
     def _center_on_parent(self, parent: tk.Tk, width: int, height: int):
         """Center the modal window on its parent."""
-        parent.update_idletasks()
-        parent_x = parent.winfo_x()
-        parent_y = parent.winfo_y()
-        parent_width = parent.winfo_width()
-        parent_height = parent.winfo_height()
-
-        x = parent_x + (parent_width - width) // 2
-        y = parent_y + (parent_height - height) // 2
-        x = max(0, x)
-        y = max(0, y)
-        self.window.geometry(f"{width}x{height}+{x}+{y}")
-
-    def _build_reasoning_help_text(self, levels: list[str]) -> str:
-        parts = []
-        if "none" in levels:
-            parts.append("none: No reasoning")
-        if "low" in levels:
-            parts.append("low: Fastest")
-        if "medium" in levels:
-            parts.append("medium: Balanced")
-        if "high" in levels:
-            parts.append("high: Thorough")
-        if "xhigh" in levels:
-            parts.append("xhigh: Most thorough")
-        return " | ".join(parts)
+        _center_window_on_parent(self.window, parent, width, height)
 
     def _update_reasoning_levels(self) -> None:
         model_id = self.model_var.get()
         levels = get_reasoning_levels_for_model(model_id)
-        self.thinking_combo["values"] = levels
+        self.thinking_combo.configure(values=levels)
 
         if self.thinking_var.get() not in levels:
             default_level = "none" if "none" in levels else "medium"
             self.thinking_var.set(default_level)
 
-        if hasattr(self, "reasoning_tooltip"):
-            help_text = f"Supported levels: {self._build_reasoning_help_text(levels)}"
-            self.reasoning_tooltip.text = help_text
-            if hasattr(self, "reasoning_icon_tooltip"):
-                self.reasoning_icon_tooltip.text = help_text
+        help_text = _build_reasoning_help_text(levels)
+        self.reasoning_tooltip.text = help_text
+        self.reasoning_icon_tooltip.text = help_text
 
     def reset_user_prompt(self):
         """Reset attribution user prompt to default template."""
@@ -883,8 +1061,8 @@ class AttributionWorkflowModal:
     def on_save(self):
         """Apply changes."""
         self.result = {
-            "prompt_template": self.prompt_text.get("1.0", tk.END).strip(),
-            "developer_prompt": self.dev_prompt_text.get("1.0", tk.END).strip(),
+            "prompt_template": _read_edited_text(self.prompt_text, self._initial_prompt),
+            "developer_prompt": _read_edited_text(self.dev_prompt_text, self._initial_developer_prompt),
             "thinking_level": self.thinking_var.get(),
             "model": self.model_var.get(),
             "text_verbosity": self.text_verbosity_var.get(),
@@ -907,18 +1085,31 @@ class CommentaryGeneratorApp:
         self.is_running = False
         self.thinking_level: str = "medium"  # Default thinking level
         self.text_verbosity: str = "low"  # Default verbosity level
+        self.commentary_batch_size: int = 1  # Securities per commentary request
         self.model_id: str = DEFAULT_MODEL
         self.api_key: str = ""  # API key storage
         self.api_key_source: str = "none"
+        self._api_key_future: Optional[concurrent.futures.Future] = None
+        self._pending_config_api_key: str = ""
         self.keyring_available: bool = keystore.keyring_available()
         self.sources_var = tk.StringVar(value=", ".join(get_default_preferred_sources()))
+        self._sources_validate_after_id: Optional[str] = None
 
         self._generation_loop: Optional[asyncio.AbstractEventLoop] = None
         self._cancel_event: Optional[asyncio.Event] = None
         self._cancel_requested: bool = False
         self._exit_after_cancel: bool = False
-        self._progress_queue: queue.SimpleQueue[tuple[str, int, int]] = queue.SimpleQueue()
-        self._ui_callback_queue: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+        # Worker -> Tk handoff, all guarded by _ui_updates_lock. Only the
+        # newest progress update is ever shown, so workers overwrite a single
+        # slot; UI callbacks are swapped out as one batch per drain.
+        self._ui_updates_lock = threading.Lock()
+        self._latest_progress: Optional[tuple[str, int, int]] = None
+        self._last_shown_progress: Optional[tuple[str, int, int]] = None
+        self._ui_callbacks: deque[Callable[[], None]] = deque()
+        self._generation_future: Optional[concurrent.futures.Future] = None
+        self._drain_after_id: Optional[str] = None
+        self._drain_tick_command: Optional[str] = None
+        self._last_saved_config: Optional[str] = None
 
         # Prompt template and system prompt variables
         self.prompt_text_content: str = DEFAULT_PROMPT_TEMPLATE
@@ -933,8 +1124,18 @@ class CommentaryGeneratorApp:
         # Citation and source settings
         self.require_citations: bool = True  # Default: require citations
         self.prioritize_sources: bool = True  # Default: inject source instructions into prompt
+        self.use_response_cache: bool = True  # Default: reuse identical earlier responses
         self._tooltips: list[ToolTip] = []
 
+        # Tk variables shared by setup_ui widgets and load_config, created up
+        # front so neither depends on the other having run first
+        self.output_var = tk.StringVar()
+        self.run_attribution_var = tk.BooleanVar(value=self.run_attribution_overview)
+        self.require_citations_var = tk.BooleanVar(value=self.require_citations)
+        self.prioritize_sources_var = tk.BooleanVar(value=self.prioritize_sources)
+        self.use_response_cache_var = tk.BooleanVar(value=self.use_response_cache)
+        self.global_sources_error_var = tk.StringVar()
+
         # Configure grid weights for resizing
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
@@ -943,7 +1144,6 @@ class CommentaryGeneratorApp:
         self.setup_ui()
         self.load_api_key()
         self.load_config()
-        self._schedule_progress_queue_drain()
 
         self.root.protocol("WM_DELETE_WINDOW", self.on_exit_requested)
 
@@ -957,8 +1157,9 @@ class CommentaryGeneratorApp:
             font=Typography.PRIMARY_BUTTON_FONT
         )
     
-    def _get_config_path(self) -> Path:
-        """Get the configuration directory path (platform-aware)."""
+    @cached_property
+    def config_path(self) -> Path:
+        """Configuration directory path (platform-aware), resolved once."""
         if sys.platform == "win32":
             # Windows: use APPDATA environment variable
             config_dir = Path(os.getenv("APPDATA", str(Path.home()))) / "ContribNote"
@@ -968,100 +1169,111 @@ class CommentaryGeneratorApp:
         
         return config_dir
     
-    def _get_config_file(self) -> Path:
-        """Get the full path to the config file."""
-        return self._get_config_path() / "config.json"
+    @cached_property
+    def config_file(self) -> Path:
+        """Full path to the config file."""
+        return self.config_path / "config.json"
+
+    @cached_property
+    def response_cache(self) -> "ResponseCache":
+        """On-disk cache of successful commentary responses."""
+        # Imported on first use so the cache and sqlite3 stay off the startup path
+        from src.response_cache import CACHE_FILENAME, ResponseCache
+
+        return ResponseCache(self.config_path / CACHE_FILENAME)
+
+    def clear_response_cache(self) -> None:
+        """Delete every cached commentary response."""
+        import sqlite3
+
+        try:
+            self.response_cache.clear()
+        except (OSError, sqlite3.Error) as e:
+            messagebox.showerror("Error", f"Could not clear the response cache: {e}")
+            return
+        messagebox.showinfo("Info", "Cached commentary responses were cleared.")
+
+    def _load_cached_responses(self, keys: list[str]) -> dict[str, CommentaryResult]:
+        """Look up cached responses; an unreadable cache counts as all misses."""
+        import sqlite3
+
+        try:
+            return self.response_cache.get_many(keys)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not read response cache: %s", e)
+            return {}
+
+    def _store_cached_responses(self, entries: dict[str, CommentaryResult]) -> None:
+        """Save successful responses; cache write failures never fail a run."""
+        import sqlite3
+
+        try:
+            self.response_cache.set_many(entries)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Could not write response cache: %s", e)
     
     def load_config(self) -> None:
         """Load configuration from file if it exists."""
-        config_file = self._get_config_file()
+        config_file = self.config_file
         
         if not config_file.exists():
             return  # Use defaults if no config file
         
         try:
-            with open(config_file, "r") as f:
-                config = json.load(f)
+            config = json.loads(config_file.read_bytes())
             
             # Load API key (legacy config migration)
             if "api_key" in config:
                 self._migrate_api_key_from_config(config.get("api_key", ""))
             
-            # Load prompt template
-            if "prompt_template" in config:
-                self.prompt_text_content = config["prompt_template"]
-            
-            # Load developer prompt
-            if "developer_prompt" in config:
-                self.developer_prompt_content = config["developer_prompt"]
-            
-            # Load thinking level
-            if "thinking_level" in config:
-                self.thinking_level = config["thinking_level"]
-
-            if "text_verbosity" in config:
-                self.text_verbosity = config["text_verbosity"]
-
-            if "model" in config and config["model"] in AVAILABLE_MODELS:
-                self.model_id = config["model"]
-            else:
-                self.model_id = DEFAULT_MODEL
+            # Prompts, reasoning/verbosity levels, and citation toggles
+            for key, attr in _CONFIG_FIELDS:
+                if key in config:
+                    setattr(self, attr, config[key])
+
+            # Models fall back to the default when missing or no longer offered
+            for key, attr in _CONFIG_MODEL_FIELDS:
+                model = config.get(key)
+                if not isinstance(model, str) or model not in _AVAILABLE_MODEL_SET:
+                    model = DEFAULT_MODEL
+                setattr(self, attr, model)
+
+            batch_size = config.get("commentary_batch_size")
+            if (
+                isinstance(batch_size, int)
+                and not isinstance(batch_size, bool)
+                and 1 <= batch_size <= MAX_COMMENTARY_BATCH_SIZE
+            ):
+                self.commentary_batch_size = batch_size
 
             if "run_attribution_overview" in config:
                 self.run_attribution_overview = bool(config["run_attribution_overview"])
-                if hasattr(self, "run_attribution_var"):
-                    self.run_attribution_var.set(self.run_attribution_overview)
-
-            if "attribution_prompt_template" in config:
-                self.attribution_prompt_text_content = config["attribution_prompt_template"]
-
-            if "attribution_developer_prompt" in config:
-                self.attribution_developer_prompt_content = config["attribution_developer_prompt"]
-
-            if "attribution_thinking_level" in config:
-                self.attribution_thinking_level = config["attribution_thinking_level"]
-
-            if "attribution_text_verbosity" in config:
-                self.attribution_text_verbosity = config["attribution_text_verbosity"]
-
-            if "attribution_model" in config and config["attribution_model"] in AVAILABLE_MODELS:
-                self.attribution_model_id = config["attribution_model"]
-            else:
-                self.attribution_model_id = DEFAULT_MODEL
+                self.run_attribution_var.set(self.run_attribution_overview)
             
             # Load preferred sources
-            if "preferred_sources" in config:
-                self.sources_var.set(", ".join(config["preferred_sources"]))
-            
-            # Load require_citations setting
-            if "require_citations" in config:
-                self.require_citations = config["require_citations"]
-            
-            # Load prioritize_sources setting
-            if "prioritize_sources" in config:
-                self.prioritize_sources = config["prioritize_sources"]
-
-            if hasattr(self, "require_citations_var"):
-                self.require_citations_var.set(self.require_citations)
-            if hasattr(self, "prioritize_sources_var"):
-                self.prioritize_sources_var.set(self.prioritize_sources)
-            self._refresh_global_source_errors()
+            preferred_sources = config.get("preferred_sources")
+            if preferred_sources is not None:
+                self.sources_var.set(", ".join(preferred_sources))
+
+            self.require_citations_var.set(self.require_citations)
+            self.prioritize_sources_var.set(self.prioritize_sources)
+            self.use_response_cache_var.set(self.use_response_cache)
+            self._schedule_source_errors_refresh()
             
             # Load output folder
-            if "output_folder" in config:
-                output_folder = config["output_folder"]
-                if Path(output_folder).exists():
-                    self.output_folder = Path(output_folder)
-                    self.output_var.set(output_folder)
+            output_folder = config.get("output_folder")
+            if output_folder is not None and Path(output_folder).exists():
+                self.output_folder = Path(output_folder)
+                self.output_var.set(output_folder)
         
         except Exception as e:
             # Silently fail if config load fails - use defaults
-            print(f"Warning: Could not load config: {e}")
+            logger.warning("Could not load config: %s", e)
     
     def save_config(self) -> None:
         """Save current configuration to file."""
         try:
-            config_dir = self._get_config_path()
+            config_dir = self.config_path
             config_dir.mkdir(parents=True, exist_ok=True)
             
             config = {
@@ -1070,9 +1282,11 @@ class CommentaryGeneratorApp:
                 "thinking_level": self.thinking_level,
                 "model": self.model_id,
                 "text_verbosity": self.text_verbosity,
+                "commentary_batch_size": self.commentary_batch_size,
                 "preferred_sources": [s.strip() for s in self.sources_var.get().split(",") if s.strip()],
                 "require_citations": self.require_citations,
                 "prioritize_sources": self.prioritize_sources,
+                "use_response_cache": self.use_response_cache,
                 "run_attribution_overview": self.run_attribution_overview,
                 "attribution_prompt_template": self.attribution_prompt_text_content,
                 "attribution_developer_prompt": self.attribution_developer_prompt_content,
@@ -1082,13 +1296,21 @@ class CommentaryGeneratorApp:
                 "output_folder": str(self.output_folder) if self.output_folder else ""
             }
             
-            config_file = self._get_config_file()
-            with open(config_file, "w") as f:
-                json.dump(config, f, indent=2)
+            payload = json.dumps(config, indent=2)
+            if payload == self._last_saved_config:
+                return  # nothing changed since the last save
+
+            # Write a sibling temp file and swap it in so a crash mid-write
+            # never leaves a truncated config behind
+            config_file = self.config_file
+            tmp_file = config_file.with_name(config_file.name + ".tmp")
+            tmp_file.write_bytes(payload.encode("utf-8"))
+            os.replace(tmp_file, config_file)
+            self._last_saved_config = payload
         
         except Exception as e:
             # Silently fail if config save fails
-            print(f"Warning: Could not save config: {e}")
+            logger.warning("Could not save config: %s", e)
     
     
     def setup_ui(self):
@@ -1128,7 +1350,6 @@ class CommentaryGeneratorApp:
         # Output folder
         ttk.Label(file_frame, text="Output Folder:").grid(row=1, column=0, sticky="w", padx=(0, Spacing.LABEL_GAP), pady=(Spacing.CONTROL_GAP, 0))
 
-        self.output_var = tk.StringVar()
         ttk.Entry(file_frame, textvariable=self.output_var, state="readonly").grid(
             row=1, column=1, sticky="ew", pady=(Spacing.CONTROL_GAP, 0))
         ttk.Button(file_frame, text="Browse", command=self.select_output_folder).grid(
@@ -1162,51 +1383,59 @@ class CommentaryGeneratorApp:
         ttk.Label(options_frame, text="Attribution Overview:").grid(
             row=2, column=0, sticky="w", padx=(0, Spacing.LABEL_GAP), pady=(Spacing.CONTROL_GAP, 0)
         )
-        self.run_attribution_var = tk.BooleanVar(value=self.run_attribution_overview)
         ttk.Checkbutton(
             options_frame,
             text="Run Attribution Overview",
             variable=self.run_attribution_var
         ).grid(row=2, column=1, sticky="w", pady=(Spacing.CONTROL_GAP, 0))
 
+        # Response cache toggle and clear action
+        ttk.Label(options_frame, text="Response Cache:").grid(
+            row=3, column=0, sticky="w", padx=(0, Spacing.LABEL_GAP), pady=(Spacing.CONTROL_GAP, 0)
+        )
+        cache_row = ttk.Frame(options_frame)
+        cache_row.grid(row=3, column=1, sticky="w", pady=(Spacing.CONTROL_GAP, 0))
+        use_cache_check = ttk.Checkbutton(
+            cache_row,
+            text="Reuse Cached Commentary",
+            variable=self.use_response_cache_var,
+        )
+        use_cache_check.pack(side="left")
+        use_cache_icon = _make_info_icon(cache_row)
+        use_cache_icon.pack(side="left", padx=(Spacing.CONTROL_GAP_SMALL, Spacing.BUTTON_PAD))
+        clear_cache_btn = ttk.Button(cache_row, text="Clear Cache", command=self.clear_response_cache)
+        clear_cache_btn.pack(side="left")
+
         citation_frame = ttk.LabelFrame(options_frame, text="Citation Preferences", padding=Spacing.FRAME_PADDING)
-        citation_frame.grid(row=3, column=0, columnspan=2, sticky="ew", pady=(Spacing.SECTION_MARGIN, 0))
+        citation_frame.grid(row=4, column=0, columnspan=2, sticky="ew", pady=(Spacing.SECTION_MARGIN, 0))
         citation_frame.columnconfigure(0, weight=1)
 
-        self.require_citations_var = tk.BooleanVar(value=self.require_citations)
         require_citations_check = ttk.Checkbutton(
             citation_frame,
             text="Require Citations",
             variable=self.require_citations_var
         )
-        require_citations_check.grid(row=0, column=0, sticky="w")
-        require_citations_icon = _make_info_icon(citation_frame)
-        require_citations_icon.grid(row=0, column=1, sticky="w", padx=(Spacing.CONTROL_GAP_SMALL, 0))
+        require_citations_icon = _grid_with_info_icon(require_citations_check, row=0)
 
-        self.prioritize_sources_var = tk.BooleanVar(value=self.prioritize_sources)
         prioritize_sources_check = ttk.Checkbutton(
             citation_frame,
             text="Prioritize Sources",
             variable=self.prioritize_sources_var,
         )
-        prioritize_sources_check.grid(row=1, column=0, sticky="w", pady=(Spacing.CONTROL_GAP_SMALL, 0))
-        prioritize_sources_icon = _make_info_icon(citation_frame)
-        prioritize_sources_icon.grid(
-            row=1, column=1, sticky="w", padx=(Spacing.CONTROL_GAP_SMALL, 0), pady=(Spacing.CONTROL_GAP_SMALL, 0)
+        prioritize_sources_icon = _grid_with_info_icon(
+            prioritize_sources_check, row=1, pady=(Spacing.CONTROL_GAP_SMALL, 0)
         )
 
-        ttk.Label(
-            citation_frame,
-            text="Preferred Sources (comma-separated domains):"
-        ).grid(row=2, column=0, sticky="w", pady=(Spacing.CONTROL_GAP, 0))
-        sources_label_icon = _make_info_icon(citation_frame)
-        sources_label_icon.grid(row=2, column=1, sticky="w", padx=(Spacing.CONTROL_GAP_SMALL, 0), pady=(Spacing.CONTROL_GAP, 0))
+        sources_label_icon = _grid_with_info_icon(
+            ttk.Label(citation_frame, text="Preferred Sources (comma-separated domains):"),
+            row=2,
+            pady=(Spacing.CONTROL_GAP, 0),
+        )
         sources_entry = ttk.Entry(citation_frame, textvariable=self.sources_var)
         sources_entry.grid(
             row=3, column=0, sticky="ew", pady=(Spacing.CONTROL_GAP_SMALL, 0)
         )
 
-        self.global_sources_error_var = tk.StringVar()
         ttk.Label(
             citation_frame,
             textvariable=self.global_sources_error_var,
@@ -1214,7 +1443,7 @@ class CommentaryGeneratorApp:
             foreground=Typography.ERROR_COLOR
         ).grid(row=4, column=0, sticky="w", pady=(Spacing.CONTROL_GAP_SMALL, 0))
         self.sources_var.trace_add("write", self._on_global_sources_change)
-        self._refresh_global_source_errors()
+        self._schedule_source_errors_refresh()
 
         current_row += 1
 
@@ -1288,37 +1517,65 @@ class CommentaryGeneratorApp:
         self.run_btn.pack(side="left")
 
         self._tooltips.extend([
-            ToolTip(require_citations_check, "Mark responses without citations as failed."),
-            ToolTip(require_citations_icon, "Mark responses without citations as failed."),
-            ToolTip(prioritize_sources_check, "When enabled, prompts ask the model to prioritize your preferred domains."),
-            ToolTip(prioritize_sources_icon, "When enabled, prompts ask the model to prioritize your preferred domains."),
-            ToolTip(
-                sources_entry,
-                "Comma-separated domains, e.g. reuters.com, bloomberg.com, cnbc.com. "
-                "URLs are cleaned automatically."
-            ),
-            ToolTip(
-                sources_label_icon,
-                "Comma-separated domains, e.g. reuters.com, bloomberg.com, cnbc.com. "
-                "URLs are cleaned automatically."
-            ),
-            ToolTip(contribution_settings_btn, "Edit contribution prompts plus model reasoning and verbosity."),
-            ToolTip(contribution_settings_icon, "Edit contribution prompts plus model reasoning and verbosity."),
-            ToolTip(attribution_settings_btn, "Edit attribution overview prompts plus model reasoning and verbosity."),
-            ToolTip(attribution_settings_icon, "Edit attribution overview prompts plus model reasoning and verbosity."),
-            ToolTip(api_settings_btn, "Configure your OpenAI API key."),
-            ToolTip(api_settings_icon, "Configure your OpenAI API key."),
+            ToolTip(require_citations_check, _TT_REQUIRE_CITATIONS),
+            ToolTip(require_citations_icon, _TT_REQUIRE_CITATIONS),
+            ToolTip(prioritize_sources_check, _TT_PRIORITIZE_SOURCES),
+            ToolTip(prioritize_sources_icon, _TT_PRIORITIZE_SOURCES),
+            ToolTip(use_cache_check, _TT_USE_RESPONSE_CACHE),
+            ToolTip(use_cache_icon, _TT_USE_RESPONSE_CACHE),
+            ToolTip(clear_cache_btn, _TT_CLEAR_CACHE),
+            ToolTip(sources_entry, _TT_PREFERRED_SOURCES),
+            ToolTip(sources_label_icon, _TT_PREFERRED_SOURCES),
+            ToolTip(contribution_settings_btn, _TT_CONTRIBUTION_SETTINGS),
+            ToolTip(contribution_settings_icon, _TT_CONTRIBUTION_SETTINGS),
+            ToolTip(attribution_settings_btn, _TT_ATTRIBUTION_SETTINGS),
+            ToolTip(attribution_settings_icon, _TT_ATTRIBUTION_SETTINGS),
+            ToolTip(api_settings_btn, _TT_API_SETTINGS),
+            ToolTip(api_settings_icon, _TT_API_SETTINGS),
         ])
     
     def load_api_key(self):
-        """Load API key from environment or keychain."""
+        """
+        Load API key from environment or keychain.
+
+        Keychain lookups can block (or prompt) for a noticeable time, so they
+        run on a worker thread while the window paints; _finish_api_key_load
+        applies the result, waiting for it only if a caller needs it sooner.
+        """
         env_key = os.environ.get("OPENAI_API_KEY", "")
         if env_key:
             self.api_key = env_key
             self.api_key_source = "env"
             return
 
-        keyring_key = keystore.get_api_key()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        threading.Thread(
+            target=lambda: future.set_result(keystore.get_api_key()),
+            name="api-key-load",
+            daemon=True,
+        ).start()
+        self._api_key_future = future
+        self.api_key_source = "loading"
+        self.root.after(50, self._poll_api_key_load)
+
+    def _poll_api_key_load(self) -> None:
+        """Apply the keychain lookup once it completes (Tk main thread)."""
+        future = self._api_key_future
+        if future is None:
+            return
+        if future.done():
+            self._finish_api_key_load()
+        else:
+            self.root.after(50, self._poll_api_key_load)
+
+    def _finish_api_key_load(self) -> None:
+        """Apply a pending keychain lookup, blocking until it completes."""
+        future = self._api_key_future
+        if future is None:
+            return
+        self._api_key_future = None
+
+        keyring_key = future.result()
         if keyring_key:
             self.api_key = keyring_key
             self.api_key_source = "keyring"
@@ -1326,8 +1583,17 @@ class CommentaryGeneratorApp:
             self.api_key = ""
             self.api_key_source = "none"
 
+        # load_config ran while the lookup was in flight; migrate now that the
+        # stored key is known
+        if self._pending_config_api_key:
+            config_key, self._pending_config_api_key = self._pending_config_api_key, ""
+            self._migrate_api_key_from_config(config_key)
+
     def _migrate_api_key_from_config(self, config_key: str) -> None:
         """Migrate legacy config API key into keychain when possible."""
+        if self._api_key_future is not None:
+            self._pending_config_api_key = config_key
+            return
         if self.api_key.strip():
             return
         if not config_key.strip():
@@ -1345,11 +1611,16 @@ class CommentaryGeneratorApp:
             title="Select FactSet Excel Files",
             filetypes=[("Excel Files", "*.xlsx"), ("All Files", "*.*")]
         )
+        known = set(self.input_files)
+        new_paths = []
         for file in files:
             path = Path(file)
-            if path not in self.input_files:
-                self.input_files.append(path)
-                self.input_listbox.insert(tk.END, path.name)
+            if path not in known:
+                known.add(path)
+                new_paths.append(path)
+        if new_paths:
+            self.input_files.extend(new_paths)
+            self.input_listbox.insert(tk.END, *(path.name for path in new_paths))
     
     def remove_input_files(self):
         """Remove selected input files."""
@@ -1378,26 +1649,41 @@ class CommentaryGeneratorApp:
             self.count_combo.configure(state="readonly")
 
     def _on_global_sources_change(self, *_args):
-        """Refresh inline domain validation when preferred sources change."""
-        self._refresh_global_source_errors()
+        """Refresh inline domain validation once typing pauses."""
+        if self._sources_validate_after_id is not None:
+            self.root.after_cancel(self._sources_validate_after_id)
+        self._sources_validate_after_id = self.root.after(150, self._refresh_global_source_errors)
+
+    def _schedule_source_errors_refresh(self) -> None:
+        """Validate sources once Tk is idle (after the window has painted)."""
+        if self._sources_validate_after_id is not None:
+            self.root.after_cancel(self._sources_validate_after_id)
+        self._sources_validate_after_id = self.root.after_idle(self._refresh_global_source_errors)
 
     def _refresh_global_source_errors(self) -> None:
         """Refresh the inline source validation error text."""
-        if not hasattr(self, "global_sources_error_var"):
-            return
+        # An explicit refresh supersedes any pending debounced one
+        pending_id = self._sources_validate_after_id
+        if pending_id is not None:
+            self._sources_validate_after_id = None
+            try:
+                self.root.after_cancel(pending_id)
+            except tk.TclError:
+                pass
 
-        _, errors = validate_and_clean_domains(self.sources_var.get())
-        if errors and self.sources_var.get().strip():
+        # Cached per input string; typing then deleting revisits earlier values
+        sources = self.sources_var.get()
+        _, errors = _validate_and_clean_domains_cached(sources)
+        if errors and sources.strip():
             self.global_sources_error_var.set("Errors: " + "; ".join(errors))
         else:
             self.global_sources_error_var.set("")
 
     def _sync_and_validate_global_preferences(self) -> bool:
         """Sync global UI preferences into app state and validate sources."""
-        if hasattr(self, "require_citations_var"):
-            self.require_citations = self.require_citations_var.get()
-        if hasattr(self, "prioritize_sources_var"):
-            self.prioritize_sources = self.prioritize_sources_var.get()
+        self.require_citations = self.require_citations_var.get()
+        self.prioritize_sources = self.prioritize_sources_var.get()
+        self.use_response_cache = self.use_response_cache_var.get()
 
         valid_domains, errors = validate_and_clean_domains(self.sources_var.get())
         if errors:
@@ -1423,6 +1709,7 @@ class CommentaryGeneratorApp:
             self.model_id,
             AVAILABLE_MODELS,
             self.text_verbosity,
+            self.commentary_batch_size,
         )
         self.root.wait_window(modal.window)
         
@@ -1433,6 +1720,7 @@ class CommentaryGeneratorApp:
             self.thinking_level = modal.result["thinking_level"]
             self.model_id = modal.result["model"]
             self.text_verbosity = modal.result["text_verbosity"]
+            self.commentary_batch_size = modal.result["batch_size"]
 
     def open_attribution_workflow_editor(self):
         """Open the attribution settings modal window."""
@@ -1456,6 +1744,7 @@ class CommentaryGeneratorApp:
     
     def open_settings(self):
         """Open the API settings modal window."""
+        self._finish_api_key_load()
         modal = SettingsModal(self.root, self.api_key, self.api_key_source, self.keyring_available)
         self.root.wait_window(modal.window)
         
@@ -1510,49 +1799,81 @@ class CommentaryGeneratorApp:
                 )
     
     def update_progress(self, ticker: str, completed: int, total: int):
-        """Enqueue progress updates from worker threads."""
-        self._progress_queue.put((ticker, completed, total))
+        """Record the latest progress update from a worker thread."""
+        with self._ui_updates_lock:
+            self._latest_progress = (ticker, completed, total)
 
     def _enqueue_ui_callback(self, callback: Callable[[], None]) -> None:
         """Queue a UI callback to run on the Tk main thread."""
-        self._ui_callback_queue.put(callback)
+        with self._ui_updates_lock:
+            self._ui_callbacks.append(callback)
 
-    def _schedule_progress_queue_drain(self) -> None:
-        """Drain queued progress/UI updates on the Tk main thread."""
-        latest: Optional[tuple[str, int, int]] = None
-        while True:
-            try:
-                latest = self._progress_queue.get_nowait()
-            except queue.Empty:
-                break
+    def _drain_ui_updates(self) -> bool:
+        """
+        Apply the latest progress update and run queued UI callbacks.
 
-        if latest:
+        Returns:
+            True if callbacks beyond this pass's batch are still queued.
+        """
+        with self._ui_updates_lock:
+            latest, self._latest_progress = self._latest_progress, None
+            batch_size = min(len(self._ui_callbacks), _MAX_UI_CALLBACKS_PER_DRAIN)
+            callbacks = [self._ui_callbacks.popleft() for _ in range(batch_size)]
+            has_more = bool(self._ui_callbacks)
+
+        # Skip the Tk variable writes (and label redraws) when nothing changed
+        if latest and latest != self._last_shown_progress:
+            self._last_shown_progress = latest
             ticker, completed, total = latest
             progress = (completed / total) * 100 if total > 0 else 0
             self.progress_var.set(progress)
             self.status_var.set(f"Processing: {ticker} ({completed}/{total})")
 
-        while True:
-            try:
-                callback = self._ui_callback_queue.get_nowait()
-            except queue.Empty:
-                break
+        for callback in callbacks:
             try:
                 callback()
             except Exception as callback_error:
                 print(f"UI callback error: {callback_error}")
 
-        self.root.after(100, self._schedule_progress_queue_drain)
+        return has_more
+
+    def _schedule_progress_queue_drain(self) -> None:
+        """
+        Drain queued progress/UI updates on the Tk main thread.
+
+        Re-arms every _DRAIN_INTERVAL_MS until the running generation finishes
+        and its queued callbacks have run, then goes quiet rather than waking
+        for the life of the app.
+        """
+        self._drain_after_id = None
+        # Checked before draining: once the run is done every update it will
+        # ever enqueue is already queued, so only the backlog remains.
+        future = self._generation_future
+        worker_alive = future is not None and not future.done()
+
+        has_more = self._drain_ui_updates()
+
+        if worker_alive or has_more:
+            # Batches beyond the per-pass cap wait a tick, so input and
+            # redraws are handled in between
+            self._arm_drain_tick()
+
+    def _arm_drain_tick(self) -> None:
+        """Schedule the next drain through one Tcl command kept for the app's lifetime."""
+        # root.after() registers a fresh Tcl command for every call and deletes
+        # it once it fires; the poll re-arms each tick for a whole run, so it
+        # reuses one command instead. The id must never go to after_cancel,
+        # which would delete that shared command.
+        if self._drain_tick_command is None:
+            self._drain_tick_command = self.root.register(self._schedule_progress_queue_drain)
+        self._drain_after_id = self.root.tk.call(
+            "after", _DRAIN_INTERVAL_MS, self._drain_tick_command
+        )
     
     def validate_inputs(self) -> bool:
         """Validate user inputs before running."""
-        if not self._sync_and_validate_global_preferences():
-            return False
-
-        if not self.api_key.strip():
-            messagebox.showerror("Error", "Please configure your OpenAI API key in API Settings.")
-            return False
-        
+        # Cheapest checks first: no Tk variable reads, domain parsing, or
+        # waiting on the keychain when nothing is selected yet
         if not self.input_files:
             messagebox.showerror("Error", "Please select at least one input file.")
             return False
@@ -1560,6 +1881,14 @@ class CommentaryGeneratorApp:
         if not self.output_folder:
             messagebox.showerror("Error", "Please select an output folder.")
             return False
+
+        if not self._sync_and_validate_global_preferences():
+            return False
+
+        self._finish_api_key_load()
+        if not self.api_key.strip():
+            messagebox.showerror("Error", "Please configure your OpenAI API key in API Settings.")
+            return False
         
         return True
     
@@ -1580,24 +1909,82 @@ class CommentaryGeneratorApp:
         self.run_btn.configure(state="disabled")
         self.progress_var.set(0)
         self.status_var.set("Starting...")
+        self._last_shown_progress = None
         
-        # Run in separate thread to keep UI responsive
-        thread = threading.Thread(target=self._run_generation_thread)
-        thread.daemon = True
-        thread.start()
-    
-    def _run_generation_thread(self):
-        """Run generation in a separate thread."""
-        try:
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        # Run on the background event loop to keep UI responsive; settings are
+        # read here so the worker never touches Tk variables
+        self._generation_future = asyncio.run_coroutine_threadsafe(
+            self._run_generation(self._snapshot_run_settings()), self._ensure_generation_loop()
+        )
+        if self._drain_after_id is None:
+            self._schedule_progress_queue_drain()
+
+    def _ensure_generation_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the app's background event loop, starting its thread on first use."""
+        if self._generation_loop is None:
+            # uvloop's libuv scheduler is cheaper per callback when a batch
+            # keeps many requests in flight
+            try:
+                import uvloop  # type: ignore
+            except ImportError:  # pragma: no cover - environment dependent (no uvloop on Windows)
+                loop = asyncio.new_event_loop()
+            else:
+                loop = uvloop.new_event_loop()
+
+            def run_loop() -> None:
+                asyncio.set_event_loop(loop)
+                try:
+                    loop.run_forever()
+                finally:
+                    loop.close()
+
+            threading.Thread(target=run_loop, name="generation-loop", daemon=True).start()
             self._generation_loop = loop
+        return self._generation_loop
+
+    def _stop_generation_loop(self) -> None:
+        """Stop the background event loop, if one was started."""
+        if self._generation_loop is not None:
+            self._generation_loop.call_soon_threadsafe(self._generation_loop.stop)
+            self._generation_loop = None
+
+    def _snapshot_run_settings(self) -> _RunSettings:
+        """Copy every setting a run reads, so edits made during the run cannot affect it."""
+        assert self.output_folder is not None  # validated in validate_inputs
+        return _RunSettings(
+            api_key=self.api_key.strip(),
+            input_files=tuple(self.input_files),
+            output_folder=self.output_folder,
+            selection_mode=(
+                SelectionMode.TOP_BOTTOM if self.mode_var.get() == "top_bottom" else SelectionMode.ALL_HOLDINGS
+            ),
+            count=int(self.count_var.get()),
+            preferred_sources=tuple(s.strip() for s in self.sources_var.get().split(",") if s.strip()),
+            require_citations=self.require_citations,
+            prioritize_sources=self.prioritize_sources,
+            use_response_cache=self.use_response_cache,
+            prompt_template=self.prompt_text_content,
+            developer_prompt=self.developer_prompt_content,
+            model_id=self.model_id,
+            thinking_level=self.thinking_level,
+            text_verbosity=self.text_verbosity,
+            commentary_batch_size=self.commentary_batch_size,
+            run_attribution_overview=self.run_attribution_overview,
+            attribution_prompt_template=self.attribution_prompt_text_content,
+            attribution_developer_prompt=self.attribution_developer_prompt_content,
+            attribution_model_id=self.attribution_model_id,
+            attribution_thinking_level=self.attribution_thinking_level,
+            attribution_text_verbosity=self.attribution_text_verbosity,
+        )
+
+    async def _run_generation(self, settings: _RunSettings):
+        """Run one generation on the background loop and report back to the UI."""
+        try:
             self._cancel_event = asyncio.Event()
             if self._cancel_requested:
                 self._cancel_event.set()
             
-            result = loop.run_until_complete(self._async_generate())
+            result = await self._async_generate(settings)
             
             # Update UI on main thread
             self._enqueue_ui_callback(lambda: self._on_generation_complete(result))
@@ -1609,73 +1996,82 @@ class CommentaryGeneratorApp:
         finally:
             self.is_running = False
             self._enqueue_ui_callback(lambda: self.run_btn.configure(state="normal"))
-            self._generation_loop = None
             self._cancel_event = None
     
-    async def _async_generate(self) -> dict:
-        """Async generation logic."""
+    async def _async_generate(self, settings: _RunSettings) -> dict:
+        """Async generation logic for one run's settings snapshot."""
         start_time = datetime.now()
-        errors: dict[str, list[str]] = {}
+        # Wall-clock times are for the log; the duration uses the monotonic clock
+        # so a system clock step mid-run cannot skew it
+        start_monotonic = time.monotonic()
+        api_key = settings.api_key
+        input_files = list(settings.input_files)
+        output_folder = settings.output_folder
+        cancel_event = self._cancel_event
+        require_citations = settings.require_citations
+        prioritize_sources = settings.prioritize_sources
+        errors: defaultdict[str, list[str]] = defaultdict(list)
         attribution_overview_results: Optional[dict[str, AttributionOverviewResult]] = None
         
         # Update status
         self._enqueue_ui_callback(lambda: self.status_var.set("Parsing Excel files..."))
         
-        # Parse input files
-        portfolios = parse_multiple_files(self.input_files)
+        # Parse input files (blocking work runs in worker threads so the loop
+        # keeps servicing timers and in-flight requests)
+        portfolios = await asyncio.to_thread(parse_multiple_files, input_files)
 
-        if self.run_attribution_overview:
+        if settings.run_attribution_overview:
             # Record parser-level attribution warnings in the run log only when the
             # attribution workflow is enabled for this run.
             for portfolio in portfolios:
-                for warning in portfolio.attribution_warnings:
-                    key = f"{portfolio.portcode}|ATTRIBUTION_PARSER"
-                    errors.setdefault(key, []).append(warning)
-        
-        # Determine selection mode
-        mode = SelectionMode.TOP_BOTTOM if self.mode_var.get() == "top_bottom" else SelectionMode.ALL_HOLDINGS
-        n = int(self.count_var.get())
+                if portfolio.attribution_warnings:
+                    errors[f"{portfolio.portcode}|ATTRIBUTION_PARSER"].extend(
+                        portfolio.attribution_warnings
+                    )
         
         # Process portfolios (selection/ranking)
-        selections = process_portfolios(portfolios, mode, n)
+        selections = await asyncio.to_thread(
+            process_portfolios, portfolios, settings.selection_mode, settings.count
+        )
         
         # Set up prompt manager
-        sources = [s.strip() for s in self.sources_var.get().split(",") if s.strip()]
+        sources = list(settings.preferred_sources)
         prompt_config = PromptConfig(
-            template=self.prompt_text_content,
+            template=settings.prompt_template,
             preferred_sources=sources,
-            thinking_level=self.thinking_level,
-            prioritize_sources=self.prioritize_sources
+            thinking_level=settings.thinking_level,
+            prioritize_sources=prioritize_sources
         )
         prompt_manager = PromptManager(prompt_config)
         
-        # Build all API requests
-        all_requests = []
-        
-        for selection in selections:
-            for ranked_sec in selection.ranked_securities:
-                prompt = prompt_manager.build_prompt(
+        # Build all API requests (bound method hoisted out of the loop)
+        build_prompt = prompt_manager.build_prompt
+        all_requests = [
+            {
+                "ticker": ranked_sec.ticker,
+                "security_name": ranked_sec.security_name,
+                "prompt": build_prompt(
                     ticker=ranked_sec.ticker,
                     security_name=ranked_sec.security_name,
                     period=selection.period
-                )
-                all_requests.append({
-                    "ticker": ranked_sec.ticker,
-                    "security_name": ranked_sec.security_name,
-                    "prompt": prompt,
-                    "portcode": selection.portcode
-                })
-
-        # Build attribution requests up front so progress can track all requests end-to-end.
-        attribution_requests: list[dict[str, str]] = []
-        if self.run_attribution_overview:
+                ),
+                "portcode": selection.portcode
+            }
+            for selection in selections
+            for ranked_sec in selection.ranked_securities
+        ]
+
+        # Pick attribution portfolios up front so progress can track all requests
+        # end-to-end; their prompts are formatted later, off the event loop.
+        attribution_portfolios: list[PortfolioData] = []
+        if settings.run_attribution_overview:
             attribution_overview_results = {}
 
             attribution_prompt_config = AttributionPromptConfig(
-                template=self.attribution_prompt_text_content,
+                template=settings.attribution_prompt_template,
                 preferred_sources=sources,
-                thinking_level=self.attribution_thinking_level,
-                prioritize_sources=self.prioritize_sources,
+                thinking_level=settings.attribution_thinking_level,
+                prioritize_sources=prioritize_sources,
             )
             attribution_prompt_manager = AttributionPromptManager(attribution_prompt_config)
 
@@ -1701,66 +2097,139 @@ class CommentaryGeneratorApp:
                         success=False,
                         error_message=warning_message,
                     )
-                    errors.setdefault(f"{portfolio.portcode}|ATTRIBUTION_OVERVIEW", []).append(
-                        warning_message
-                    )
+                    errors[f"{portfolio.portcode}|ATTRIBUTION_OVERVIEW"].append(warning_message)
                     continue
 
-                sector_attrib_markdown = format_attribution_table_markdown(
-                    portfolio.sector_attribution,
-                    empty_message="No sector attribution data available.",
-                )
-                country_attrib_markdown = format_attribution_table_markdown(
-                    portfolio.country_attribution,
-                    empty_message="No country attribution data available.",
-                )
-                attribution_prompt = attribution_prompt_manager.build_prompt(
-                    portcode=portfolio.portcode,
-                    period=portfolio.period,
-                    sector_attrib=sector_attrib_markdown,
-                    country_attrib=country_attrib_markdown,
-                )
-                attribution_requests.append(
-                    {
-                        "portcode": portfolio.portcode,
-                        "prompt": attribution_prompt,
-                    }
-                )
+                attribution_portfolios.append(portfolio)
 
         commentary_total = len(all_requests)
-        attribution_total = len(attribution_requests)
+        attribution_total = len(attribution_portfolios)
         overall_total = commentary_total + attribution_total
 
-        # Set up OpenAI client for security-level commentary with run-level progress totals.
-        commentary_progress_callback = _make_overall_progress_callback(
+        # One progress callback for both batches so they count into the same run total
+        progress_callback = _make_overall_progress_callback(
             update_progress_fn=self.update_progress,
-            offset=0,
             overall_total=overall_total,
         )
-        commentary_client = OpenAIClient(
-            api_key=self.api_key.strip(),
-            progress_callback=commentary_progress_callback,
-            developer_prompt=self.developer_prompt_content,
-            model=self.model_id
-        )
-        
-        # Update status
-        self._enqueue_ui_callback(
-            lambda: self.status_var.set(f"Generating commentary for {commentary_total} securities...")
-        )
-        
-        # Generate commentary (batch)
-        results = await commentary_client.generate_commentary_batch(
-            all_requests,
-            use_web_search=True,
-            thinking_level=self.thinking_level,
-            text_verbosity=self.text_verbosity,
-            require_citations=self.require_citations,
-            cancel_event=self._cancel_event
+        # Requests answered in an earlier run with identical model settings,
+        # prompts and sources are served from the response cache when it is
+        # enabled; only the misses go to the API
+        from src.response_cache import make_cache_key
+
+        cache_keys = [
+            make_cache_key(
+                model=settings.model_id,
+                thinking_level=settings.thinking_level,
+                text_verbosity=settings.text_verbosity,
+                developer_prompt=settings.developer_prompt,
+                prompt=request["prompt"],
+                preferred_sources=sources,
+                require_citations=require_citations,
+                prioritize_sources=prioritize_sources,
+            )
+            for request in all_requests
+        ]
+        cached_results = (
+            await asyncio.to_thread(self._load_cached_responses, cache_keys)
+            if settings.use_response_cache
+            else {}
         )
+        miss_requests: list[dict] = []
+        miss_keys: list[str] = []
+        for request, cache_key in zip(all_requests, cache_keys):
+            if cache_key in cached_results:
+                progress_callback(request["ticker"], 0, commentary_total)
+            else:
+                miss_requests.append(request)
+                miss_keys.append(cache_key)
+
+        # Both clients share one connection pool, so keep-alive connections
+        # and TLS sessions are reused across the two workloads, and one
+        # in-flight request limit, so running both batches together does not
+        # exceed the concurrency a single batch is allowed
+        import httpx  # Deferred with its certificate bundle until a run starts
+
+        request_limiter = asyncio.Semaphore(RateLimitConfig().max_concurrent)
+        async with httpx.AsyncClient() as http_client:
+            commentary_client = OpenAIClient(
+                api_key=api_key,
+                progress_callback=progress_callback,
+                developer_prompt=settings.developer_prompt,
+                model=settings.model_id,
+                http_client=http_client,
+                request_limiter=request_limiter,
+            )
+            batches = [
+                commentary_client.generate_commentary_batch(
+                    miss_requests,
+                    use_web_search=True,
+                    thinking_level=settings.thinking_level,
+                    text_verbosity=settings.text_verbosity,
+                    require_citations=require_citations,
+                    cancel_event=cancel_event,
+                    batch_size=settings.commentary_batch_size,
+                )
+            ]
+            status_message = f"Generating commentary for {commentary_total} securities"
+
+            # Attribution overviews are independent of commentary, so both batches
+            # run concurrently instead of back to back
+            if attribution_portfolios:
+                attribution_client = OpenAIClient(
+                    api_key=api_key,
+                    progress_callback=progress_callback,
+                    developer_prompt=settings.attribution_developer_prompt,
+                    model=settings.attribution_model_id,
+                    http_client=http_client,
+                    request_limiter=request_limiter,
+                )
 
-        if self._cancel_event and self._cancel_event.is_set():
+                async def run_attribution_batch() -> list[AttributionOverviewResult]:
+                    # Table formatting runs in a worker thread while the
+                    # commentary batch is already waiting on the network
+                    attribution_requests = await asyncio.to_thread(
+                        _build_attribution_requests,
+                        attribution_portfolios,
+                        attribution_prompt_manager,
+                    )
+                    return await attribution_client.generate_attribution_overview_batch(
+                        attribution_requests,
+                        use_web_search=True,
+                        thinking_level=settings.attribution_thinking_level,
+                        text_verbosity=settings.attribution_text_verbosity,
+                        require_citations=require_citations,
+                        cancel_event=cancel_event,
+                    )
+
+                batches.append(run_attribution_batch())
+                status_message += f" and {attribution_total} attribution overviews"
+
+            # Update status
+            self._enqueue_ui_callback(lambda: self.status_var.set(f"{status_message}..."))
+
+            # A TaskGroup cancels and awaits the sibling batch if one fails, so
+            # no request outlives the shared client closed just below
+            try:
+                async with asyncio.TaskGroup() as task_group:
+                    tasks = [task_group.create_task(batch) for batch in batches]
+            except ExceptionGroup as error_group:
+                # Surface the batch's own error rather than the group wrapper
+                raise error_group.exceptions[0]
+            fresh_results, *attribution_batches = [task.result() for task in tasks]
+
+        if cancel_event and cancel_event.is_set():
             raise asyncio.CancelledError()
+
+        if settings.use_response_cache:
+            await asyncio.to_thread(
+                self._store_cached_responses, dict(zip(miss_keys, fresh_results))
+            )
+        # Merge cache hits and fresh results back into request order
+        fresh_iter = iter(fresh_results)
+        results = [
+            cached_results[cache_key] if cache_key in cached_results else next(fresh_iter)
+            for cache_key in cache_keys
+        ]
         
         # Organize results by originating request order to avoid ticker collisions
         commentary_results, commentary_errors = _organize_commentary_results_by_request(
@@ -1768,59 +2237,34 @@ class CommentaryGeneratorApp:
             results
         )
         for key, error_list in commentary_errors.items():
-            errors.setdefault(key, []).extend(error_list)
-
-        if self.run_attribution_overview:
-            self._enqueue_ui_callback(lambda: self.status_var.set("Generating attribution overviews..."))
-            if attribution_requests:
-                attribution_progress_callback = _make_overall_progress_callback(
-                    update_progress_fn=self.update_progress,
-                    offset=commentary_total,
-                    overall_total=overall_total,
-                )
-                attribution_client = OpenAIClient(
-                    api_key=self.api_key.strip(),
-                    progress_callback=attribution_progress_callback,
-                    developer_prompt=self.attribution_developer_prompt_content,
-                    model=self.attribution_model_id,
-                )
-                attribution_results = await attribution_client.generate_attribution_overview_batch(
-                    attribution_requests,
-                    use_web_search=True,
-                    thinking_level=self.attribution_thinking_level,
-                    text_verbosity=self.attribution_text_verbosity,
-                    require_citations=self.require_citations,
-                    cancel_event=self._cancel_event,
-                )
-
-                if self._cancel_event and self._cancel_event.is_set():
-                    raise asyncio.CancelledError()
-
-                for overview_result in attribution_results:
-                    attribution_overview_results[overview_result.portcode] = overview_result
-                    if not overview_result.success:
-                        errors.setdefault(
-                            f"{overview_result.portcode}|ATTRIBUTION_OVERVIEW",
-                            []
-                        ).append(overview_result.error_message)
+            errors[key].extend(error_list)
+
+        for attribution_results in attribution_batches:
+            for overview_result in attribution_results:
+                attribution_overview_results[overview_result.portcode] = overview_result
+                if not overview_result.success:
+                    errors[f"{overview_result.portcode}|ATTRIBUTION_OVERVIEW"].append(
+                        overview_result.error_message
+                    )
         
         # Update status
         self._enqueue_ui_callback(lambda: self.status_var.set("Creating output workbook..."))
         
-        # Create output workbook (output_folder validated in validate_inputs)
-        assert self.output_folder is not None
-        output_path = create_output_workbook(
+        # Create output workbook
+        output_path = await asyncio.to_thread(
+            create_output_workbook,
             selections,
             commentary_results,
-            self.output_folder,
+            output_folder,
             attribution_overview_results=attribution_overview_results
         )
         
         # Create log file
         end_time = datetime.now()
-        log_path = create_log_file(
-            self.output_folder,
-            self.input_files,
+        log_path = await asyncio.to_thread(
+            create_log_file,
+            output_folder,
+            input_files,
             output_path,
             errors,
             start_time,
@@ -1835,7 +2279,7 @@ class CommentaryGeneratorApp:
             "total_attribution_requests": attribution_total,
             "total_requests": overall_total,
             "errors": len(errors),
-            "duration": (end_time - start_time).total_seconds()
+            "duration": time.monotonic() - start_monotonic
         }
 
     def request_cancel(self) -> None:
@@ -1849,6 +2293,7 @@ class CommentaryGeneratorApp:
     def on_exit_requested(self) -> None:
         """Handle exit requests, warning if generation is in progress."""
         if not self.is_running:
+            self._stop_generation_loop()
             self.root.destroy()
             return
 
@@ -5,14 +5,20 @@ Async client for OpenAI Responses API with web search, rate limiting,
 structured outputs, and retry logic.
 """
 
+from __future__ import annotations
+
 import asyncio
+import contextlib
 import os
 import random
+import re
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Optional, Callable
-import httpx
+from typing import TYPE_CHECKING, Optional, Callable
+
+if TYPE_CHECKING:
+    import httpx
 
 
 @dataclass
@@ -53,6 +59,18 @@ class RateLimitConfig:
     jitter_factor: float = 0.2
 
 
+# Upper bound for securities combined into one commentary request
+MAX_COMMENTARY_BATCH_SIZE = 10
+
+# Grouped commentary prompts number each security's request; the model is asked
+# to open each answer with the same marker on its own line
+_GROUPED_PROMPT_HEADER = (
+    "Answer each of the {count} numbered requests below separately. Begin each "
+    "answer on its own line with the request's marker exactly as shown "
+    "([1], [2], ...) and write nothing before the first marker."
+)
+_GROUPED_ANSWER_MARKER_RE = re.compile(r"^\[(\d+)\][ \t]*\n?", re.MULTILINE)
+
 # Default developer prompt for the LLM
 DEFAULT_DEVELOPER_PROMPT = (
     "Write a single, concise paragraph explaining the recent performance drivers "
@@ -70,7 +88,9 @@ class OpenAIClient:
         model: str = "gpt-5.2",
         rate_limit_config: Optional[RateLimitConfig] = None,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
-        developer_prompt: Optional[str] = None
+        developer_prompt: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        request_limiter: Optional[asyncio.Semaphore] = None
     ):
         """
         Initialize the OpenAI client.
@@ -81,6 +101,11 @@ class OpenAIClient:
             rate_limit_config: Rate limiting configuration
             progress_callback: Callback function(ticker, completed, total) for progress updates
             developer_prompt: System prompt for the LLM (defaults to DEFAULT_DEVELOPER_PROMPT)
+            http_client: Shared connection pool for batch calls; owned and closed
+                by the caller. When omitted each batch opens its own client.
+            request_limiter: Semaphore bounding in-flight requests, shared by
+                clients whose batches run concurrently. When omitted each batch
+                allows rate_limit_config.max_concurrent requests of its own.
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
@@ -90,6 +115,8 @@ class OpenAIClient:
         self.rate_limit = rate_limit_config or RateLimitConfig()
         self.progress_callback = progress_callback
         self.developer_prompt = developer_prompt or DEFAULT_DEVELOPER_PROMPT
+        self.http_client = http_client
+        self.request_limiter = request_limiter
         self.base_url = "https://api.openai.com/v1"
         
         # Request tracking (for PII protection)
@@ -102,6 +129,21 @@ class OpenAIClient:
         self._key_mapping[api_key] = internal_key
         return api_key
     
+    def _batch_request_limiter(self) -> asyncio.Semaphore:
+        """Return the in-flight request bound for one batch, reusing the shared one if set."""
+        if self.request_limiter is not None:
+            return self.request_limiter
+        return asyncio.Semaphore(self.rate_limit.max_concurrent)
+
+    def _batch_http_client(self) -> contextlib.AbstractAsyncContextManager[httpx.AsyncClient]:
+        """Return the HTTP client context for one batch, reusing the shared pool if set."""
+        if self.http_client is not None:
+            # Leave the caller's client open for the next batch
+            return contextlib.nullcontext(self.http_client)
+        import httpx  # Deferred: httpx and its certificate bundle are slow to import
+
+        return httpx.AsyncClient()
+
     def _calculate_backoff(self, attempt: int) -> float:
         """Calculate backoff time with jitter."""
         backoff = min(
@@ -173,6 +215,105 @@ class OpenAIClient:
         
         return text.strip()
 
+    @staticmethod
+    def _build_grouped_prompt(prompts: list[str]) -> str:
+        """Combine several commentary prompts into one numbered request."""
+        numbered = "\n\n".join(f"[{index}]\n{prompt}" for index, prompt in enumerate(prompts, 1))
+        return f"{_GROUPED_PROMPT_HEADER.format(count=len(prompts))}\n\n{numbered}"
+
+    @staticmethod
+    def _extract_output_text(response: dict) -> tuple[str, list[dict]]:
+        """
+        Join a response's text blocks, keeping annotation offsets valid.
+
+        Returns:
+            Tuple of (text, annotations) where each annotation's start/end index
+            is relative to the joined text.
+        """
+        text_parts: list[str] = []
+        annotations: list[dict] = []
+        offset = 0
+        for item in response.get("output", []):
+            if item.get("type") != "message":
+                continue
+            for content_item in item.get("content", []):
+                if content_item.get("type") not in {"output_text", "text"}:
+                    continue
+                text_value = content_item.get("text", "")
+                if not isinstance(text_value, str) or not text_value:
+                    continue
+                if text_parts:
+                    offset += 2  # "\n\n" separator
+                item_annotations = content_item.get("annotations", [])
+                if isinstance(item_annotations, list):
+                    for ann in item_annotations:
+                        if isinstance(ann, dict):
+                            shifted = dict(ann)
+                            shifted["start_index"] = ann.get("start_index", 0) + offset
+                            shifted["end_index"] = ann.get("end_index", 0) + offset
+                            annotations.append(shifted)
+                text_parts.append(text_value)
+                offset += len(text_value)
+
+        if not text_parts:
+            top_level_text = response.get("output_text", "")
+            return (top_level_text if isinstance(top_level_text, str) else ""), []
+        return "\n\n".join(text_parts), annotations
+
+    def _split_grouped_response(self, response: dict, count: int) -> Optional[list[dict]]:
+        """
+        Split a grouped commentary response into one response per request.
+
+        Each part is shaped like a single-request response so _parse_response
+        handles citations and cleanup unchanged.
+
+        Returns:
+            Per-request responses in request order, or None if the answer does
+            not carry exactly the markers [1]..[count] in order.
+        """
+        text, annotations = self._extract_output_text(response)
+        markers = list(_GROUPED_ANSWER_MARKER_RE.finditer(text))
+        if [int(marker.group(1)) for marker in markers] != list(range(1, count + 1)):
+            return None
+
+        parts = []
+        for index, marker in enumerate(markers):
+            start = marker.end()
+            end = markers[index + 1].start() if index + 1 < count else len(text)
+            part_annotations = []
+            for ann in annotations:
+                if start <= ann["start_index"] < end:
+                    shifted = dict(ann)
+                    shifted["start_index"] -= start
+                    shifted["end_index"] -= start
+                    part_annotations.append(shifted)
+            parts.append({
+                "id": response.get("id", "unknown"),
+                "status": response.get("status", "unknown"),
+                "output": [{
+                    "type": "message",
+                    "content": [{
+                        "type": "output_text",
+                        "text": text[start:end],
+                        "annotations": part_annotations,
+                    }],
+                }],
+            })
+        return parts
+
+    @staticmethod
+    def _finalize_commentary_result(
+        result: CommentaryResult,
+        request_key: str,
+        require_citations: bool
+    ) -> CommentaryResult:
+        """Attach the request key and enforce the citation requirement."""
+        result.request_key = request_key
+        if require_citations and result.success and not result.citations:
+            result.success = False
+            result.error_message = "No citations found in response (citations are required)"
+        return result
+
     async def _poll_response_status(
         self,
         client: httpx.AsyncClient,
@@ -195,6 +336,8 @@ class OpenAIClient:
         Returns:
             Final API response as dict
         """
+        import httpx
+
         start = time.monotonic()
         while True:
             if cancel_event and cancel_event.is_set():
@@ -289,6 +432,8 @@ class OpenAIClient:
         }
         timeout = timeout_map.get(thinking_level, 300.0)
         
+        import httpx
+
         max_retries = 5
         for attempt in range(max_retries):
             try:
@@ -509,14 +654,7 @@ class OpenAIClient:
                     cancel_event=cancel_event
                 )
                 result = self._parse_response(response, ticker, security_name)
-                result.request_key = request_key
-                
-                # Validate citations are present (only if required)
-                if require_citations and result.success and not result.citations:
-                    result.success = False
-                    result.error_message = "No citations found in response (citations are required)"
-                
-                return result
+                return self._finalize_commentary_result(result, request_key, require_citations)
                 
             except Exception as e:
                 return CommentaryResult(
@@ -532,9 +670,89 @@ class OpenAIClient:
         if client is not None:
             return await _do_request(client)
         else:
+            import httpx
+
             async with httpx.AsyncClient() as new_client:
                 return await _do_request(new_client)
     
+    async def _generate_commentary_group(
+        self,
+        requests: list[dict],
+        use_web_search: bool,
+        thinking_level: str,
+        text_verbosity: str,
+        require_citations: bool,
+        client: httpx.AsyncClient,
+        cancel_event: Optional[asyncio.Event] = None
+    ) -> Optional[list[CommentaryResult]]:
+        """
+        Generate commentary for several securities with one API request.
+        
+        Args:
+            requests: Batch request dicts (ticker, security_name, prompt, portcode)
+            use_web_search: Whether to enable web search
+            thinking_level: Reasoning effort level ("none", "low", "medium", "high", "xhigh")
+            text_verbosity: Text verbosity ("low", "medium", "high")
+            require_citations: Whether to require citations in each result
+            client: httpx client for connection pooling
+            
+        Returns:
+            One CommentaryResult per request in order, or None if the response
+            could not be split per security (callers retry one by one).
+        """
+        try:
+            response = await self._make_request(
+                client,
+                self._build_grouped_prompt([req["prompt"] for req in requests]),
+                use_web_search=use_web_search,
+                thinking_level=thinking_level,
+                text_verbosity=text_verbosity,
+                cancel_event=cancel_event
+            )
+        except Exception as e:
+            return [
+                CommentaryResult(
+                    ticker=req["ticker"],
+                    security_name=req["security_name"],
+                    commentary="",
+                    citations=[],
+                    success=False,
+                    error_message=f"API request failed: {str(e)}",
+                    request_key=(
+                        self._generate_request_key(req["portcode"], req["ticker"])
+                        if req.get("portcode") else ""
+                    )
+                )
+                for req in requests
+            ]
+
+        parts = self._split_grouped_response(response, len(requests))
+        if parts is None:
+            return None
+
+        results = []
+        for req, part in zip(requests, parts):
+            portcode = req.get("portcode", "")
+            request_key = self._generate_request_key(portcode, req["ticker"]) if portcode else ""
+            result = self._parse_response(part, req["ticker"], req["security_name"])
+            results.append(self._finalize_commentary_result(result, request_key, require_citations))
+        return results
+
+    @staticmethod
+    def _group_commentary_requests(requests: list[dict], batch_size: int) -> list[list[dict]]:
+        """Chunk consecutive requests from the same portfolio into groups of at most batch_size."""
+        groups: list[list[dict]] = []
+        for req in requests:
+            if (
+                groups
+                and len(groups[-1]) < batch_size
+                and groups[-1][0].get("portcode", "") == req.get("portcode", "")
+            ):
+                groups[-1].append(req)
+            else:
+                groups.append([req])
+        return groups
+
     async def generate_commentary_batch(
         self,
         requests: list[dict],
@@ -542,7 +760,8 @@ class OpenAIClient:
         thinking_level: str = "medium",
         text_verbosity: str = "low",
         require_citations: bool = True,
-        cancel_event: Optional[asyncio.Event] = None
+        cancel_event: Optional[asyncio.Event] = None,
+        batch_size: int = 1
     ) -> list[CommentaryResult]:
         """
         Generate commentary for multiple securities with bounded concurrency.
@@ -553,17 +772,29 @@ class OpenAIClient:
             thinking_level: Reasoning effort level ("none", "low", "medium", "high", "xhigh")
             text_verbosity: Text verbosity ("low", "medium", "high")
             require_citations: Whether to require citations in responses
+            batch_size: Securities from the same portfolio combined into one API
+                request (1 sends one request per security)
             
         Returns:
             List of CommentaryResult objects
         """
-        semaphore = asyncio.Semaphore(self.rate_limit.max_concurrent)
+        semaphore = self._batch_request_limiter()
         results = []
         completed = 0
         total = len(requests)
-        
-        async def process_with_semaphore(req: dict, index: int, client: httpx.AsyncClient) -> CommentaryResult:
+        batch_size = max(1, min(batch_size, MAX_COMMENTARY_BATCH_SIZE))
+
+        def report_progress(req: dict) -> None:
             nonlocal completed
+            completed += 1
+            if self.progress_callback:
+                try:
+                    self.progress_callback(req["ticker"], completed, total)
+                except Exception as callback_error:
+                    # Progress reporting must never fail the request path.
+                    print(f"Progress callback error for {req['ticker']}: {callback_error}")
+        
+        async def process_with_semaphore(req: dict, client: httpx.AsyncClient) -> CommentaryResult:
             async with semaphore:
                 result = await self.generate_commentary(
                     ticker=req["ticker"],
@@ -577,14 +808,27 @@ class OpenAIClient:
                     client=client,
                     cancel_event=cancel_event
                 )
-                completed += 1
-                if self.progress_callback:
-                    try:
-                        self.progress_callback(req["ticker"], completed, total)
-                    except Exception as callback_error:
-                        # Progress reporting must never fail the request path.
-                        print(f"Progress callback error for {req['ticker']}: {callback_error}")
+                report_progress(req)
                 return result
+
+        async def process_group(group: list[dict], client: httpx.AsyncClient) -> list[CommentaryResult]:
+            if len(group) > 1:
+                async with semaphore:
+                    group_results = await self._generate_commentary_group(
+                        group,
+                        use_web_search=use_web_search,
+                        thinking_level=thinking_level,
+                        text_verbosity=text_verbosity,
+                        require_citations=require_citations,
+                        client=client,
+                        cancel_event=cancel_event
+                    )
+                if group_results is not None:
+                    for req in group:
+                        report_progress(req)
+                    return group_results
+                # Answer was not split per security; fall back to one request each
+            return list(await asyncio.gather(*(process_with_semaphore(req, client) for req in group)))
         
         async def _cancel_watcher(tasks: list[asyncio.Task]) -> None:
             if not cancel_event:
@@ -594,10 +838,11 @@ class OpenAIClient:
                 if not task.done():
                     task.cancel()
 
-        async with httpx.AsyncClient() as client:
+        groups = self._group_commentary_requests(requests, batch_size)
+        async with self._batch_http_client() as client:
             tasks = [
-                asyncio.create_task(process_with_semaphore(req, i, client))
-                for i, req in enumerate(requests)
+                asyncio.create_task(process_group(group, client))
+                for group in groups
             ]
             watcher = asyncio.create_task(_cancel_watcher(tasks)) if cancel_event else None
             try:
@@ -609,21 +854,23 @@ class OpenAIClient:
         if cancel_event and cancel_event.is_set():
             raise asyncio.CancelledError()
         
-        # Convert any exceptions to error results
+        # Flatten groups back to request order, converting exceptions to error results
         final_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                req = requests[i]
-                final_results.append(CommentaryResult(
-                    ticker=req["ticker"],
-                    security_name=req["security_name"],
-                    commentary="",
-                    citations=[],
-                    success=False,
-                    error_message=str(result)
-                ))
+        for group, group_results in zip(groups, results):
+            if isinstance(group_results, Exception):
+                final_results.extend(
+                    CommentaryResult(
+                        ticker=req["ticker"],
+                        security_name=req["security_name"],
+                        commentary="",
+                        citations=[],
+                        success=False,
+                        error_message=str(group_results)
+                    )
+                    for req in group
+                )
             else:
-                final_results.append(result)
+                final_results.extend(group_results)
         
         return final_results
 
@@ -694,6 +941,8 @@ class OpenAIClient:
 
         if client is not None:
             return await _do_request(client)
+        import httpx
+
         async with httpx.AsyncClient() as new_client:
             return await _do_request(new_client)
 
@@ -720,7 +969,7 @@ class OpenAIClient:
         Returns:
             List of AttributionOverviewResult objects
         """
-        semaphore = asyncio.Semaphore(self.rate_limit.max_concurrent)
+        semaphore = self._batch_request_limiter()
         completed = 0
         total = len(requests)
 
@@ -754,7 +1003,7 @@ class OpenAIClient:
                 if not task.done():
                     task.cancel()
 
-        async with httpx.AsyncClient() as client:
+        async with self._batch_http_client() as client:
             tasks = [
                 asyncio.create_task(process_with_semaphore(req, client))
                 for req in requests
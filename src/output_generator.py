@@ -9,10 +9,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import openpyxl
-from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-from openpyxl.utils import get_column_letter
-
 from .selection_engine import SelectionResult
 from .openai_client import CommentaryResult, Citation, AttributionOverviewResult
 
@@ -115,6 +111,12 @@ def create_output_workbook(
     Returns:
         Path to the created workbook
     """
+    # Imported here so launching the GUI does not pay openpyxl's import cost;
+    # the first workbook write does instead.
+    import openpyxl
+    from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
+    from openpyxl.utils import get_column_letter
+
     # Generate filename
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M")
     filename = f"ContributorDetractorCommentary_{timestamp}.xlsx"
@@ -5,6 +5,7 @@ Manages prompt templates for LLM requests with variable interpolation.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 
@@ -59,6 +60,24 @@ Requirements:
 DEFAULT_ATTRIBUTION_DEVELOPER_PROMPT = """Write a single cohesive paragraph that explains portfolio-level attribution in clear client-facing language. Keep the analysis factual, focused on material drivers, and grounded in the provided sector and country attribution inputs. Avoid speculation, section labels, and note-style add-ons, and keep the prose continuous rather than segmented. Never fabricate exact portfolio, benchmark, sector, or country performance figures."""
 
 
+@lru_cache(maxsize=32)
+def _render_source_instructions(preferred_sources: tuple[str, ...], prioritize_sources: bool) -> str:
+    """
+    Render the source instructions block for a sources/prioritization pair.
+
+    Every prompt in a run shares the same pair, so the block is formatted once
+    and reused instead of re-joined and re-formatted for each security.
+    """
+    # Return empty string if source prioritization is disabled
+    if not prioritize_sources:
+        return ""
+
+    if preferred_sources:
+        sources_str = ", ".join(preferred_sources)
+        return SOURCE_INSTRUCTIONS_WITH_PRIORITY.format(preferred_sources=sources_str)
+    return SOURCE_INSTRUCTIONS_DEFAULT
+
+
 @dataclass
 class PromptConfig:
     """Configuration for prompt generation."""
@@ -93,14 +112,9 @@ class PromptManager:
     
     def get_source_instructions(self) -> str:
         """Generate source instructions based on configuration."""
-        # Return empty string if source prioritization is disabled
-        if not self.config.prioritize_sources:
-            return ""
-        
-        if self.config.preferred_sources:
-            sources_str = ", ".join(self.config.preferred_sources)
-            return SOURCE_INSTRUCTIONS_WITH_PRIORITY.format(preferred_sources=sources_str)
-        return SOURCE_INSTRUCTIONS_DEFAULT
+        return _render_source_instructions(
+            tuple(self.config.preferred_sources), self.config.prioritize_sources
+        )
     
     def build_prompt(
         self,
@@ -167,12 +181,9 @@ class AttributionPromptManager:
 
     def get_source_instructions(self) -> str:
         """Generate source instructions based on configuration."""
-        if not self.config.prioritize_sources:
-            return ""
-        if self.config.preferred_sources:
-            sources_str = ", ".join(self.config.preferred_sources)
-            return SOURCE_INSTRUCTIONS_WITH_PRIORITY.format(preferred_sources=sources_str)
-        return SOURCE_INSTRUCTIONS_DEFAULT
+        return _render_source_instructions(
+            tuple(self.config.preferred_sources), self.config.prioritize_sources
+        )
 
     def build_prompt(
         self,
@@ -0,0 +1,144 @@
+"""
+Persistent cache of successful commentary responses.
+
+Entries live in a small SQLite file next to the app config and are keyed on
+everything that shapes a response (model, reasoning settings, prompts and
+sources), so a rerun with identical inputs skips the API call entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+from contextlib import closing
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterable
+
+from .openai_client import Citation, CommentaryResult
+
+
+CACHE_FILENAME = "response_cache.sqlite3"
+
+# Cached responses expire after a week so stale market commentary ages out
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS responses ("
+    "key TEXT PRIMARY KEY, payload TEXT NOT NULL, expires REAL NOT NULL)"
+)
+
+
+def make_cache_key(
+    model: str,
+    thinking_level: str,
+    text_verbosity: str,
+    developer_prompt: str,
+    prompt: str,
+    preferred_sources: Iterable[str],
+    require_citations: bool,
+    prioritize_sources: bool = False,
+) -> str:
+    """
+    Build the cache key for one commentary request.
+
+    The inputs are serialized as canonical JSON and hashed with BLAKE2b, so
+    keys are fixed-length and never store prompt text in the clear.
+    """
+    canonical = json.dumps(
+        [
+            model,
+            thinking_level,
+            text_verbosity,
+            developer_prompt,
+            prompt,
+            sorted(preferred_sources),
+            require_citations,
+            prioritize_sources,
+        ],
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _result_to_payload(result: CommentaryResult) -> str:
+    data = asdict(result)
+    # Request keys are per-run obfuscation tokens and must not be replayed
+    data.pop("request_key", None)
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _payload_to_result(payload: str) -> CommentaryResult:
+    data = json.loads(payload)
+    data["citations"] = [Citation(**citation) for citation in data.get("citations", [])]
+    return CommentaryResult(**data)
+
+
+class ResponseCache:
+    """
+    On-disk cache of successful CommentaryResult objects.
+
+    Each operation opens its own short-lived connection, so the cache can be
+    used from worker threads without sharing SQLite handles across threads.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.execute(_SCHEMA)
+        return conn
+
+    def get_many(self, keys: list[str]) -> dict[str, CommentaryResult]:
+        """Return unexpired cached results for the given keys."""
+        if not keys:
+            return {}
+        now = time.time()
+        found: dict[str, CommentaryResult] = {}
+        with closing(self._connect()) as conn:
+            unique_keys = list(dict.fromkeys(keys))
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(unique_keys), 500):
+                chunk = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT key, payload FROM responses "
+                    f"WHERE key IN ({placeholders}) AND expires > ?",
+                    (*chunk, now),
+                )
+                for key, payload in rows:
+                    try:
+                        found[key] = _payload_to_result(payload)
+                    except (TypeError, ValueError):
+                        continue  # Unreadable entry; treat as a miss
+        return found
+
+    def set_many(self, entries: dict[str, CommentaryResult]) -> None:
+        """Store successful results; failed results are never cached."""
+        rows = [
+            (key, _result_to_payload(result), time.time() + self.ttl_seconds)
+            for key, result in entries.items()
+            if result.success
+        ]
+        if not rows:
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO responses (key, payload, expires) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        if not self.path.exists():
+            return
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM responses")
+
@@ -4,6 +4,7 @@ Tests for the Excel Parser Module.
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
+from src import excel_parser
 from src.excel_parser import (
     SecurityRow,
     AttributionRow,
@@ -13,6 +14,7 @@ from src.excel_parser import (
     format_attribution_table_markdown,
     parse_excel_file,
     parse_multiple_files,
+    _read_outline_levels,
 )
 
 
@@ -76,6 +78,14 @@ class TestSecurityRow:
         )
         assert row.is_cash_or_fee() is False
 
+    def test_security_row_is_immutable(self):
+        """Should reject attribute assignment on parsed rows."""
+        import dataclasses
+
+        row = SecurityRow("AAPL", "Apple Inc.", 5.25, 0.15, "Information Technology")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            row.ticker = "MSFT"
+
 
 # --- PortfolioData Tests ---
 
@@ -176,75 +186,60 @@ class TestExtractPortcodeFromFilename:
 class TestParseExcelFile:
     """Tests for the parse_excel_file function using mocked openpyxl."""
 
+    @pytest.fixture(autouse=True)
+    def _use_openpyxl_reader(self, monkeypatch):
+        """The mocks stand in for openpyxl workbooks, so bypass calamine."""
+        monkeypatch.setattr(excel_parser, "_CALAMINE_AVAILABLE", False)
+
+    def _mock_iter_rows(self, rows_by_number, width):
+        """Build an iter_rows side effect yielding padded value tuples."""
+        def iter_rows_side_effect(min_row=1, max_row=None, values_only=False, **kwargs):
+            last_row = max(rows_by_number, default=0)
+            end_row = last_row if max_row is None else min(max_row, last_row)
+            for row_num in range(min_row, end_row + 1):
+                values = list(rows_by_number.get(row_num, ()))
+                values.extend([None] * (width - len(values)))
+                yield tuple(values)
+        return iter_rows_side_effect
+
     def _create_mock_worksheet(self, period, headers, data_rows):
         """Helper to create a mock worksheet with specified data."""
         ws = MagicMock()
         ws.max_column = len(headers) + 1
-        
-        def cell_side_effect(row, column):
-            cell = MagicMock()
-            if row == 6 and column == 1:
-                cell.value = period
-            elif row == 7:
-                # Headers in row 7
-                if 1 <= column <= len(headers):
-                    cell.value = headers[column - 1]
-                else:
-                    cell.value = None
-            elif row >= 10:
-                # Data rows
-                data_row_idx = row - 10
-                if data_row_idx < len(data_rows):
-                    if 1 <= column <= len(data_rows[data_row_idx]):
-                        cell.value = data_rows[data_row_idx][column - 1]
-                    else:
-                        cell.value = None
-                else:
-                    cell.value = None
-            else:
-                cell.value = None
-            return cell
-        
-        ws.cell = MagicMock(side_effect=cell_side_effect)
+
+        rows_by_number = {6: (period,), 7: tuple(headers)}
+        for offset, data_row in enumerate(data_rows):
+            rows_by_number[10 + offset] = tuple(data_row)
+        ws.iter_rows = MagicMock(
+            side_effect=self._mock_iter_rows(rows_by_number, ws.max_column)
+        )
         return ws
 
     def _create_mock_attribution_worksheet(self, headers, rows, outline_levels):
         """Helper to create a mock attribution worksheet with outline levels."""
         ws = MagicMock()
         ws.max_column = len(headers) + 1
-        ws.max_row = max(rows.keys()) if rows else 10
-
-        row_dimensions = {}
-        for row_num in range(1, ws.max_row + 1):
-            dim = MagicMock()
-            dim.outlineLevel = outline_levels.get(row_num, 0)
-            row_dimensions[row_num] = dim
-        ws.row_dimensions = row_dimensions
-
-        def cell_side_effect(row, column):
-            cell = MagicMock()
-            if row == 7:
-                if 2 <= column <= len(headers) + 1:
-                    cell.value = headers[column - 2]
-                else:
-                    cell.value = None
-            elif row in rows:
-                row_values = rows[row]
-                if column == 1:
-                    cell.value = row_values.get("category")
-                else:
-                    idx = column - 2
-                    if 0 <= idx < len(headers):
-                        cell.value = row_values.get(headers[idx])
-                    else:
-                        cell.value = None
-            else:
-                cell.value = None
-            return cell
-
-        ws.cell = MagicMock(side_effect=cell_side_effect)
+        # Read by the patched _read_outline_levels (see _patch_outline_levels).
+        ws.outline_levels = outline_levels
+
+        rows_by_number = {7: (None, *headers)}
+        for row_num, row_values in rows.items():
+            rows_by_number[row_num] = (
+                row_values.get("category"),
+                *(row_values.get(header) for header in headers),
+            )
+        ws.iter_rows = MagicMock(
+            side_effect=self._mock_iter_rows(rows_by_number, ws.max_column)
+        )
         return ws
 
+    def _patch_outline_levels(self, mock_wb):
+        """Serve outline levels from the mock attribution worksheets."""
+        return patch(
+            "src.excel_parser._read_outline_levels",
+            side_effect=lambda _path, sheet_name, **_kwargs: mock_wb[sheet_name].outline_levels,
+        )
+
     def test_parse_valid_excel_file(self):
         """Should parse a valid Excel file correctly."""
         headers = ["Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
@@ -264,7 +259,7 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
         
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
         
         assert result.portcode == "TEST"
@@ -274,16 +269,20 @@ class TestParseExcelFile:
         assert result.securities[0].security_name == "Apple Inc."
         assert result.securities[0].port_ending_weight == 5.25
         assert result.securities[0].contribution_to_return == 0.15
+        # Rows are streamed; per-cell random access is never used
+        mock_ws.cell.assert_not_called()
 
     def test_parse_file_missing_sheet_raises_error(self):
         """Should raise ValueError if required sheet is missing."""
         mock_wb = MagicMock()
         mock_wb.sheetnames = ["OtherSheet"]
         
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             with pytest.raises(ValueError, match="Required sheet 'ContributionMasterRisk' not found"):
                 parse_excel_file(Path("test.xlsx"))
 
+        mock_wb.close.assert_called_once()
+
     def test_parse_file_missing_period_raises_error(self):
         """Should raise ValueError if period is missing from row 6."""
         mock_ws = self._create_mock_worksheet(
@@ -296,7 +295,7 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
         
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             with pytest.raises(ValueError, match="Period not found in row 6"):
                 parse_excel_file(Path("test.xlsx"))
 
@@ -314,7 +313,7 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
         
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             with pytest.raises(ValueError, match="Missing required columns"):
                 parse_excel_file(Path("test.xlsx"))
 
@@ -336,13 +335,37 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
         
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
         
         # Invalid values should default to 0.0
         assert result.securities[0].port_ending_weight == 0.0
         assert result.securities[0].contribution_to_return == 0.0
 
+    def test_parse_file_parses_numeric_text_values(self):
+        """Should parse numeric text, including thousands separators."""
+        headers = ["Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
+        data_rows = [
+            ["Apple Inc.", "AAPL", "1,234.5", " -0.25 ", "Tech"],
+            [None, None, None, None, None],
+        ]
+
+        mock_ws = self._create_mock_worksheet(
+            period="12/31/2025 to 1/28/2026",
+            headers=headers,
+            data_rows=data_rows
+        )
+
+        mock_wb = MagicMock()
+        mock_wb.sheetnames = ["ContributionMasterRisk"]
+        mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
+
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
+            result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
+
+        assert result.securities[0].port_ending_weight == 1234.5
+        assert result.securities[0].contribution_to_return == -0.25
+
     def test_parse_file_stops_at_blank_ticker(self):
         """Should stop reading at first blank ticker row."""
         headers = ["Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
@@ -362,7 +385,7 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
         
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
         
         assert len(result.securities) == 1
@@ -386,7 +409,7 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
 
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
 
         assert len(result.securities) == 1
@@ -410,12 +433,69 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
 
-        with patch('src.excel_parser.openpyxl.load_workbook', return_value=mock_wb):
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
 
         assert len(result.securities) == 1
         assert result.securities[0].security_name == "Apple Inc."
 
+    def test_parse_skip_cash_fees_drops_rows_while_parsing(self):
+        """Should omit cash/fee rows only when skip_cash_fees is set."""
+        headers = ["Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
+        data_rows = [
+            ["Apple Inc.", "AAPL", 5.25, 0.15, "Information Technology"],
+            ["Cash", "CASH_USD", 1.0, 0.0, "NA"],
+            ["Fees", "FEES", 0.0, -0.01, "--"],
+            [None, None, None, None, None],
+        ]
+
+        mock_ws = self._create_mock_worksheet(
+            period="12/31/2025 to 1/28/2026",
+            headers=headers,
+            data_rows=data_rows
+        )
+
+        mock_wb = MagicMock()
+        mock_wb.sheetnames = ["ContributionMasterRisk"]
+        mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
+
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
+            full = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
+            skipped = parse_excel_file(
+                Path("TEST_12312025_01282026.xlsx"), skip_cash_fees=True
+            )
+
+        assert [s.ticker for s in full.securities] == ["AAPL", "CASH_USD", "FEES"]
+        assert [s.ticker for s in skipped.securities] == ["AAPL"]
+        assert skipped.get_filtered_securities() == full.get_filtered_securities()
+
+    def test_parse_header_scan_stops_once_all_columns_found(self):
+        """Headers repeated after the five known columns should be ignored."""
+        headers = [
+            "Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS",
+            "Ticker", "GICS",
+        ]
+        data_rows = [
+            ["Apple Inc.", "AAPL", 5.25, 0.15, "Information Technology", "IGNORED", "IGNORED"],
+            [None, None, None, None, None, None, None],
+        ]
+
+        mock_ws = self._create_mock_worksheet(
+            period="12/31/2025 to 1/28/2026",
+            headers=headers,
+            data_rows=data_rows
+        )
+
+        mock_wb = MagicMock()
+        mock_wb.sheetnames = ["ContributionMasterRisk"]
+        mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
+
+        with patch('openpyxl.load_workbook', return_value=mock_wb):
+            result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
+
+        assert result.securities[0].ticker == "AAPL"
+        assert result.securities[0].gics == "Information Technology"
+
     def test_parse_attribution_sector_top_level_and_total(self):
         """Should parse highest-level grouped rows and include total."""
         contrib_headers = ["Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
@@ -491,7 +571,8 @@ class TestParseExcelFile:
             }[name]
         )
 
-        with patch("src.excel_parser.openpyxl.load_workbook", return_value=mock_wb):
+        with patch("openpyxl.load_workbook", return_value=mock_wb), \
+                self._patch_outline_levels(mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
 
         assert result.sector_attribution is not None
@@ -507,6 +588,7 @@ class TestParseExcelFile:
         ]
         assert result.sector_attribution.total_row is not None
         assert result.sector_attribution.total_row.category == "Total"
+        attrib_ws.cell.assert_not_called()
         assert any("Missing optional attribution tab 'AttributionbyCountryMasterRisk'" in w for w in result.attribution_warnings)
 
     def test_parse_attribution_country_retains_first_top_level_row(self):
@@ -585,7 +667,8 @@ class TestParseExcelFile:
             }[name]
         )
 
-        with patch("src.excel_parser.openpyxl.load_workbook", return_value=mock_wb):
+        with patch("openpyxl.load_workbook", return_value=mock_wb), \
+                self._patch_outline_levels(mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
 
         assert result.country_attribution is not None
@@ -616,7 +699,7 @@ class TestParseExcelFile:
         mock_wb.sheetnames = ["ContributionMasterRisk"]
         mock_wb.__getitem__ = MagicMock(return_value=mock_ws)
 
-        with patch("src.excel_parser.openpyxl.load_workbook", return_value=mock_wb):
+        with patch("openpyxl.load_workbook", return_value=mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
 
         assert result.sector_attribution is None
@@ -655,7 +738,8 @@ class TestParseExcelFile:
             }[name]
         )
 
-        with patch("src.excel_parser.openpyxl.load_workbook", return_value=mock_wb):
+        with patch("openpyxl.load_workbook", return_value=mock_wb), \
+                self._patch_outline_levels(mock_wb):
             result = parse_excel_file(Path("TEST_12312025_01282026.xlsx"))
 
         assert result.sector_attribution is not None
@@ -667,6 +751,70 @@ class TestParseExcelFile:
         assert any("Total row not found" in w for w in result.attribution_warnings)
 
 
+class TestWorkbookReaders:
+    """Tests that the calamine and openpyxl readers produce the same data."""
+
+    def test_calamine_matches_openpyxl(self, tmp_path, monkeypatch):
+        """Should parse identical portfolios with either reader."""
+        pytest.importorskip("python_calamine")
+        import openpyxl
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "ContributionMasterRisk"
+        ws.cell(row=6, column=1, value="12/31/2025 to 1/28/2026")
+        headers = ["Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
+        for col, header in enumerate(headers, start=1):
+            ws.cell(row=7, column=col, value=header)
+        for col, value in enumerate(["Toyota Motor", 7203, 5, 0.25, 251020], start=1):
+            ws.cell(row=10, column=col, value=value)
+        for col, value in enumerate(["Cash", "CASH", 1.5, 0, None], start=1):
+            ws.cell(row=11, column=col, value=value)
+        sector_ws = wb.create_sheet("AttributionbySector")
+        sector_ws.cell(row=7, column=2, value="Total Effect")
+        for row_num, (category, effect) in enumerate(
+            [("Consumer Discretionary", 0.25), ("Automobiles", 0.25), ("Total", 0.25)], start=8
+        ):
+            sector_ws.cell(row=row_num, column=1, value=category)
+            sector_ws.cell(row=row_num, column=2, value=effect)
+        sector_ws.row_dimensions[9].outlineLevel = 1
+        file_path = tmp_path / "JP_12312025_01282026.xlsx"
+        wb.save(file_path)
+
+        calamine_result = parse_excel_file(file_path)
+        monkeypatch.setattr(excel_parser, "_CALAMINE_AVAILABLE", False)
+        openpyxl_result = parse_excel_file(file_path)
+
+        assert calamine_result == openpyxl_result
+        assert calamine_result.securities[0].ticker == "7203"
+        assert calamine_result.securities[0].gics == "251020"
+        assert [r.category for r in calamine_result.sector_attribution.top_level_rows] == [
+            "Consumer Discretionary"
+        ]
+
+
+class TestReadOutlineLevels:
+    """Tests for reading outline levels from workbook XML."""
+
+    def test_reads_grouped_row_levels_for_named_sheet(self, tmp_path):
+        """Should return outline levels for grouped rows of the requested sheet only."""
+        import openpyxl
+
+        wb = openpyxl.Workbook()
+        wb.active.title = "ContributionMasterRisk"
+        sector_ws = wb.create_sheet("AttributionbySector")
+        for row_num, category in enumerate(["Tech", "Software", "Health Care"], start=8):
+            sector_ws.cell(row=row_num, column=1, value=category)
+        sector_ws.row_dimensions[9].outlineLevel = 1
+        wb["ContributionMasterRisk"].row_dimensions[3].outlineLevel = 2
+        file_path = tmp_path / "TEST_12312025_01282026.xlsx"
+        wb.save(file_path)
+
+        assert _read_outline_levels(file_path, "AttributionbySector") == {9: 1}
+        assert _read_outline_levels(file_path, "AttributionbySector", max_row=8) == {}
+        assert _read_outline_levels(file_path, "Missing") == {}
+
+
 class TestAttributionMarkdownFormatting:
     """Tests for markdown formatting of attribution prompt inputs."""
 
@@ -678,18 +826,12 @@ class TestAttributionMarkdownFormatting:
             top_level_rows=[
                 AttributionRow(
                     category="Information Technology",
-                    metrics={
-                        "Port. Ending Weight": 5.0,
-                        "Contrib. To Return Difference": 1.25,
-                    },
+                    metrics=(5.0, 1.25),
                 ),
             ],
             total_row=AttributionRow(
                 category="Total",
-                metrics={
-                    "Port. Ending Weight": 25.0,
-                    "Contrib. To Return Difference": 2.0,
-                },
+                metrics=(25.0, 2.0),
             ),
         )
 
@@ -732,12 +874,101 @@ class TestParseMultipleFiles:
             results = parse_multiple_files([
                 Path("PORT1_12312025_01282026.xlsx"),
                 Path("PORT2_12312025_01282026.xlsx")
-            ])
+            ], parallel=False)
         
         assert len(results) == 2
         assert results[0].portcode == "PORT1"
         assert results[1].portcode == "PORT2"
 
+    def _write_workbook(self, file_path, ticker, weight=5.0):
+        """Write a minimal ContributionMasterRisk workbook to disk."""
+        import openpyxl
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "ContributionMasterRisk"
+        ws.cell(row=6, column=1, value="12/31/2025 to 1/28/2026")
+        headers = ["Security Name", "Ticker", "Port. Ending Weight", "Contribution To Return", "GICS"]
+        for col, header in enumerate(headers, start=1):
+            ws.cell(row=7, column=col, value=header)
+        for col, value in enumerate([f"{ticker} Inc.", ticker, weight, 0.1, "Tech"], start=1):
+            ws.cell(row=10, column=col, value=value)
+        wb.save(file_path)
+
+    def test_parse_multiple_files_parallel_matches_sequential(self, tmp_path):
+        """Should return the same results in input order when parsing in parallel."""
+        file_paths = []
+        for portcode, ticker in [("PORT1", "AAPL"), ("PORT2", "MSFT")]:
+            file_path = tmp_path / f"{portcode}_12312025_01282026.xlsx"
+            self._write_workbook(file_path, ticker)
+            file_paths.append(file_path)
+
+        excel_parser._parse_cache.clear()
+        parallel_results = parse_multiple_files(file_paths, parallel=True)
+        excel_parser._parse_cache.clear()
+        sequential_results = parse_multiple_files(file_paths, parallel=False)
+
+        assert parallel_results == sequential_results
+        assert [r.portcode for r in parallel_results] == ["PORT1", "PORT2"]
+        assert parallel_results[1].securities[0].ticker == "MSFT"
+
+    def test_parse_multiple_files_parallel_propagates_error(self, tmp_path):
+        """Should raise the worker's error when one file fails in parallel mode."""
+        good_path = tmp_path / "PORT1_12312025_01282026.xlsx"
+        self._write_workbook(good_path, "AAPL")
+        bad_path = tmp_path / "PORT2_12312025_01282026.xlsx"
+        bad_path.write_bytes(b"not a workbook")
+        excel_parser._parse_cache.clear()
+
+        with pytest.raises(Exception):
+            parse_multiple_files([good_path, bad_path], parallel=True)
+
+    def test_parse_multiple_files_default_parses_small_files_in_process(self, tmp_path):
+        """The GUI's default call should not start worker processes for small files."""
+        file_paths = []
+        for portcode, ticker in [("PORT1", "AAPL"), ("PORT2", "MSFT"), ("PORT3", "NVDA")]:
+            file_path = tmp_path / f"{portcode}_12312025_01282026.xlsx"
+            self._write_workbook(file_path, ticker)
+            file_paths.append(file_path)
+        excel_parser._parse_cache.clear()
+
+        with patch("src.excel_parser.ProcessPoolExecutor") as mock_pool:
+            results = parse_multiple_files(file_paths)
+
+        mock_pool.assert_not_called()
+        assert [r.portcode for r in results] == ["PORT1", "PORT2", "PORT3"]
+
+    def test_should_parse_in_parallel_uses_size_threshold(self):
+        """Only several files totalling at least the threshold go to the pool."""
+        threshold = excel_parser._PARALLEL_PARSE_MIN_BYTES
+        half = ("f", 0, threshold // 2)
+
+        assert excel_parser._should_parse_in_parallel([half, half]) is True
+        assert excel_parser._should_parse_in_parallel([half, None]) is False
+        assert excel_parser._should_parse_in_parallel([("f", 0, threshold)]) is False
+
+    def test_parse_multiple_files_reuses_unchanged_files(self, tmp_path):
+        """Should skip re-parsing files whose mtime and size are unchanged."""
+        import os
+
+        file_path = tmp_path / "PORT1_12312025_01282026.xlsx"
+        self._write_workbook(file_path, "AAPL")
+        excel_parser._parse_cache.clear()
+
+        with patch("src.excel_parser.parse_excel_file", wraps=parse_excel_file) as mock_parse:
+            first = parse_multiple_files([file_path], parallel=False)
+            second = parse_multiple_files([file_path], parallel=False)
+            assert mock_parse.call_count == 1
+            assert second[0] is first[0]
+
+            self._write_workbook(file_path, "AAPL", weight=7.5)
+            stat = file_path.stat()
+            os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            third = parse_multiple_files([file_path], parallel=False)
+
+        assert mock_parse.call_count == 2
+        assert third[0].securities[0].port_ending_weight == 7.5
+
     def test_parse_multiple_files_empty_list(self):
         """Should return empty list for empty input."""
         results = parse_multiple_files([])
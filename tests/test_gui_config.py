@@ -35,9 +35,11 @@ def make_app_stub(config_dir: Path) -> CommentaryGeneratorApp:
     app.thinking_level = "medium"
     app.model_id = DEFAULT_MODEL
     app.text_verbosity = "low"
+    app.commentary_batch_size = 1
     app.sources_var = DummyVar("reuters.com, bloomberg.com")
     app.require_citations = True
     app.prioritize_sources = True
+    app.use_response_cache = True
     app.output_folder = None
 
     app.run_attribution_overview = False
@@ -49,10 +51,18 @@ def make_app_stub(config_dir: Path) -> CommentaryGeneratorApp:
 
     app.output_var = DummyVar("")
     app.run_attribution_var = DummyVar(False)
+    app.require_citations_var = DummyVar(True)
+    app.prioritize_sources_var = DummyVar(True)
+    app.use_response_cache_var = DummyVar(True)
+    app.global_sources_error_var = DummyVar("")
+
+    app._last_saved_config = None
+    app._sources_validate_after_id = None
+    app.root = FakeRoot()
 
     app._migrate_api_key_from_config = lambda _value: None
-    app._get_config_path = lambda: config_dir
-    app._get_config_file = lambda: config_dir / "config.json"
+    app.config_path = config_dir
+    app.config_file = config_dir / "config.json"
     return app
 
 
@@ -60,14 +70,18 @@ def make_validation_app_stub(tmp_path: Path, sources: str) -> CommentaryGenerato
     """Create a minimal app stub for validate_inputs tests."""
     app = CommentaryGeneratorApp.__new__(CommentaryGeneratorApp)
     app.api_key = "test-key"
+    app._api_key_future = None
     app.input_files = [Path("input.xlsx")]
     app.output_folder = tmp_path
     app.sources_var = DummyVar(sources)
     app.require_citations = True
     app.prioritize_sources = True
+    app.use_response_cache = True
     app.require_citations_var = DummyVar(True)
     app.prioritize_sources_var = DummyVar(True)
+    app.use_response_cache_var = DummyVar(True)
     app.global_sources_error_var = DummyVar("")
+    app._sources_validate_after_id = None
     return app
 
 
@@ -93,6 +107,41 @@ def test_save_config_includes_attribution_keys(tmp_path):
     assert payload["attribution_model"] == DEFAULT_MODEL
 
 
+def test_save_config_skips_rewrite_when_unchanged(tmp_path):
+    app = make_app_stub(tmp_path)
+    config_path = tmp_path / "config.json"
+
+    app.save_config()
+    first_payload = config_path.read_text()
+    config_path.write_text("sentinel")
+
+    app.save_config()
+    assert config_path.read_text() == "sentinel"
+
+    app.thinking_level = "high"
+    app.save_config()
+    assert json.loads(config_path.read_text())["thinking_level"] == "high"
+    assert config_path.read_text() != first_payload
+    assert list(tmp_path.iterdir()) == [config_path]
+
+
+def test_commentary_batch_size_round_trips_and_rejects_out_of_range(tmp_path):
+    app = make_app_stub(tmp_path)
+    app.commentary_batch_size = 4
+    app.save_config()
+    assert json.loads((tmp_path / "config.json").read_text())["commentary_batch_size"] == 4
+
+    reloaded = make_app_stub(tmp_path)
+    reloaded.load_config()
+    assert reloaded.commentary_batch_size == 4
+
+    for invalid in (0, gui_module.MAX_COMMENTARY_BATCH_SIZE + 1, "3", True):
+        (tmp_path / "config.json").write_text(json.dumps({"commentary_batch_size": invalid}))
+        rejected = make_app_stub(tmp_path)
+        rejected.load_config()
+        assert rejected.commentary_batch_size == 1
+
+
 def test_load_config_reads_attribution_keys_and_updates_checkbox_var(tmp_path):
     output_folder = tmp_path / "out"
     output_folder.mkdir()
@@ -106,6 +155,7 @@ def test_load_config_reads_attribution_keys_and_updates_checkbox_var(tmp_path):
         "preferred_sources": ["reuters.com", "ft.com"],
         "require_citations": False,
         "prioritize_sources": False,
+        "use_response_cache": False,
         "run_attribution_overview": True,
         "attribution_prompt_template": "loaded attribution prompt",
         "attribution_developer_prompt": "loaded attribution developer",
@@ -123,6 +173,8 @@ def test_load_config_reads_attribution_keys_and_updates_checkbox_var(tmp_path):
     assert app.developer_prompt_content == "loaded developer"
     assert app.require_citations is False
     assert app.prioritize_sources is False
+    assert app.use_response_cache is False
+    assert app.use_response_cache_var.get() is False
     assert app.sources_var.get() == "reuters.com, ft.com"
 
     assert app.run_attribution_overview is True
@@ -161,3 +213,124 @@ def test_validate_inputs_normalizes_preferred_sources(tmp_path, monkeypatch):
     assert app.sources_var.get() == "reuters.com, bloomberg.com"
     assert app.global_sources_error_var.get() == ""
     assert error_calls == []
+
+
+def test_validate_inputs_checks_file_selection_before_sources(tmp_path, monkeypatch):
+    app = make_validation_app_stub(tmp_path, "invalid_domain")
+    app.input_files = []
+    error_calls: list[tuple[str, str]] = []
+    monkeypatch.setattr(
+        gui_module.messagebox,
+        "showerror",
+        lambda title, message, **kwargs: error_calls.append((title, message)),
+    )
+
+    assert app.validate_inputs() is False
+    assert error_calls == [("Error", "Please select at least one input file.")]
+    assert app.global_sources_error_var.get() == ""
+
+
+def test_validate_and_clean_domains_strips_prefixes_and_reports_errors():
+    valid, errors = gui_module.validate_and_clean_domains(
+        " HTTPS://www.Reuters.com/ , http://ft.com//, localhost, bad_domain.com, -x.com, https://, ,"
+    )
+
+    assert valid == ["reuters.com", "ft.com"]
+    assert errors == [
+        "'localhost' is not a valid domain (missing top-level domain)",
+        "'bad_domain.com' contains invalid characters",
+        "'-x.com' has invalid format (starts/ends with invalid character)",
+        "'https://' results in empty domain after cleanup",
+    ]
+
+
+class FakeRoot:
+    """Records after/after_cancel scheduling without a Tk interpreter."""
+
+    def __init__(self):
+        self.scheduled: dict[str, object] = {}
+        self._next_id = 0
+
+    def after(self, _delay_ms, callback):
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.scheduled[after_id] = callback
+        return after_id
+
+    def after_idle(self, callback):
+        return self.after(0, callback)
+
+    def after_cancel(self, after_id):
+        self.scheduled.pop(after_id, None)
+
+
+def test_source_validation_is_debounced_until_typing_pauses(tmp_path):
+    app = make_validation_app_stub(tmp_path, "reuters.com, bad_domain")
+    app.root = FakeRoot()
+    app._sources_validate_after_id = None
+
+    app._on_global_sources_change()
+    app._on_global_sources_change()
+
+    assert app.global_sources_error_var.get() == ""
+    assert list(app.root.scheduled) == ["after#2"]
+
+    app.root.scheduled.pop("after#2")()
+
+    assert app._sources_validate_after_id is None
+    assert app.global_sources_error_var.get().startswith("Errors:")
+
+
+class FakeTextWidget:
+    """Minimal tk.Text stand-in tracking the modified flag and fetches."""
+
+    def __init__(self, content: str, modified: bool):
+        self.content = content
+        self.modified = modified
+        self.get_calls = 0
+
+    def edit_modified(self):
+        return self.modified
+
+    def get(self, _start, _end):
+        self.get_calls += 1
+        return self.content
+
+
+def test_read_edited_text_skips_fetch_for_unmodified_widget():
+    untouched = FakeTextWidget("ignored", modified=False)
+    edited = FakeTextWidget("  edited prompt\n", modified=True)
+
+    assert gui_module._read_edited_text(untouched, " original \n") == "original"
+    assert untouched.get_calls == 0
+    assert gui_module._read_edited_text(edited, "original") == "edited prompt"
+    assert edited.get_calls == 1
+
+
+def test_load_api_key_reads_keychain_off_thread_and_defers_migration(monkeypatch):
+    app = CommentaryGeneratorApp.__new__(CommentaryGeneratorApp)
+    app.root = FakeRoot()
+    app.api_key = ""
+    app.api_key_source = "none"
+    app._api_key_future = None
+    app._pending_config_api_key = ""
+    app.keyring_available = True
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.setattr(gui_module.keystore, "get_api_key", lambda: "")
+    stored: list[str] = []
+    monkeypatch.setattr(gui_module.keystore, "set_api_key", lambda key: stored.append(key) or True)
+
+    app.load_api_key()
+    assert app.api_key_source == "loading"
+
+    # load_config runs before the lookup is applied; migration must wait
+    app._migrate_api_key_from_config("legacy-key")
+    assert stored == []
+
+    app._api_key_future.result(timeout=5)
+    app.root.scheduled.pop("after#1")()
+
+    assert app._api_key_future is None
+    assert app.api_key == "legacy-key"
+    assert app.api_key_source == "keyring"
+    assert stored == ["legacy-key"]
@@ -3,7 +3,8 @@ Regression tests for GUI progress unification and completion dialog behavior.
 """
 
 import asyncio
-import queue
+import threading
+from collections import deque
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import patch
@@ -15,6 +16,7 @@ pytest.importorskip("tkinter")
 import src.gui as gui_module
 from src.excel_parser import AttributionRow, AttributionTable
 from src.openai_client import AttributionOverviewResult, Citation, CommentaryResult
+from src.response_cache import ResponseCache
 
 CommentaryGeneratorApp = gui_module.CommentaryGeneratorApp
 DEFAULT_ATTRIBUTION_PROMPT_TEMPLATE = gui_module.DEFAULT_ATTRIBUTION_PROMPT_TEMPLATE
@@ -48,35 +50,47 @@ class DummyRootNoopAfter:
 
     def __init__(self):
         self.after_calls: list[tuple[int, object]] = []
+        self.commands: dict[str, object] = {}
+        self.tk = self
 
     def after(self, delay_ms, callback):
         self.after_calls.append((delay_ms, callback))
 
+    def register(self, callback):
+        name = f"cmd{len(self.commands)}"
+        self.commands[name] = callback
+        return name
 
-def test_make_overall_progress_callback_maps_phase_progress_to_run_total():
-    events: list[tuple[str, int, int]] = []
-    callback = _make_overall_progress_callback(
-        update_progress_fn=lambda item, completed, total: events.append((item, completed, total)),
-        offset=2,
-        overall_total=5,
-    )
-
-    callback("ATTRIBUTION", 1, 3)
-    callback("ATTRIBUTION", 3, 3)
-
-    assert events == [
-        ("ATTRIBUTION", 3, 5),
-        ("ATTRIBUTION", 5, 5),
-    ]
-
+    def call(self, *args):
+        """Record raw `after <ms> <command>` calls like after()."""
+        _after, delay_ms, name = args
+        self.after_calls.append((delay_ms, self.commands[name]))
+        return f"after#{len(self.after_calls)}"
 
-def test_async_generate_includes_attribution_in_progress_and_totals(tmp_path, monkeypatch):
-    progress_events: list[tuple[str, int, int]] = []
 
+def _make_drain_app(generation_done=None):
+    """App stub with just the worker -> Tk handoff state the drain uses."""
+    app = CommentaryGeneratorApp.__new__(CommentaryGeneratorApp)
+    app.root = DummyRootNoopAfter()
+    app.progress_var = DummyVar(0)
+    app.status_var = DummyVar("Ready")
+    app._latest_progress = None
+    app._last_shown_progress = None
+    app._ui_updates_lock = threading.Lock()
+    app._ui_callbacks = deque()
+    app._drain_after_id = None
+    app._drain_tick_command = None
+    if generation_done is not None:
+        app._generation_future = SimpleNamespace(done=lambda: generation_done)
+    return app
+
+
+def _make_generate_app(tmp_path, progress_events):
+    """App stub with the run settings _async_generate reads; progress is recorded."""
     app = CommentaryGeneratorApp.__new__(CommentaryGeneratorApp)
     app.root = DummyRoot()
     app.input_files = [Path("input.xlsx")]
-    app.run_attribution_overview = True
+    app.run_attribution_overview = False
     app.mode_var = DummyVar("top_bottom")
     app.count_var = DummyVar("5")
     app.sources_var = DummyVar("reuters.com")
@@ -84,9 +98,11 @@ def test_async_generate_includes_attribution_in_progress_and_totals(tmp_path, mo
     app.developer_prompt_content = "dev prompt"
     app.thinking_level = "low"
     app.text_verbosity = "low"
+    app.commentary_batch_size = 1
     app.model_id = DEFAULT_MODEL
     app.api_key = "test-key"
     app.prioritize_sources = True
+    app.use_response_cache = True
     app.require_citations = True
     app._cancel_event = None
     app.attribution_prompt_text_content = DEFAULT_ATTRIBUTION_PROMPT_TEMPLATE
@@ -95,17 +111,86 @@ def test_async_generate_includes_attribution_in_progress_and_totals(tmp_path, mo
     app.attribution_text_verbosity = "low"
     app.attribution_model_id = DEFAULT_MODEL
     app.output_folder = tmp_path
+    app.response_cache = ResponseCache(tmp_path / "cache.sqlite3")
     app.status_var = DummyVar("Ready")
     app.progress_var = DummyVar(0)
     app.update_progress = lambda item, completed, total: progress_events.append((item, completed, total))
     app._enqueue_ui_callback = lambda callback: callback()
+    return app
+
+
+def test_make_overall_progress_callback_counts_interleaved_batches_into_run_total():
+    events: list[tuple[str, int, int]] = []
+    callback = _make_overall_progress_callback(
+        update_progress_fn=lambda item, completed, total: events.append((item, completed, total)),
+        overall_total=3,
+    )
+
+    callback("AAPL", 1, 2)
+    callback("ATTRIBUTION", 1, 1)
+    callback("MSFT", 2, 2)
 
+    assert events == [
+        ("AAPL", 1, 3),
+        ("ATTRIBUTION", 2, 3),
+        ("MSFT", 3, 3),
+    ]
+
+
+def test_make_overall_progress_callback_clamps_and_ignores_empty_runs():
+    events: list[tuple[str, int, int]] = []
+    record = lambda item, completed, total: events.append((item, completed, total))
+
+    _make_overall_progress_callback(update_progress_fn=record, overall_total=0)("AAPL", 1, 1)
+    clamped = _make_overall_progress_callback(update_progress_fn=record, overall_total=1)
+    clamped("AAPL", 1, 1)
+    clamped("AAPL", 2, 1)
+
+    assert events == [("AAPL", 1, 1), ("AAPL", 1, 1)]
+
+
+def test_build_attribution_requests_formats_tables_once_per_portfolio():
     sector_table = AttributionTable(
         sheet_name="AttributionbySector",
         category_header="Sector",
         metric_headers=["Portfolio Return"],
-        top_level_rows=[AttributionRow(category="Health Care", metrics={"Portfolio Return": 1.2})],
-        total_row=AttributionRow(category="Total", metrics={"Portfolio Return": 1.2}),
+        top_level_rows=[AttributionRow(category="Energy", metrics=(0.5,))],
+        total_row=AttributionRow(category="Total", metrics=(0.5,)),
+    )
+    portfolio = SimpleNamespace(
+        portcode="PORT1",
+        period="12/31/2025 to 1/28/2026",
+        sector_attribution=sector_table,
+        country_attribution=None,
+    )
+    prompt_calls: list[dict] = []
+
+    def build_prompt(**kwargs):
+        prompt_calls.append(kwargs)
+        return f"prompt for {kwargs['portcode']}"
+
+    requests = gui_module._build_attribution_requests(
+        [portfolio], SimpleNamespace(build_prompt=build_prompt)
+    )
+
+    assert requests == [{"portcode": "PORT1", "prompt": "prompt for PORT1"}]
+    assert len(prompt_calls) == 1
+    assert "Energy" in prompt_calls[0]["sector_attrib"]
+    assert prompt_calls[0]["country_attrib"] == "No country attribution data available."
+
+
+def test_async_generate_includes_attribution_in_progress_and_totals(tmp_path, monkeypatch):
+    progress_events: list[tuple[str, int, int]] = []
+
+    app = _make_generate_app(tmp_path, progress_events)
+    app.run_attribution_overview = True
+
+    sector_table = AttributionTable(
+        sheet_name="AttributionbySector",
+        category_header="Sector",
+        metric_headers=["Portfolio Return"],
+        top_level_rows=[AttributionRow(category="Health Care", metrics=(1.2,))],
+        total_row=AttributionRow(category="Total", metrics=(1.2,)),
     )
 
     portfolios = [
@@ -181,7 +266,7 @@ def test_async_generate_includes_attribution_in_progress_and_totals(tmp_path, mo
     monkeypatch.setattr(gui_module, "create_output_workbook", lambda *args, **kwargs: tmp_path / "output.xlsx")
     monkeypatch.setattr(gui_module, "create_log_file", lambda *args, **kwargs: tmp_path / "run_log.txt")
 
-    result = asyncio.run(app._async_generate())
+    result = asyncio.run(app._async_generate(app._snapshot_run_settings()))
 
     assert result["total_commentary_requests"] == 2
     assert result["total_attribution_requests"] == 1
@@ -194,16 +279,189 @@ def test_async_generate_includes_attribution_in_progress_and_totals(tmp_path, mo
     assert total_values == [3, 3, 3]
 
 
+def test_async_generate_serves_repeated_requests_from_response_cache(tmp_path, monkeypatch):
+    progress_events: list[tuple[str, int, int]] = []
+    submitted: list[list[str]] = []
+
+    app = _make_generate_app(tmp_path, progress_events)
+
+    period = "12/31/2025 to 1/28/2026"
+    portfolios = [SimpleNamespace(portcode="PORT1", period=period, attribution_warnings=[])]
+    securities = [
+        SimpleNamespace(ticker="AAPL", security_name="Apple Inc."),
+        SimpleNamespace(ticker="MSFT", security_name="Microsoft Corp."),
+    ]
+    selections = [SimpleNamespace(portcode="PORT1", period=period, ranked_securities=securities)]
+    organized = []
+
+    class FakeOpenAIClient:
+        def __init__(self, *args, progress_callback=None, **kwargs):
+            self.progress_callback = progress_callback
+
+        async def generate_commentary_batch(self, requests, **kwargs):
+            submitted.append([req["ticker"] for req in requests])
+            for idx, req in enumerate(requests, 1):
+                self.progress_callback(req["ticker"], idx, len(requests))
+            return [
+                CommentaryResult(
+                    ticker=req["ticker"],
+                    security_name=req["security_name"],
+                    commentary=f"Commentary for {req['ticker']}",
+                    citations=[Citation(url="https://example.com/source")],
+                    success=True,
+                )
+                for req in requests
+            ]
+
+    def fake_create_output_workbook(portfolios_arg, commentary_results, *args, **kwargs):
+        organized.append(commentary_results)
+        return tmp_path / "output.xlsx"
+
+    monkeypatch.setattr(gui_module, "parse_multiple_files", lambda _files: portfolios)
+    monkeypatch.setattr(gui_module, "process_portfolios", lambda _portfolios, _mode, _n: selections)
+    monkeypatch.setattr(gui_module, "OpenAIClient", FakeOpenAIClient)
+    monkeypatch.setattr(gui_module, "create_output_workbook", fake_create_output_workbook)
+    monkeypatch.setattr(gui_module, "create_log_file", lambda *args, **kwargs: tmp_path / "run_log.txt")
+
+    asyncio.run(app._async_generate(app._snapshot_run_settings()))
+    # Changing one security's inputs only misses for that security
+    securities[1].security_name = "Microsoft Corporation"
+    progress_events.clear()
+    asyncio.run(app._async_generate(app._snapshot_run_settings()))
+
+    assert submitted == [["AAPL", "MSFT"], ["MSFT"]]
+    assert [event[1:] for event in progress_events] == [(1, 2), (2, 2)]
+    assert organized[1]["PORT1"]["AAPL"].commentary == "Commentary for AAPL"
+    assert organized[1]["PORT1"]["MSFT"].commentary == "Commentary for MSFT"
+
+
+def test_async_generate_bypasses_response_cache_when_disabled(tmp_path, monkeypatch):
+    app = _make_generate_app(tmp_path, [])
+    app.use_response_cache = False
+    app.response_cache = SimpleNamespace(
+        get_many=lambda _keys: pytest.fail("cache read while disabled"),
+        set_many=lambda _entries: pytest.fail("cache written while disabled"),
+    )
+    period = "12/31/2025 to 1/28/2026"
+    portfolios = [SimpleNamespace(portcode="PORT1", period=period, attribution_warnings=[])]
+    selections = [
+        SimpleNamespace(
+            portcode="PORT1",
+            period=period,
+            ranked_securities=[SimpleNamespace(ticker="AAPL", security_name="Apple Inc.")],
+        )
+    ]
+    submitted: list[list[str]] = []
+
+    class FakeOpenAIClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def generate_commentary_batch(self, requests, **kwargs):
+            submitted.append([req["ticker"] for req in requests])
+            return [
+                CommentaryResult(
+                    ticker=req["ticker"],
+                    security_name=req["security_name"],
+                    commentary="fresh",
+                    citations=[Citation(url="https://example.com/source")],
+                )
+                for req in requests
+            ]
+
+    monkeypatch.setattr(gui_module, "parse_multiple_files", lambda _files: portfolios)
+    monkeypatch.setattr(gui_module, "process_portfolios", lambda _portfolios, _mode, _n: selections)
+    monkeypatch.setattr(gui_module, "OpenAIClient", FakeOpenAIClient)
+    monkeypatch.setattr(gui_module, "create_output_workbook", lambda *args, **kwargs: tmp_path / "output.xlsx")
+    monkeypatch.setattr(gui_module, "create_log_file", lambda *args, **kwargs: tmp_path / "run_log.txt")
+
+    asyncio.run(app._async_generate(app._snapshot_run_settings()))
+
+    assert submitted == [["AAPL"]]
+
+
+def test_snapshot_run_settings_is_unaffected_by_later_edits(tmp_path):
+    app = _make_generate_app(tmp_path, [])
+
+    settings = app._snapshot_run_settings()
+    app.input_files.append(Path("added.xlsx"))
+    app.sources_var.set("ft.com")
+    app.model_id = "other-model"
+
+    assert settings.input_files == (Path("input.xlsx"),)
+    assert settings.preferred_sources == ("reuters.com",)
+    assert settings.model_id == DEFAULT_MODEL
+    assert settings.selection_mode is gui_module.SelectionMode.TOP_BOTTOM
+    assert settings.count == 5
+
+
+def test_async_generate_cancels_sibling_batch_when_one_fails(tmp_path, monkeypatch):
+    app = _make_generate_app(tmp_path, [])
+    app.run_attribution_overview = True
+    period = "12/31/2025 to 1/28/2026"
+    sector_table = AttributionTable(
+        sheet_name="AttributionbySector",
+        category_header="Sector",
+        metric_headers=["Portfolio Return"],
+        top_level_rows=[AttributionRow(category="Energy", metrics=(0.5,))],
+        total_row=AttributionRow(category="Total", metrics=(0.5,)),
+    )
+    portfolios = [
+        SimpleNamespace(
+            portcode="PORT1",
+            period=period,
+            attribution_warnings=[],
+            sector_attribution=sector_table,
+            country_attribution=None,
+        )
+    ]
+    selections = [
+        SimpleNamespace(
+            portcode="PORT1",
+            period=period,
+            ranked_securities=[SimpleNamespace(ticker="AAPL", security_name="Apple Inc.")],
+        )
+    ]
+    events: list[str] = []
+
+    class FakeOpenAIClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def generate_commentary_batch(self, requests, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                events.append("commentary cancelled")
+                raise
+
+        async def generate_attribution_overview_batch(self, requests, **kwargs):
+            raise RuntimeError("attribution failed")
+
+    class FakeHttpClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc_info):
+            events.append("http client closed")
+            return False
+
+    monkeypatch.setattr(gui_module, "parse_multiple_files", lambda _files: portfolios)
+    monkeypatch.setattr(gui_module, "process_portfolios", lambda _portfolios, _mode, _n: selections)
+    monkeypatch.setattr(gui_module, "OpenAIClient", FakeOpenAIClient)
+    monkeypatch.setattr("httpx.AsyncClient", FakeHttpClient)
+
+    with pytest.raises(RuntimeError, match="attribution failed"):
+        asyncio.run(app._async_generate(app._snapshot_run_settings()))
+
+    assert events == ["commentary cancelled", "http client closed"]
+
+
 def test_schedule_progress_queue_drain_runs_queued_ui_callbacks():
-    app = CommentaryGeneratorApp.__new__(CommentaryGeneratorApp)
-    app.root = DummyRootNoopAfter()
-    app.progress_var = DummyVar(0)
-    app.status_var = DummyVar("Ready")
-    app._progress_queue = queue.SimpleQueue()
-    app._ui_callback_queue = queue.SimpleQueue()
+    app = _make_drain_app(generation_done=False)
 
-    app._progress_queue.put(("AAPL", 1, 2))
-    app._ui_callback_queue.put(lambda: app.status_var.set("Complete!"))
+    app.update_progress("AAPL", 1, 2)
+    app._ui_callbacks.append(lambda: app.status_var.set("Complete!"))
 
     app._schedule_progress_queue_drain()
 
@@ -212,6 +470,105 @@ def test_schedule_progress_queue_drain_runs_queued_ui_callbacks():
     assert len(app.root.after_calls) == 1
 
 
+def test_update_progress_keeps_only_latest_event_for_next_drain():
+    app = _make_drain_app(generation_done=False)
+
+    app.update_progress("AAPL", 1, 4)
+    app.update_progress("MSFT", 3, 4)
+    app._schedule_progress_queue_drain()
+
+    assert app.progress_var.get() == 75.0
+    assert app.status_var.get() == "Processing: MSFT (3/4)"
+    assert app._latest_progress is None
+
+
+def test_schedule_progress_queue_drain_stops_after_generation_finishes():
+    app = _make_drain_app(generation_done=True)
+
+    app._ui_callbacks.append(lambda: app.status_var.set("Complete!"))
+
+    app._schedule_progress_queue_drain()
+
+    assert app.status_var.get() == "Complete!"
+    assert app.root.after_calls == []
+    assert app._drain_after_id is None
+
+
+def test_worker_updates_make_no_tk_calls():
+    app = _make_drain_app()
+    # Any Tk call from the worker side would fail on a bare object
+    app.root = object()
+
+    app.update_progress("AAPL", 1, 2)
+    app._enqueue_ui_callback(lambda: app.status_var.set("Complete!"))
+
+    app._drain_ui_updates()
+    assert app.progress_var.get() == 50.0
+    assert app.status_var.get() == "Complete!"
+
+
+def test_drain_ui_updates_runs_callbacks_in_bounded_batches():
+    app = _make_drain_app()
+
+    ran: list[int] = []
+    for index in range(20):
+        app._ui_callbacks.append(lambda index=index: ran.append(index))
+
+    assert app._drain_ui_updates() is True
+    assert ran == list(range(gui_module._MAX_UI_CALLBACKS_PER_DRAIN))
+
+    assert app._drain_ui_updates() is False
+    assert ran == list(range(20))
+
+
+def test_drain_ui_updates_skips_rewriting_unchanged_progress():
+    app = _make_drain_app()
+    writes: list[object] = []
+    app.progress_var = SimpleNamespace(set=writes.append)
+    app.status_var = SimpleNamespace(set=writes.append)
+
+    app.update_progress("AAPL", 1, 2)
+    app._drain_ui_updates()
+    app.update_progress("AAPL", 1, 2)
+    app._drain_ui_updates()
+
+    assert writes == [50.0, "Processing: AAPL (1/2)"]
+
+
+def test_schedule_progress_queue_drain_polls_while_running():
+    app = _make_drain_app(generation_done=False)
+
+    app._schedule_progress_queue_drain()
+
+    assert [delay for delay, _callback in app.root.after_calls] == [gui_module._DRAIN_INTERVAL_MS]
+
+
+def test_drain_ticks_reuse_one_registered_command():
+    app = _make_drain_app(generation_done=False)
+
+    app._schedule_progress_queue_drain()
+    _delay, next_tick = app.root.after_calls.pop()
+    next_tick()
+
+    assert len(app.root.commands) == 1
+    assert len(app.root.after_calls) == 1
+
+
+def test_schedule_progress_queue_drain_finishes_backlog_after_generation_ends():
+    app = _make_drain_app(generation_done=True)
+    ran: list[int] = []
+    for index in range(20):
+        app._ui_callbacks.append(lambda index=index: ran.append(index))
+
+    app._schedule_progress_queue_drain()
+    assert len(app.root.after_calls) == 1
+
+    _delay, next_tick = app.root.after_calls.pop()
+    next_tick()
+    assert ran == list(range(20))
+    assert app.root.after_calls == []
+
+
 def test_on_generation_complete_shows_success_popup_with_parent_even_with_errors():
     app = CommentaryGeneratorApp.__new__(CommentaryGeneratorApp)
     app.save_config = lambda: None
@@ -245,3 +602,38 @@ def test_on_generation_complete_shows_success_popup_with_parent_even_with_errors
     assert "Errors: 3" in message_text
     assert app.status_var.get() == "Ready"
     assert app.progress_var.get() == 0
+
+
+def test_run_generation_reuses_background_loop_and_queues_completion():
+    app = _make_drain_app()
+    app._generation_loop = None
+    app._cancel_event = None
+    app._cancel_requested = False
+    app.is_running = True
+
+    results = iter([{"run": 1}, {"run": 2}])
+
+    async def fake_async_generate(_settings):
+        return next(results)
+
+    app._async_generate = fake_async_generate
+    completed: list[dict] = []
+    app._on_generation_complete = completed.append
+    app.run_btn = SimpleNamespace(configure=lambda **_kwargs: None)
+
+    try:
+        loop = app._ensure_generation_loop()
+        for _ in range(2):
+            future = asyncio.run_coroutine_threadsafe(app._run_generation(None), loop)
+            future.result(timeout=5)
+            assert app._ensure_generation_loop() is loop
+            assert app.is_running is False
+            assert app._cancel_event is None
+
+        while app._ui_callbacks:
+            app._ui_callbacks.popleft()()
+    finally:
+        app._stop_generation_loop()
+
+    assert completed == [{"run": 1}, {"run": 2}]
+    assert app._generation_loop is None
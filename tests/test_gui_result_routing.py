@@ -86,3 +86,14 @@ def test_all_returned_requests_have_portfolio_entries_without_collisions():
     assert set(commentary_results["XYZ"].keys()) == {"AAPL", "NVDA"}
     assert set(commentary_results["ONE"].keys()) == {"AAPL"}
     assert commentary_results["ONE"]["AAPL"].commentary == "ONE AAPL"
+
+
+def test_result_count_mismatch_raises_instead_of_misrouting():
+    requests = [
+        {"portcode": "XYZ", "ticker": "AAPL", "prompt": "p1", "security_name": "Apple"},
+        {"portcode": "XYZ", "ticker": "NVDA", "prompt": "p2", "security_name": "NVIDIA"},
+    ]
+    results = [make_result("AAPL", "XYZ AAPL")]
+
+    with pytest.raises(ValueError):
+        _organize_commentary_results_by_request(requests, results)
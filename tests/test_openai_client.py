@@ -302,6 +302,213 @@ def test_generate_commentary_batch_ignores_progress_callback_errors(monkeypatch)
     assert all(result.success for result in results)
 
 
+def test_batches_reuse_shared_http_client_without_closing_it(monkeypatch):
+    closed: list[bool] = []
+
+    class TrackingAsyncClient(DummyAsyncClient):
+        async def __aexit__(self, exc_type, exc, tb):
+            closed.append(True)
+            return False
+
+    shared = TrackingAsyncClient()
+    client = OpenAIClient(api_key="test-key", http_client=shared)
+    seen_clients: list[object] = []
+
+    async def _fake_generate_commentary(**kwargs):
+        seen_clients.append(kwargs["client"])
+        return CommentaryResult(
+            ticker=kwargs["ticker"],
+            security_name=kwargs["security_name"],
+            commentary="ok",
+            citations=[],
+            success=True,
+        )
+
+    async def _fake_generate_attribution_overview(**kwargs):
+        seen_clients.append(kwargs["client"])
+        return AttributionOverviewResult(
+            portcode=kwargs["portcode"],
+            output="ok",
+            citations=[],
+            success=True,
+        )
+
+    monkeypatch.setattr(client, "generate_commentary", _fake_generate_commentary)
+    monkeypatch.setattr(client, "generate_attribution_overview", _fake_generate_attribution_overview)
+    monkeypatch.setattr(
+        "httpx.AsyncClient",
+        lambda *args, **kwargs: pytest.fail("batch opened its own HTTP client"),
+    )
+
+    async def _run():
+        await client.generate_commentary_batch(
+            [{"ticker": "AAA", "security_name": "A Co", "prompt": "p", "portcode": "P1"}],
+            use_web_search=False,
+            require_citations=False,
+        )
+        await client.generate_attribution_overview_batch(
+            [{"portcode": "P1", "prompt": "p"}],
+            use_web_search=False,
+            require_citations=False,
+        )
+
+    asyncio.run(_run())
+    assert seen_clients == [shared, shared]
+    assert closed == []
+
+
+def test_clients_sharing_a_request_limiter_stay_within_its_bound(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def _fake_generate_commentary(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return CommentaryResult(
+            ticker=kwargs["ticker"],
+            security_name=kwargs["security_name"],
+            commentary="ok",
+            citations=[],
+            success=True,
+        )
+
+    requests = [
+        {"ticker": f"T{index}", "security_name": "Co", "prompt": "p", "portcode": "P1"}
+        for index in range(6)
+    ]
+
+    async def _run():
+        limiter = asyncio.Semaphore(2)
+        async with DummyAsyncClient() as http_client:
+            clients = [
+                OpenAIClient(api_key="test-key", http_client=http_client, request_limiter=limiter)
+                for _ in range(2)
+            ]
+            for client in clients:
+                monkeypatch.setattr(client, "generate_commentary", _fake_generate_commentary)
+            await asyncio.gather(*(
+                client.generate_commentary_batch(requests, use_web_search=False, require_citations=False)
+                for client in clients
+            ))
+
+    asyncio.run(_run())
+    assert peak == 2
+
+
+def _grouped_response(text: str, cited_urls: list[str]) -> dict:
+    annotations = []
+    for url in cited_urls:
+        start = text.index(url)
+        annotations.append(
+            {"type": "url_citation", "url": url, "start_index": start, "end_index": start + len(url)}
+        )
+    return {
+        "id": "resp_1",
+        "status": "completed",
+        "output": [
+            {
+                "type": "message",
+                "content": [{"type": "output_text", "text": text, "annotations": annotations}],
+            }
+        ],
+    }
+
+
+def test_generate_commentary_batch_groups_requests_into_one_call(monkeypatch):
+    progress: list[tuple[str, int, int]] = []
+    client = OpenAIClient(
+        api_key="test-key",
+        progress_callback=lambda ticker, completed, total: progress.append((ticker, completed, total)),
+    )
+    prompts: list[str] = []
+
+    async def _fake_make_request(_http_client, prompt, **_kwargs):
+        prompts.append(prompt)
+        return _grouped_response(
+            "[1]\nApple rose on earnings ([reuters](https://a.example/aapl)).\n"
+            "[2]\nMicrosoft fell on guidance ([ft](https://b.example/msft)).",
+            ["https://a.example/aapl", "https://b.example/msft"],
+        )
+
+    monkeypatch.setattr(client, "_make_request", _fake_make_request)
+
+    requests = [
+        {"ticker": "AAPL", "security_name": "Apple Inc.", "prompt": "about AAPL", "portcode": "P1"},
+        {"ticker": "MSFT", "security_name": "Microsoft", "prompt": "about MSFT", "portcode": "P1"},
+    ]
+
+    async def _run():
+        async with DummyAsyncClient() as http_client:
+            client.http_client = http_client
+            return await client.generate_commentary_batch(requests, batch_size=5)
+
+    results = asyncio.run(_run())
+
+    assert len(prompts) == 1
+    assert "[1]\nabout AAPL" in prompts[0] and "[2]\nabout MSFT" in prompts[0]
+    assert [result.ticker for result in results] == ["AAPL", "MSFT"]
+    assert all(result.success for result in results)
+    assert results[0].commentary == "Apple rose on earnings [1]."
+    assert [c.url for c in results[0].citations] == ["https://a.example/aapl"]
+    assert [c.url for c in results[1].citations] == ["https://b.example/msft"]
+    assert all(result.request_key for result in results)
+    assert [event[1] for event in progress] == [1, 2]
+
+
+def test_generate_commentary_batch_falls_back_when_grouped_answer_is_unnumbered(monkeypatch):
+    client = OpenAIClient(api_key="test-key")
+
+    async def _fake_make_request(_http_client, prompt, **_kwargs):
+        return _grouped_response("Both stocks moved on earnings.", [])
+
+    single_calls: list[str] = []
+
+    async def _fake_generate_commentary(**kwargs):
+        single_calls.append(kwargs["ticker"])
+        return CommentaryResult(
+            ticker=kwargs["ticker"],
+            security_name=kwargs["security_name"],
+            commentary="ok",
+            citations=[],
+            success=True,
+        )
+
+    monkeypatch.setattr(client, "_make_request", _fake_make_request)
+    monkeypatch.setattr(client, "generate_commentary", _fake_generate_commentary)
+
+    requests = [
+        {"ticker": "AAPL", "security_name": "Apple Inc.", "prompt": "p", "portcode": "P1"},
+        {"ticker": "MSFT", "security_name": "Microsoft", "prompt": "p", "portcode": "P1"},
+        {"ticker": "NESN", "security_name": "Nestle", "prompt": "p", "portcode": "P2"},
+    ]
+
+    async def _run():
+        async with DummyAsyncClient() as http_client:
+            client.http_client = http_client
+            return await client.generate_commentary_batch(
+                requests, require_citations=False, batch_size=5
+            )
+
+    results = asyncio.run(_run())
+
+    assert sorted(single_calls) == ["AAPL", "MSFT", "NESN"]
+    assert [result.ticker for result in results] == ["AAPL", "MSFT", "NESN"]
+
+
+def test_group_commentary_requests_splits_on_portfolio_and_size():
+    requests = [
+        {"ticker": t, "portcode": p}
+        for t, p in [("A", "P1"), ("B", "P1"), ("C", "P1"), ("D", "P2")]
+    ]
+
+    groups = OpenAIClient._group_commentary_requests(requests, 2)
+
+    assert [[req["ticker"] for req in group] for group in groups] == [["A", "B"], ["C"], ["D"]]
+
+
 class DummyAsyncClient:
     def __init__(self, post=None, get=None):
         self._post = post
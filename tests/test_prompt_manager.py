@@ -95,6 +95,18 @@ class TestPromptManager:
         
         assert instructions == ""
 
+    def test_get_source_instructions_tracks_config_changes(self):
+        """Cached instructions should follow later edits to the config."""
+        config = PromptConfig(preferred_sources=["reuters.com"])
+        manager = PromptManager(config=config)
+        assert "reuters.com" in manager.get_source_instructions()
+
+        config.preferred_sources.append("ft.com")
+        assert "reuters.com, ft.com" in manager.get_source_instructions()
+
+        config.prioritize_sources = False
+        assert manager.get_source_instructions() == ""
+
     def test_build_prompt_basic(self):
         """Should build prompt with variable interpolation."""
         manager = PromptManager()
@@ -0,0 +1,89 @@
+"""
+Tests for the Response Cache Module.
+"""
+from src.openai_client import Citation, CommentaryResult
+from src.response_cache import ResponseCache, make_cache_key
+
+
+def _key(**overrides):
+    params = dict(
+        model="gpt-5",
+        thinking_level="medium",
+        text_verbosity="low",
+        developer_prompt="dev",
+        prompt="Explain AAPL",
+        preferred_sources=["reuters.com", "bloomberg.com"],
+        require_citations=True,
+    )
+    params.update(overrides)
+    return make_cache_key(**params)
+
+
+def _result(ticker="AAPL", success=True):
+    return CommentaryResult(
+        ticker=ticker,
+        security_name="Apple Inc.",
+        commentary="Shares rose on earnings.",
+        citations=[Citation(url="https://example.com/a", title="A")],
+        success=success,
+        request_key="per-run-token",
+    )
+
+
+class TestMakeCacheKey:
+    """Tests for cache key construction."""
+
+    def test_source_order_does_not_change_key(self):
+        """Preferred sources are compared as a set."""
+        assert _key() == _key(preferred_sources=["bloomberg.com", "reuters.com"])
+
+    def test_any_setting_change_changes_key(self):
+        """Every input that shapes the response is part of the key."""
+        base = _key()
+        assert _key(model="gpt-5-mini") != base
+        assert _key(thinking_level="high") != base
+        assert _key(developer_prompt="other") != base
+        assert _key(prompt="Explain MSFT") != base
+        assert _key(require_citations=False) != base
+        assert _key(prioritize_sources=True) != base
+
+
+class TestResponseCache:
+    """Tests for the on-disk ResponseCache."""
+
+    def test_round_trip_restores_citations_without_request_key(self, tmp_path):
+        """Cached results come back intact, minus the per-run request key."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        cache.set_many({"k": _result()})
+
+        cached = cache.get_many(["k", "missing"])
+
+        assert list(cached) == ["k"]
+        assert cached["k"].citations == [Citation(url="https://example.com/a", title="A")]
+        assert cached["k"].commentary == "Shares rose on earnings."
+        assert cached["k"].request_key == ""
+
+    def test_failed_results_are_not_cached(self, tmp_path):
+        """Only successful responses are worth replaying."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        cache.set_many({"k": _result(success=False)})
+
+        assert cache.get_many(["k"]) == {}
+
+    def test_expired_entries_are_misses(self, tmp_path):
+        """Entries past their TTL are not returned."""
+        cache = ResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=-1)
+        cache.set_many({"k": _result()})
+
+        assert cache.get_many(["k"]) == {}
+
+    def test_clear_removes_entries(self, tmp_path):
+        """Clearing drops every entry; clearing a missing cache is a no-op."""
+        ResponseCache(tmp_path / "absent.sqlite3").clear()
+        assert not (tmp_path / "absent.sqlite3").exists()
+
+        cache = ResponseCache(tmp_path / "cache.sqlite3")
+        cache.set_many({"k": _result()})
+        cache.clear()
+
+        assert cache.get_many(["k"]) == {}